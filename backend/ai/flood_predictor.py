@@ -3,11 +3,111 @@ Flood Predictor - LSTM model for time-series flood prediction
 Simulated implementation for demo purposes
 """
 
+import random
 import numpy as np
+from bisect import bisect_right
 from typing import Dict, List, Tuple, Optional
-import random
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from numba import cuda
+    CUDA_AVAILABLE = cuda.is_available()
+except Exception:
+    CUDA_AVAILABLE = False
+
+# Batches smaller than this stay on the CPU; transfer overhead dominates
+GPU_THRESHOLD = 4096
+
+# Bound once; uniform/randint go through extra argument handling per call
+_rand = random.random
+_rng = np.random.default_rng()
+
+
+def _score(precipitation, humidity, temperature, noise):
+    """Risk score for a single set of weather features"""
+    risk_score = 0.0
+    
+    # Precipitation factor (0-0.5)
+    if precipitation > 30:
+        risk_score += 0.5
+    elif precipitation > 15:
+        risk_score += 0.3
+    elif precipitation > 5:
+        risk_score += 0.1
+    
+    # Humidity factor (0-0.2)
+    if humidity > 80:
+        risk_score += 0.2
+    elif humidity > 60:
+        risk_score += 0.1
+    
+    # Temperature factor (0-0.1) - freezing conditions
+    if temperature < 5:
+        risk_score += 0.1
+    
+    risk_score += noise
+    return max(0.0, min(1.0, risk_score))
+
+if NUMBA_AVAILABLE:
+    _score_jit = njit(cache=True, fastmath=True)(_score)
+
+    # Serial on purpose: numba's default parallel backend is not safe to
+    # launch from the worker threads requests run on, and hangs interpreter exit
+    @njit(cache=True)
+    def _score_batch_jit(precipitation, humidity, temperature, noise):
+        """Risk scores for (N,) weather feature arrays in one compiled loop"""
+        out = np.empty(precipitation.shape[0])
+        for i in range(precipitation.shape[0]):
+            out[i] = _score_jit(precipitation[i], humidity[i], temperature[i], noise[i])
+        return out
+
+if CUDA_AVAILABLE:
+    @cuda.jit
+    def _flood_kernel(precipitation, humidity, temperature, noise, out):
+        """One thread per location; same ladder as the CPU path"""
+        i = cuda.grid(1)
+        if i < precipitation.size:
+            risk_score = 0.0
+            if precipitation[i] > 30:
+                risk_score += 0.5
+            elif precipitation[i] > 15:
+                risk_score += 0.3
+            elif precipitation[i] > 5:
+                risk_score += 0.1
+            if humidity[i] > 80:
+                risk_score += 0.2
+            elif humidity[i] > 60:
+                risk_score += 0.1
+            if temperature[i] < 5:
+                risk_score += 0.1
+            out[i] = min(1.0, max(0.0, risk_score + noise[i]))
+
+    def _score_batch_gpu(precipitation, humidity, temperature, noise):
+        """Run the flood kernel on the GPU and copy the scores back"""
+        n = precipitation.shape[0]
+        out = cuda.device_array(n, dtype=np.float64)
+        threads = 256
+        blocks = (n + threads - 1) // threads
+        _flood_kernel[blocks, threads](
+            cuda.to_device(precipitation),
+            cuda.to_device(humidity),
+            cuda.to_device(temperature),
+            cuda.to_device(noise),
+            out
+        )
+        return out.copy_to_host()
+
+# Risk level boundaries (inclusive lower bounds) and their labels
+RISK_THRESHOLDS = (0.3, 0.6, 0.8)
+RISK_LEVELS = ("low", "medium", "high", "critical")
+_RISK_LEVELS_ARRAY = np.array(RISK_LEVELS)
+
 class FloodPredictor:
     """
     LSTM-based flood prediction model
@@ -49,36 +149,14 @@ class FloodPredictor:
         humidity = weather_data.get("humidity", 50)
         temperature = weather_data.get("temperature", 25)
         
-        # Risk calculation (simplified)
-        risk_score = 0.0
-        
-        # Precipitation factor (0-0.5)
-        if precipitation > 30:
-            risk_score += 0.5
-        elif precipitation > 15:
-            risk_score += 0.3
-        elif precipitation > 5:
-            risk_score += 0.1
-        
-        # Humidity factor (0-0.2)
-        if humidity > 80:
-            risk_score += 0.2
-        elif humidity > 60:
-            risk_score += 0.1
-        
-        # Temperature factor (0-0.1)
-        if temperature < 5:  # Freezing conditions
-            risk_score += 0.1
-        
-        # Add some randomness for demo
-        risk_score += random.uniform(-0.1, 0.2)
-        risk_score = max(0.0, min(1.0, risk_score))
+        # One location: plain Python beats building arrays for the batch kernel
+        risk_score = _score(precipitation, humidity, temperature, -0.1 + 0.3 * _rand())
         
         # Predict timeline
         if risk_score > 0.6:
-            time_to_flood = random.randint(2, 12)  # hours
+            time_to_flood = 2 + int(11 * _rand())  # hours
         elif risk_score > 0.3:
-            time_to_flood = random.randint(12, 48)  # hours
+            time_to_flood = 12 + int(37 * _rand())  # hours
         else:
             time_to_flood = None
         
@@ -94,27 +172,91 @@ class FloodPredictor:
                 "temperature": temperature
             },
             "predicted_at": datetime.now().isoformat(),
-            "confidence": round(random.uniform(0.7, 0.95), 2)
+            "confidence": round(0.7 + 0.25 * _rand(), 2)
         }
     
+    def _score_batch(self,
+                     precipitation: np.ndarray,
+                     humidity: np.ndarray,
+                     temperature: np.ndarray,
+                     noise: np.ndarray) -> np.ndarray:
+        """Risk score for arrays of weather features (simplified)"""
+        if CUDA_AVAILABLE and precipitation.shape[0] >= GPU_THRESHOLD:
+            return _score_batch_gpu(precipitation, humidity, temperature, noise)
+        if NUMBA_AVAILABLE:
+            return _score_batch_jit(precipitation, humidity, temperature, noise)
+        
+        # Precipitation factor (0-0.5)
+        risk_score = np.select(
+            [precipitation > 30, precipitation > 15, precipitation > 5],
+            [0.5, 0.3, 0.1],
+            0.0
+        )
+        
+        # Humidity factor (0-0.2)
+        risk_score += np.select([humidity > 80, humidity > 60], [0.2, 0.1], 0.0)
+        
+        # Temperature factor (0-0.1) - freezing conditions
+        risk_score += np.where(temperature < 5, 0.1, 0.0)
+        
+        # Add some randomness for demo
+        return np.clip(risk_score + noise, 0.0, 1.0)
+    
     def _get_risk_level(self, risk_score: float) -> str:
         """Convert risk score to level"""
-        if risk_score >= 0.8:
-            return "critical"
-        elif risk_score >= 0.6:
-            return "high"
-        elif risk_score >= 0.3:
-            return "medium"
-        else:
-            return "low"
+        return RISK_LEVELS[bisect_right(RISK_THRESHOLDS, risk_score)]
+    
+    def _get_risk_levels(self, risk_scores: np.ndarray) -> np.ndarray:
+        """Convert an array of risk scores to levels"""
+        return _RISK_LEVELS_ARRAY[np.searchsorted(RISK_THRESHOLDS, risk_scores, side="right")]
     
     def predict_multiple_locations(self, locations: List[Dict], weather_data: Dict) -> List[Dict]:
-        """Predict flood risk for multiple locations"""
-        predictions = []
-        for location in locations:
-            pred = self.predict_flood_risk(location, weather_data)
-            predictions.append(pred)
-        return predictions
+        """Predict flood risk for multiple locations in a single batch"""
+        n = len(locations)
+        if n == 0:
+            return []
+        
+        # Calculate risk factors
+        precipitation = weather_data.get("precipitation", 0)
+        humidity = weather_data.get("humidity", 50)
+        temperature = weather_data.get("temperature", 25)
+        
+        risk_scores = self._score_batch(
+            np.full(n, precipitation, dtype=np.float64),
+            np.full(n, humidity, dtype=np.float64),
+            np.full(n, temperature, dtype=np.float64),
+            _rng.uniform(-0.1, 0.2, n)
+        )
+        risk_levels = self._get_risk_levels(risk_scores)
+        
+        # Predict timeline (hours); -1 marks no expected flood
+        time_to_flood = np.where(
+            risk_scores > 0.6,
+            _rng.integers(2, 13, n),
+            np.where(risk_scores > 0.3, _rng.integers(12, 49, n), -1)
+        )
+        confidence = _rng.uniform(0.7, 0.95, n)
+        
+        factors = {
+            "precipitation": precipitation,
+            "humidity": humidity,
+            "temperature": temperature
+        }
+        predicted_at = datetime.now().isoformat()
+        
+        return [
+            {
+                "flood_risk": round(float(risk_scores[i]), 3),
+                "risk_level": str(risk_levels[i]),
+                "time_to_flood_hours": int(time_to_flood[i]) if time_to_flood[i] >= 0 else None,
+                "prediction_horizon": self.prediction_horizon,
+                "location": location,
+                "factors": dict(factors),
+                "predicted_at": predicted_at,
+                "confidence": round(float(confidence[i]), 2)
+            }
+            for i, location in enumerate(locations)
+        ]
 
 # Global instance
 flood_predictor = FloodPredictor()
@@ -4,12 +4,43 @@ Uses NetworkX to simulate cascading infrastructure failures
 """
 
 import networkx as nx
+import numpy as np
+from bisect import bisect_right
 from typing import Dict, List, Tuple, Optional
-import random
 import json
+from collections import deque
 from datetime import datetime
 from config import CRITICAL_INFRA, LOW_RISK, MEDIUM_RISK, HIGH_RISK
 
+# Risk level boundaries (inclusive lower bounds) and their labels
+RISK_THRESHOLDS = (LOW_RISK, MEDIUM_RISK, HIGH_RISK)
+RISK_LEVELS = ("minimal", "low", "medium", "high")
+_RISK_LEVELS_ARRAY = np.array(RISK_LEVELS)
+
+# Base impact multipliers by disaster type (rows) and infrastructure type (columns)
+DISASTER_IDX = {"flood": 0, "fire": 1, "earthquake": 2, "cyclone": 3}
+NODE_IDX = {"power": 0, "water": 1, "healthcare": 2, "telecom": 3}
+IMPACT_MATRIX = np.array([
+    #  power  water  healthcare  telecom
+    [0.85, 0.70, 0.75, 0.65],  # flood: damages power, water plants may be resilient
+    [0.90, 0.50, 0.80, 0.85],  # fire: directly damages electrical systems
+    [0.95, 0.85, 0.90, 0.90],  # earthquake: heavily damages all infrastructure
+    [0.80, 0.70, 0.75, 0.85],  # cyclone: wind damages towers
+], dtype=np.float64)
+DEFAULT_IMPACT = 0.75
+
+# Special propagation rules keyed by (disaster_type, source_type, target_type)
+MODIFIER_TABLE = {
+    ("flood", "water", "power"): 1.2,         # Floods spread through water systems
+    ("fire", "power", "telecom"): 1.15,       # Fire spreads through power lines
+    ("fire", "power", "healthcare"): 1.15,
+}
+
+# Modifier applied to every edge for a disaster type when no special rule matches
+DEFAULT_MODIFIERS = {
+    "earthquake": 1.1  # Earthquake affects everything similarly
+}
+
 class CascadingRiskAnalyzer:
     """
     Graph Neural Network-based cascading failure analyzer
@@ -18,8 +49,24 @@ class CascadingRiskAnalyzer:
     
     def __init__(self):
         self.graph = nx.DiGraph()
-        self.node_risks = {}
         self.risk_history = {}  # Track risk changes over time
+        # Integer-indexed view of the graph used by the propagation loop
+        self._ids: List[str] = []
+        self._vid: Dict[str, int] = {}
+        # CSR adjacency: edges of vertex v are indptr[v]:indptr[v + 1]
+        self._indptr = np.zeros(1, dtype=np.int32)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._delays = np.empty(0, dtype=np.int32)
+        self._edge_sources = np.empty(0, dtype=np.int32)
+        # Per-disaster edge coefficients with the fixed topology folded in
+        self._edge_coefficients: Dict[str, np.ndarray] = {}
+        # Per-vertex state (structure of arrays), float64 so risks compare
+        # exactly against the config thresholds
+        self._risk = np.zeros(0, dtype=np.float64)
+        self._resilience = np.zeros(0, dtype=np.float64)
+        self._node_type: Dict[str, str] = {}
+        self._coords = np.empty((0, 2), dtype=np.float64)
         self._build_infrastructure_graph()
     
     def _build_infrastructure_graph(self):
@@ -35,7 +82,6 @@ class CascadingRiskAnalyzer:
                 risk=0.0,
                 resilience=0.5  # Base resilience
             )
-            self.node_risks[infra["id"]] = 0.0
         
         # Build dependency network
         # Power Grid is critical - everything depends on it
@@ -59,6 +105,88 @@ class CascadingRiskAnalyzer:
         # Reciprocal dependencies (cascading loops)
         self.graph.add_edge("hospital_1", "power_grid_1", 
                           weight=0.30, type="load_reduction", delay_minutes=240)
+        
+        self._index_graph()
+    
+    def _index_graph(self):
+        """Flatten the graph into integer vertex ids and CSR adjacency arrays"""
+        self._ids = list(self.graph.nodes())
+        self._vid = {node_id: vid for vid, node_id in enumerate(self._ids)}
+        self._node_type = {
+            node_id: self.graph.nodes[node_id].get("type", "unknown") for node_id in self._ids
+        }
+        self._resilience = np.asarray(
+            [self.graph.nodes[node_id].get("resilience", 0.5) for node_id in self._ids],
+            dtype=np.float64
+        )
+        # Vertices are only ever appended, so existing risks keep their slots
+        risk = np.zeros(len(self._ids), dtype=np.float64)
+        risk[:len(self._risk)] = self._risk
+        self._risk = risk
+        self._coords = np.asarray(
+            [(self.graph.nodes[node_id]["lat"], self.graph.nodes[node_id]["lon"]) for node_id in self._ids],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        
+        # Group edges by source vertex, keeping successor order within a source
+        edges = sorted(
+            ((self._vid[source], self._vid[target], data)
+             for source, target, data in self.graph.edges(data=True)),
+            key=lambda edge: edge[0]
+        )
+        counts = np.bincount([edge[0] for edge in edges], minlength=len(self._ids))
+        self._indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        self._indices = np.asarray([edge[1] for edge in edges], dtype=np.int32)
+        self._weights = np.asarray([edge[2].get("weight", 0.5) for edge in edges], dtype=np.float64)
+        self._delays = np.asarray([edge[2].get("delay_minutes", 30) for edge in edges], dtype=np.int32)
+        self._edge_sources = np.asarray([edge[0] for edge in edges], dtype=np.int32)
+        self._edge_coefficients = {}
+        
+        # Static parts of the serialized graph; only risk fields change per call
+        self._static_nodes_tpl = [
+            {
+                "id": node_id,
+                "name": self.graph.nodes[node_id]["name"],
+                "type": self.graph.nodes[node_id]["type"],
+                "lat": self.graph.nodes[node_id]["lat"],
+                "lon": self.graph.nodes[node_id]["lon"]
+            }
+            for node_id in self._ids
+        ]
+        self._static_edges = [
+            {
+                "source": source,
+                "target": target,
+                "weight": data.get("weight", 0.5),
+                "type": data.get("type", "dependency")
+            }
+            for source, target, data in self.graph.edges(data=True)
+        ]
+        self._static_edges_detailed = [
+            {**edge, "delay_minutes": data.get("delay_minutes", 0)}
+            for edge, (_, _, data) in zip(self._static_edges, self.graph.edges(data=True))
+        ]
+    
+    def _get_edge_coefficients(self, disaster_type: str) -> np.ndarray:
+        """
+        Per-edge propagation coefficients for a disaster type, aligned with the CSR arrays
+        
+        Edge weight, disaster modifier and target resilience are all fixed once
+        the graph is built, so they are folded into one factor per edge:
+        weight * modifier * (1 - resilience * 0.3)
+        """
+        coefficients = self._edge_coefficients.get(disaster_type)
+        if coefficients is None:
+            modifiers = np.asarray([
+                self._get_risk_modifier(disaster_type, self._ids[target], self._ids[source])
+                for source, target in zip(self._edge_sources.tolist(), self._indices.tolist())
+            ], dtype=np.float64)
+            coefficients = (
+                self._weights * modifiers
+                * (1 - self._resilience[self._indices] * 0.3)
+            )
+            self._edge_coefficients[disaster_type] = coefficients
+        return coefficients
     
     def analyze_cascading_risk(self, 
                                initial_disaster: Dict,
@@ -81,98 +209,76 @@ class CascadingRiskAnalyzer:
         initial_risk = self._calculate_initial_impact(disaster_type, severity, affected_node)
         
         # Set initial risk
-        self.node_risks[affected_node] = initial_risk
-        self.graph.nodes[affected_node]["risk"] = initial_risk
+        risk = self._risk
+        risk[self._vid[affected_node]] = initial_risk
         
-        # Track propagation
+        # Track propagation: the list keeps discovery order, the set answers
+        # membership. affected_nodes maps node -> (risk, step, time_minutes)
         propagation_path = [affected_node]
-        affected_nodes = {affected_node: {
-            "risk": initial_risk,
-            "step": 0,
-            "time_minutes": 0
-        }}
-        
-        # Propagate risk through dependency network
+        propagation_path_set = {affected_node}
+        affected_nodes = {affected_node: (initial_risk, 0, 0)}
+        
+        # Propagate risk through dependency network, one hop per step.
+        # Only nodes raised in the previous step can raise their successors,
+        # so the worklist holds just that frontier.
+        ids = self._ids
+        indptr = self._indptr
+        indices = self._indices
+        delays = self._delays
+        coefficients = self._get_edge_coefficients(disaster_type)
+        frontier = deque([affected_node])
         for step in range(1, propagation_steps + 1):
             new_affected = {}
             
-            for node_id, node_state in list(affected_nodes.items()):
-                current_risk = node_state["risk"]
-                current_time = node_state["time_minutes"]
+            while frontier:
+                node_id = frontier.popleft()
+                current_risk, _, current_time = affected_nodes[node_id]
                 
-                # Propagate to dependent nodes
-                for neighbor in self.graph.successors(node_id):
-                    edge = self.graph[node_id][neighbor]
-                    edge_weight = edge.get("weight", 0.5)
-                    delay_minutes = edge.get("delay_minutes", 30)
+                # Propagated risk to every dependent node in one vector op
+                vid = self._vid[node_id]
+                lo, hi = indptr[vid], indptr[vid + 1]
+                targets = indices[lo:hi]
+                final_risks = current_risk * coefficients[lo:hi]
+                
+                for target_vid, final_risk, delay_minutes in zip(
+                    targets.tolist(), final_risks.tolist(), delays[lo:hi].tolist()
+                ):
+                    neighbor = ids[target_vid]
                     
-                    # Skip if already processed at this step (prevent duplicates)
-                    if neighbor in affected_nodes and affected_nodes[neighbor]["step"] < step:
+                    # Skip nodes already settled in an earlier step
+                    if neighbor in affected_nodes:
                         continue
                     
-                    # Calculate propagated risk with time delay consideration
-                    base_propagated = current_risk * edge_weight
-                    
-                    # Apply disaster-specific modifiers
-                    risk_modifier = self._get_risk_modifier(disaster_type, neighbor, node_id)
-                    propagated_risk = base_propagated * risk_modifier
-                    
-                    # Get target node resilience
-                    target_resilience = self.graph.nodes[neighbor].get("resilience", 0.5)
-                    final_risk = propagated_risk * (1 - target_resilience * 0.3)
-                    
                     # Update if higher than current
-                    current_target_risk = self.node_risks.get(neighbor, 0.0)
-                    new_risk = max(current_target_risk, final_risk)
-                    
-                    if new_risk > current_target_risk:
-                        new_affected[neighbor] = {
-                            "risk": new_risk,
-                            "step": step,
-                            "time_minutes": current_time + delay_minutes
-                        }
-                        self.node_risks[neighbor] = new_risk
-                        self.graph.nodes[neighbor]["risk"] = new_risk
+                    if final_risk > risk[target_vid]:
+                        new_affected[neighbor] = (final_risk, step, current_time + delay_minutes)
+                        risk[target_vid] = final_risk
                         propagation_path.append(neighbor)
+                        propagation_path_set.add(neighbor)
             
             if not new_affected:
                 break
             
             affected_nodes.update(new_affected)
+            frontier.extend(new_affected)
         
         # Build result with enhanced information
+        node_risks = risk.tolist()
+        risk_levels = self._get_risk_levels(risk)
         nodes_data = []
-        edges_data = []
-        
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
-            risk = self.node_risks[node]
-            
+        for tpl, node_risk, risk_level in zip(self._static_nodes_tpl, node_risks, risk_levels):
             nodes_data.append({
-                "id": node,
-                "name": node_data["name"],
-                "type": node_data["type"],
-                "lat": node_data["lat"],
-                "lon": node_data["lon"],
-                "risk": round(risk, 3),
-                "risk_level": self._get_risk_level(risk),
-                "in_propagation_path": node in propagation_path
-            })
-        
-        for edge in self.graph.edges(data=True):
-            source, target, data = edge
-            edges_data.append({
-                "source": source,
-                "target": target,
-                "weight": data.get("weight", 0.5),
-                "type": data.get("type", "dependency"),
-                "delay_minutes": data.get("delay_minutes", 0)
+                **tpl,
+                "risk": round(node_risk, 3),
+                "risk_level": risk_level,
+                "in_propagation_path": tpl["id"] in propagation_path_set
             })
+        edges_data = self._static_edges_detailed
         
         # Identify critical nodes
         critical_nodes = [
-            n for n in nodes_data 
-            if self.node_risks.get(n["id"], 0) >= HIGH_RISK
+            n for n, node_risk in zip(nodes_data, node_risks)
+            if node_risk >= HIGH_RISK
         ]
         
         # Calculate cascade timeline
@@ -199,38 +305,38 @@ class CascadingRiskAnalyzer:
         """Predict the next component likely to fail and its probability"""
         potential_next = []
         
-        for node_id, state in affected_nodes.items():
-            if state["risk"] < HIGH_RISK:
+        for node_id, (risk, _, time_minutes) in affected_nodes.items():
+            if risk < HIGH_RISK:
                 # This is a candidate for full failure soon
-                probability = state["risk"] * 1.2 # Heuristic boost
+                probability = risk * 1.2 # Heuristic boost
                 potential_next.append({
                     "node_id": node_id,
                     "name": self.graph.nodes[node_id].get("name"),
                     "probability": round(min(probability, 0.99), 2),
-                    "estimated_time_min": state["time_minutes"]
+                    "estimated_time_min": time_minutes
                 })
         
         if not potential_next: return None
         # Return the one with highest probability that hasn't failed yet
         return max(potential_next, key=lambda x: x["probability"])
     
+    @property
+    def node_risks(self) -> Dict[str, float]:
+        """Current risk score per node id"""
+        return dict(zip(self._ids, self._risk.tolist()))
+    
     def _find_nearest_node(self, location: Dict) -> Optional[str]:
         """Find the nearest infrastructure node to a location"""
-        min_distance = float('inf')
-        nearest = None
+        if not self._ids:
+            return None
         
         lat = location.get("lat", 0)
         lon = location.get("lon", 0)
         
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
-            lat_diff = abs(node_data["lat"] - lat)
-            lon_diff = abs(node_data["lon"] - lon)
-            distance = (lat_diff ** 2 + lon_diff ** 2) ** 0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest = node
+        distances = np.hypot(self._coords[:, 0] - lat, self._coords[:, 1] - lon)
+        idx = int(np.argmin(distances))
+        min_distance = distances[idx]
+        nearest = self._ids[idx]
         
         # Consider node affected if within 0.05 degrees (~5km)
         if min_distance < 0.05:
@@ -251,7 +357,6 @@ class CascadingRiskAnalyzer:
                 risk=0.0,
                 virtual=True
             )
-            self.node_risks[virtual_id] = 0.0
             
             # Connect to nearest infrastructure
             for infra in CRITICAL_INFRA:
@@ -262,80 +367,44 @@ class CascadingRiskAnalyzer:
                         type="proximity_impact",
                         delay_minutes=60
                     )
+            self._index_graph()
         
         return virtual_id
     
     def _calculate_initial_impact(self, disaster_type: str, severity: float, node_id: str) -> float:
         """Calculate initial impact based on disaster type and target infrastructure"""
-        node_type = self.graph.nodes[node_id].get("type", "unknown")
-        
-        # Base impact multipliers by disaster type
-        impact_matrix = {
-            "flood": {
-                "power": 0.85,      # Floods damage power infrastructure
-                "water": 0.70,      # Water plants affected but may be resilient
-                "healthcare": 0.75, # Hospitals affected
-                "telecom": 0.65     # Telecom towers affected
-            },
-            "fire": {
-                "power": 0.90,      # Fire directly damages electrical systems
-                "water": 0.50,      # Less direct impact
-                "healthcare": 0.80,
-                "telecom": 0.85
-            },
-            "earthquake": {
-                "power": 0.95,      # Earthquakes heavily damage infrastructure
-                "water": 0.85,
-                "healthcare": 0.90,
-                "telecom": 0.90
-            },
-            "cyclone": {
-                "power": 0.80,
-                "water": 0.70,
-                "healthcare": 0.75,
-                "telecom": 0.85     # Wind damages towers
-            }
-        }
-        
-        base_multiplier = impact_matrix.get(disaster_type, {}).get(node_type, 0.75)
+        disaster_idx = DISASTER_IDX.get(disaster_type)
+        node_idx = NODE_IDX.get(self._node_type.get(node_id, "unknown"))
+        if disaster_idx is None or node_idx is None:
+            base_multiplier = DEFAULT_IMPACT
+        else:
+            base_multiplier = float(IMPACT_MATRIX[disaster_idx, node_idx])
         initial_risk = severity * base_multiplier
         
         return min(1.0, initial_risk)
     
     def _get_risk_modifier(self, disaster_type: str, target_node: str, source_node: str) -> float:
         """Get risk propagation modifier based on disaster type and node types"""
-        target_type = self.graph.nodes[target_node].get("type", "unknown")
-        source_type = self.graph.nodes[source_node].get("type", "unknown")
-        
-        # Special propagation rules
-        if disaster_type == "flood":
-            # Floods spread through water systems
-            if source_type == "water" and target_type == "power":
-                return 1.2  # Enhanced propagation
-        
-        elif disaster_type == "fire":
-            # Fire spreads through power lines
-            if source_type == "power" and target_type in ["telecom", "healthcare"]:
-                return 1.15
-        
-        elif disaster_type == "earthquake":
-            # Earthquake affects everything similarly
-            return 1.1
+        target_type = self._node_type.get(target_node, "unknown")
+        source_type = self._node_type.get(source_node, "unknown")
         
-        return 1.0  # Default modifier
+        return MODIFIER_TABLE.get(
+            (disaster_type, source_type, target_type),
+            DEFAULT_MODIFIERS.get(disaster_type, 1.0)
+        )
     
     def _calculate_cascade_timeline(self, affected_nodes: Dict) -> List[Dict]:
         """Calculate timeline of cascading failures"""
         timeline = []
         
-        for node_id, state in affected_nodes.items():
+        for node_id, (risk, step, time_minutes) in affected_nodes.items():
             node_name = self.graph.nodes[node_id].get("name", node_id)
             timeline.append({
                 "node": node_name,
                 "node_id": node_id,
-                "risk": round(state["risk"], 3),
-                "time_minutes": state["time_minutes"],
-                "step": state["step"]
+                "risk": round(risk, 3),
+                "time_minutes": time_minutes,
+                "step": step
             })
         
         timeline.sort(key=lambda x: (x["step"], x["time_minutes"]))
@@ -343,52 +412,32 @@ class CascadingRiskAnalyzer:
     
     def _get_risk_level(self, risk: float) -> str:
         """Convert risk score to level"""
-        if risk >= HIGH_RISK:
-            return "high"
-        elif risk >= MEDIUM_RISK:
-            return "medium"
-        elif risk >= LOW_RISK:
-            return "low"
-        else:
-            return "minimal"
+        return RISK_LEVELS[bisect_right(RISK_THRESHOLDS, risk)]
+    
+    def _get_risk_levels(self, risks: np.ndarray) -> List[str]:
+        """Convert an array of risk scores to levels"""
+        return _RISK_LEVELS_ARRAY[np.searchsorted(RISK_THRESHOLDS, risks, side="right")].tolist()
     
     def get_current_graph_state(self) -> Dict:
         """Get current state of the risk graph"""
         nodes_data = []
-        edges_data = []
-        
-        for node in self.graph.nodes():
-            node_data = self.graph.nodes[node]
+        risk_levels = self._get_risk_levels(self._risk)
+        for tpl, node_risk, risk_level in zip(self._static_nodes_tpl, self._risk.tolist(), risk_levels):
             nodes_data.append({
-                "id": node,
-                "name": node_data["name"],
-                "type": node_data["type"],
-                "lat": node_data["lat"],
-                "lon": node_data["lon"],
-                "risk": round(self.node_risks.get(node, 0.0), 3),
-                "risk_level": self._get_risk_level(self.node_risks.get(node, 0.0))
-            })
-        
-        for edge in self.graph.edges(data=True):
-            source, target, data = edge
-            edges_data.append({
-                "source": source,
-                "target": target,
-                "weight": data.get("weight", 0.5),
-                "type": data.get("type", "dependency")
+                **tpl,
+                "risk": round(node_risk, 3),
+                "risk_level": risk_level
             })
         
         return {
             "nodes": nodes_data,
-            "edges": edges_data,
+            "edges": self._static_edges,
             "timestamp": datetime.now().isoformat()
         }
     
     def reset_risks(self):
         """Reset all risk scores to zero"""
-        for node in self.graph.nodes():
-            self.node_risks[node] = 0.0
-            self.graph.nodes[node]["risk"] = 0.0
+        self._risk.fill(0.0)
         self.risk_history = {}
 
 # Global instance
@@ -3,11 +3,22 @@ Satellite AI - Vision Transformer (ViT) for anomaly detection
 Simulated implementation for demo purposes
 """
 
+import os
 import numpy as np
 from PIL import Image
 from typing import Dict, List, Tuple, Optional
-import random
 from datetime import datetime
+from config import SATELLITE_IMAGE_SIZE, SATELLITE_MODEL_PATH
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# ImageNet normalization used when the ViT was trained
+_IMAGE_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_IMAGE_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
 
 class SatelliteAI:
     """
@@ -19,6 +30,43 @@ class SatelliteAI:
         self.model_loaded = True
         self.confidence_threshold = 0.6
         self.detection_types = ["fire", "flood", "land_change", "cloud_anomaly"]
+        self._rng = np.random.default_rng()
+        self.session = self._load_model(SATELLITE_MODEL_PATH)
+    
+    def _load_model(self, model_path: str):
+        """Load the int8-quantized ViT if onnxruntime and the model file are present"""
+        if not ONNXRUNTIME_AVAILABLE or not os.path.exists(model_path):
+            return None
+        try:
+            return ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        except Exception as e:
+            print(f"Satellite model load error: {e}")
+            return None
+    
+    def _detect_with_model(self, img: np.ndarray) -> List[Dict]:
+        """Run the quantized ViT on a BGR image; one output score per detection type"""
+        import cv2
+        
+        rgb = cv2.cvtColor(cv2.resize(img, SATELLITE_IMAGE_SIZE), cv2.COLOR_BGR2RGB)
+        tensor = ((rgb.astype(np.float32) / 255.0 - _IMAGE_MEAN) / _IMAGE_STD).transpose(2, 0, 1)[np.newaxis]
+        
+        input_name = self.session.get_inputs()[0].name
+        logits = self.session.run(None, {input_name: tensor})[0][0]
+        scores = np.exp(logits - logits.max())
+        scores /= scores.sum()
+        
+        detected_at = datetime.now().isoformat()
+        return [
+            {
+                "type": anomaly_type,
+                "confidence": round(confidence, 3),
+                "severity": self._calculate_severity(anomaly_type, confidence),
+                "detected_at": detected_at,
+                "metadata": {"cv_method": "vit_int8"}
+            }
+            for anomaly_type, confidence in zip(self.detection_types, scores.tolist())
+            if confidence >= self.confidence_threshold
+        ]
     
     def detect_anomalies(self, image_path: Optional[str] = None, image_array: Optional[np.ndarray] = None) -> List[Dict]:
         """
@@ -35,6 +83,9 @@ class SatelliteAI:
         else:
             # Fallback for demo flow
             return self._generate_simulated_anomalies()
+        
+        if self.session is not None:
+            return self._detect_with_model(img)
 
         # CV Pipeline: Grayscale -> GaussianBlur -> Canny Edges
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
@@ -58,18 +109,20 @@ class SatelliteAI:
 
     def _generate_simulated_anomalies(self) -> List[Dict]:
         """Keep previous simulated logic for when no real feed is available"""
-        num_detections = random.randint(1, 2)
-        anomalies = []
-        for i in range(num_detections):
-            anomaly_type = random.choice(self.detection_types)
-            confidence = random.uniform(0.7, 0.9)
-            anomalies.append({
-                "type": anomaly_type,
+        rng = self._rng
+        num_detections = int(rng.integers(1, 3))
+        type_idx = rng.integers(0, len(self.detection_types), size=num_detections)
+        confidences = rng.uniform(0.7, 0.9, size=num_detections)
+        detected_at = datetime.now().isoformat()
+        return [
+            {
+                "type": self.detection_types[idx],
                 "confidence": round(confidence, 3),
-                "severity": self._calculate_severity(anomaly_type, confidence),
-                "detected_at": datetime.now().isoformat()
-            })
-        return anomalies
+                "severity": self._calculate_severity(self.detection_types[idx], confidence),
+                "detected_at": detected_at
+            }
+            for idx, confidence in zip(type_idx.tolist(), confidences.tolist())
+        ]
     
     def _calculate_severity(self, anomaly_type: str, confidence: float) -> float:
         """Calculate severity score based on anomaly type and confidence"""
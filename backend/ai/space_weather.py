@@ -4,9 +4,13 @@ Simulates space weather events that can disrupt GPS and communication
 """
 
 import random
+import time
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
+# Bound once; uniform/randint go through extra argument handling per call
+_rand = random.random
+
 class SpaceWeatherMonitor:
     """
     Monitors space weather events that can affect GPS and communication systems
@@ -18,43 +22,52 @@ class SpaceWeatherMonitor:
         self.communication_status = "operational"
         self.solar_activity_level = 0.3  # Normal activity
         self.gps_failure_probability = 0.1  # 10% base chance of GPS issues
+        # Space weather doesn't change meaningfully sub-minute, so polls
+        # within the TTL reuse the last reading
+        self._cache: Optional[Dict] = None
+        self._cache_ts = 0.0
+        self._ttl = 30.0
     
     def check_space_weather(self) -> Dict:
         """
         Check current space weather conditions
         Returns status of GPS and communication systems
         """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self._ttl:
+            return dict(self._cache)
+        
         # Simulate space weather events
         solar_activity = self.solar_activity_level
         
         # Occasionally trigger GPS issues
-        if random.random() < self.gps_failure_probability:
-            solar_activity = random.uniform(0.7, 1.0)
+        if _rand() < self.gps_failure_probability:
+            solar_activity = 0.7 + 0.3 * _rand()
             self.solar_activity_level = solar_activity
         
         # Determine GPS status
         if solar_activity > 0.8:
             gps_status = "failed"
-            gps_reliability = random.uniform(0.1, 0.3)
+            gps_reliability = 0.1 + 0.2 * _rand()
         elif solar_activity > 0.6:
             gps_status = "degraded"
-            gps_reliability = random.uniform(0.4, 0.6)
+            gps_reliability = 0.4 + 0.2 * _rand()
         else:
             gps_status = "operational"
-            gps_reliability = random.uniform(0.85, 1.0)
+            gps_reliability = 0.85 + 0.15 * _rand()
         
         # Determine communication status
         if solar_activity > 0.7:
             comm_status = "intermittent"
-            comm_reliability = random.uniform(0.3, 0.6)
+            comm_reliability = 0.3 + 0.3 * _rand()
         else:
             comm_status = "operational"
-            comm_reliability = random.uniform(0.8, 1.0)
+            comm_reliability = 0.8 + 0.2 * _rand()
         
         self.gps_status = gps_status
         self.communication_status = comm_status
         
-        return {
+        self._cache = {
             "gps_status": gps_status,
             "gps_reliability": round(gps_reliability, 2),
             "communication_status": comm_status,
@@ -63,16 +76,23 @@ class SpaceWeatherMonitor:
             "solar_storm_active": solar_activity > 0.7,
             "timestamp": datetime.now().isoformat()
         }
+        self._cache_ts = now
+        return dict(self._cache)
+    
+    def _invalidate_cache(self):
+        """Drop the cached reading after a state change"""
+        self._cache = None
     
     def simulate_solar_storm(self) -> Dict:
         """
         Simulate a solar storm event
         This would trigger V-SLAM mode for drones
         """
-        storm_intensity = random.uniform(0.8, 1.0)
-        duration_hours = random.randint(2, 12)
+        storm_intensity = 0.8 + 0.2 * _rand()
+        duration_hours = 2 + int(11 * _rand())
         
         self.solar_activity_level = storm_intensity
+        start_time = datetime.now()
         
         event = {
             "type": "solar_storm",
@@ -80,8 +100,8 @@ class SpaceWeatherMonitor:
             "duration_hours": duration_hours,
             "gps_affected": True,
             "communication_affected": storm_intensity > 0.85,
-            "start_time": datetime.now().isoformat(),
-            "end_time": (datetime.now() + timedelta(hours=duration_hours)).isoformat()
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=duration_hours)).isoformat()
         }
         
         self.current_events.append(event)
@@ -89,6 +109,7 @@ class SpaceWeatherMonitor:
         # Update status
         self.gps_status = "failed"
         self.communication_status = "intermittent" if storm_intensity > 0.85 else "operational"
+        self._invalidate_cache()
         
         return event
     
@@ -97,6 +118,7 @@ class SpaceWeatherMonitor:
         self.solar_activity_level = 0.9
         self.gps_status = "failed"
         self.communication_status = "degraded"
+        self._invalidate_cache()
     
     def is_gps_available(self) -> bool:
         """Check if GPS is currently available"""
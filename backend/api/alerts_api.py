@@ -2,17 +2,25 @@
 Alerts API - Endpoint for ESP32 to poll alerts
 """
 
+import asyncio
+import orjson
+from typing import Set
 from fastapi import APIRouter
+from fastapi.responses import Response, ORJSONResponse, StreamingResponse
 from orchestration.alert_manager import alert_manager
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/esp32")
-async def get_esp32_alerts():
-    """
-    Get alerts formatted for ESP32
-    ESP32 polls this endpoint periodically
-    """
+# ESP32 devices poll every few seconds; the response is re-encoded this often
+ESP32_SNAPSHOT_INTERVAL_SEC = 1.0
+_esp32_snapshot = {"body": None}
+
+# Comment line sent on idle SSE streams so proxies keep the connection open
+SSE_KEEPALIVE_SEC = 15.0
+
+
+def _build_esp32_response() -> dict:
+    """Assemble the ESP32 alert payload from the alert manager"""
     alerts = alert_manager.get_esp32_alerts()
     return {
         "alerts": alerts,
@@ -20,6 +28,74 @@ async def get_esp32_alerts():
         "timestamp": alert_manager.pending_alerts[-1]["timestamp"] if alert_manager.pending_alerts else None
     }
 
+
+async def _refresh_esp32_snapshot():
+    """Re-encode the ESP32 payload once per interval for all pollers"""
+    while True:
+        try:
+            _esp32_snapshot["body"] = orjson.dumps(_build_esp32_response())
+        except Exception as e:
+            print(f"ESP32 alert snapshot error: {e}")
+        await asyncio.sleep(ESP32_SNAPSHOT_INTERVAL_SEC)
+
+
+# Strong references so the refresher is not garbage collected while it runs
+_snapshot_tasks: Set[asyncio.Task] = set()
+
+
+@router.on_event("startup")
+async def start_esp32_snapshot():
+    if _snapshot_tasks:
+        return
+    task = asyncio.create_task(_refresh_esp32_snapshot())
+    _snapshot_tasks.add(task)
+    task.add_done_callback(_snapshot_tasks.discard)
+
+
+@router.on_event("shutdown")
+async def stop_esp32_snapshot():
+    for task in _snapshot_tasks:
+        task.cancel()
+
+
+@router.get("/esp32")
+async def get_esp32_alerts():
+    """
+    Get alerts formatted for ESP32
+    ESP32 polls this endpoint periodically
+    """
+    body = _esp32_snapshot["body"]
+    if body is None:
+        # Snapshot task not running yet
+        body = orjson.dumps(_build_esp32_response())
+    return Response(content=body, media_type="application/json")
+
+async def _esp32_alert_events():
+    """Yield each new ESP32 alert as a Server-Sent Event"""
+    queue = alert_manager.subscribe()
+    try:
+        while True:
+            try:
+                alert = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield b"data: " + orjson.dumps(alert) + b"\n\n"
+    finally:
+        alert_manager.unsubscribe(queue)
+
+@router.get("/esp32/stream")
+async def stream_esp32_alerts():
+    """
+    Stream new alerts to ESP32 as Server-Sent Events
+    Firmware without chunked-transfer support keeps polling /esp32
+    """
+    return StreamingResponse(
+        _esp32_alert_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @router.get("/dashboard")
 async def get_dashboard_alerts():
     """
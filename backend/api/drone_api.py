@@ -3,17 +3,26 @@ Drone API - Control and monitor drones
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from drone.drone_controller import drone_controller
 from drone.telemetry import telemetry_gen
 from pydantic import BaseModel
 import asyncio
+from collections import Counter
 
 router = APIRouter()
 
+class CommandParams(BaseModel):
+    model_config = {"extra": "allow"}
+    
+    altitude: Optional[Union[int, float]] = None
+    mission: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
 class DroneCommand(BaseModel):
     action: str  # "takeoff", "land", "move", "slam_enable", "slam_disable"
-    params: Optional[Dict] = None
+    params: Optional[CommandParams] = None
 
 @router.get("/status")
 async def get_drone_status():
@@ -24,7 +33,7 @@ async def get_drone_status():
     return {
         "drones": drones,
         "count": len(drones),
-        "active": len([d for d in drones if d.get("status") == "active"])
+        "active": Counter(d.get("status") for d in drones)["active"]
     }
 
 @router.get("/status/{drone_id}")
@@ -46,7 +55,7 @@ async def get_drone_telemetry(drone_id: str):
 @router.post("/command/{drone_id}")
 async def send_drone_command(drone_id: str, command: DroneCommand):
     """Send a command to a drone"""
-    result = drone_controller.execute_command(drone_id, command.action, command.params or {})
+    result = drone_controller.execute_command(drone_id, command.action, command.params.model_dump(exclude_none=True) if command.params else {})
     if not result:
         raise HTTPException(status_code=400, detail=f"Failed to execute command: {command.action}")
     return result
@@ -4,15 +4,50 @@ Enhanced with Safe Drone Count, GPS Fallback, and Prediction Module
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from fastapi.responses import Response, ORJSONResponse
+from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+from api.timeutil import now_iso
 import random
 import math
 import asyncio
 import httpx
-
-router = APIRouter()
+import orjson
+import numpy as np
+from collections import Counter
+from bisect import bisect_left, bisect_right
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Deployment factor tables: factor = TABLE[bisect(THRESHOLDS, value)]
+# Factors are already at reporting precision, so responses use them unrounded
+_WIND_THRESHOLDS = (10, 25, 35)                 # km/h
+_WIND_FACTORS = (1.0, 0.7, 0.4, 0.1)
+_PRECIP_THRESHOLDS = (2, 10)                    # mm/h
+_PRECIP_FACTORS = (1.0, 0.6, 0.2)
+# Temperature bands are inclusive on the safe side: [-20, -10) 0.7, [-10, 45] 1.0, (45, 55] 0.7
+_TEMP_LOW_THRESHOLDS = (-20, -10)               # °C, bisect_right
+_TEMP_HIGH_THRESHOLDS = (45, 55)                # °C, bisect_left
+_TEMP_FACTORS = (0.3, 0.7, 1.0, 0.7, 0.3)
+
+# Returned as-is when no deployment warning applies; never mutated
+_OPTIMAL_RECOMMENDATIONS = (
+    {"type": "success", "message": "Conditions optimal for full drone deployment"},
+)
+
+# Row layout returned by DroneFleetConfig.estimate_positions_without_gps
+POSITION_ESTIMATE_DTYPE = np.dtype([
+    ("lat", np.float64),
+    ("lon", np.float64),
+    ("lat_drift", np.float64),
+    ("lon_drift", np.float64),
+    ("confidence", np.float64),
+    ("slam_recommended", np.bool_)
+])
+
+# Columns of DroneFleetConfig.TYPE_LIMITS
+TYPE_LIMIT_FIELDS = ("max_wind", "max_precipitation", "min_temp", "max_temp")
 
 # ============== Drone Fleet Configuration ==============
 
@@ -50,44 +85,132 @@ class DroneFleetConfig:
         }
     }
     
+    DRONE_TYPE_NAMES = tuple(DRONE_TYPES)
+    
+    # Rounded safe_count / TOTAL_DRONES for every possible safe_count
+    DEPLOYMENT_RATIOS = tuple(np.round(np.arange(TOTAL_DRONES + 1) / TOTAL_DRONES, 2).tolist())
+    
+    # Per-type operating limits, one row per DRONE_TYPE_NAMES entry
+    TYPE_LIMITS = np.array(
+        [[spec[field] for field in TYPE_LIMIT_FIELDS] for spec in DRONE_TYPES.values()],
+        dtype=np.float32
+    )
+    
     def __init__(self):
-        self.fleet_status = self._initialize_fleet()
+        self._index: Dict[str, int] = {}
+        self._status_counts: Counter = Counter()
+        self._initialize_fleet()
         self.prediction_history = []
     
-    def _initialize_fleet(self) -> List[Dict]:
+    def _initialize_fleet(self):
         """Initialize fleet with drone states"""
-        drones = []
-        for i in range(self.TOTAL_DRONES):
-            drone_type = list(self.DRONE_TYPES.keys())[i % 3]
-            drones.append({
-                "id": f"DRONE-{i+1:03d}",
-                "type": drone_type,
-                "status": random.choice(["available", "available", "available", "active", "charging"]),
-                "battery": random.randint(70, 100),
-                "altitude": 0,
-                "speed": 0,
-                "heading": random.randint(0, 360),
-                "location": {"lat": None, "lon": None},
+        n = self.TOTAL_DRONES
+        # Numeric state is stored column-wise; per-drone metadata stays in dicts
+        self._type_idx = np.arange(n, dtype=np.uint8) % len(self.DRONE_TYPE_NAMES)
+        self._battery = np.empty(n, dtype=np.uint8)
+        self._altitude = np.zeros(n, dtype=np.uint16)
+        self._speed = np.zeros(n, dtype=np.uint16)
+        self._heading = np.empty(n, dtype=np.uint16)
+        self._pos = np.full((n, 2), np.nan, dtype=np.float64)  # NaN until deployed
+        self._meta: List[Dict] = []
+        
+        for i in range(n):
+            drone_id = f"DRONE-{i+1:03d}"
+            status = random.choice(["available", "available", "available", "active", "charging"])
+            self._battery[i] = random.randint(70, 100)
+            self._heading[i] = random.randint(0, 360)
+            self._meta.append({
+                "id": drone_id,
+                "type": self.DRONE_TYPE_NAMES[self._type_idx[i]],
+                "status": status,
                 "slam_enabled": True,
-                "last_update": datetime.now().isoformat()
+                "last_update": now_iso()
             })
-        return drones
+            self._index[drone_id] = i
+            self._status_counts[status] += 1
+    
+    def _drone_dict(self, i: int) -> Dict:
+        """Assemble the API view of drone i"""
+        meta = self._meta[i]
+        lat, lon = self._pos[i].tolist()
+        return {
+            "id": meta["id"],
+            "type": meta["type"],
+            "status": meta["status"],
+            "battery": int(self._battery[i]),
+            "altitude": int(self._altitude[i]),
+            "speed": int(self._speed[i]),
+            "heading": int(self._heading[i]),
+            "location": {
+                "lat": None if lat != lat else lat,
+                "lon": None if lon != lon else lon
+            },
+            "slam_enabled": meta["slam_enabled"],
+            "last_update": meta["last_update"]
+        }
+    
+    @property
+    def fleet_status(self) -> List[Dict]:
+        return [self._drone_dict(i) for i in range(self.TOTAL_DRONES)]
+    
+    def find_drone(self, drone_id: str) -> Optional[int]:
+        """Row index of a drone, or None if unknown"""
+        return self._index.get(drone_id)
+    
+    def get_drone(self, drone_id: str) -> Optional[Dict]:
+        """Look up a drone by id"""
+        i = self._index.get(drone_id)
+        return None if i is None else self._drone_dict(i)
+    
+    def get_status(self, i: int) -> str:
+        return self._meta[i]["status"]
+    
+    def set_status(self, i: int, status: str):
+        """Change a drone's status, keeping the fleet tallies in sync"""
+        meta = self._meta[i]
+        self._status_counts[meta["status"]] -= 1
+        self._status_counts[status] += 1
+        meta["status"] = status
+    
+    def update_drone(
+        self,
+        i: int,
+        timestamp: str,
+        location: Optional[Tuple[float, float]] = None,
+        altitude: Optional[int] = None,
+        speed: Optional[int] = None
+    ):
+        """Write new telemetry for drone i"""
+        if location is not None:
+            self._pos[i] = location
+        if altitude is not None:
+            self._altitude[i] = altitude
+        if speed is not None:
+            self._speed[i] = speed
+        self._meta[i]["last_update"] = timestamp
+    
+    def suitable_drone_mask(self, wind_speed: float, precipitation: float, temperature: float) -> np.ndarray:
+        """Boolean mask of drones whose type limits admit the given conditions"""
+        limits = self.TYPE_LIMITS[self._type_idx]
+        return (
+            (wind_speed <= limits[:, 0])
+            & (precipitation <= limits[:, 1])
+            & (temperature >= limits[:, 2])
+            & (temperature <= limits[:, 3])
+        )
     
     def get_fleet_status(self) -> Dict:
         """Get current fleet status"""
-        available = len([d for d in self.fleet_status if d["status"] == "available"])
-        active = len([d for d in self.fleet_status if d["status"] == "active"])
-        charging = len([d for d in self.fleet_status if d["status"] == "charging"])
-        maintenance = len([d for d in self.fleet_status if d["status"] == "maintenance"])
+        counts = self._status_counts
         
         return {
             "total_drones": self.TOTAL_DRONES,
-            "available": available,
-            "active": active,
-            "charging": charging,
-            "maintenance": maintenance,
+            "available": counts["available"],
+            "active": counts["active"],
+            "charging": counts["charging"],
+            "maintenance": counts["maintenance"],
             "drones": self.fleet_status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     async def fetch_openweather(self, lat: float, lon: float, api_key: str = None) -> Dict:
@@ -245,31 +368,13 @@ class DroneFleetConfig:
         # Risk-based factors (inverse - lower risk = higher factor)
         risk_factor = max(0.1, 1 - (risk_score / 100))
         
-        # Wind factor
-        if wind_speed < 10:
-            wind_factor = 1.0
-        elif wind_speed < 25:
-            wind_factor = 0.7
-        elif wind_speed < 35:
-            wind_factor = 0.4
-        else:
-            wind_factor = 0.1
-        
-        # Precipitation factor
-        if precipitation < 2:
-            precip_factor = 1.0
-        elif precipitation < 10:
-            precip_factor = 0.6
-        else:
-            precip_factor = 0.2
-        
-        # Temperature factor
-        if -10 <= temperature <= 45:
-            temp_factor = 1.0
-        elif -20 <= temperature < -10 or 45 < temperature <= 55:
-            temp_factor = 0.7
-        else:
-            temp_factor = 0.3
+        # Wind, precipitation and temperature factors
+        wind_factor = _WIND_FACTORS[bisect_right(_WIND_THRESHOLDS, wind_speed)]
+        precip_factor = _PRECIP_FACTORS[bisect_right(_PRECIP_THRESHOLDS, precipitation)]
+        temp_factor = _TEMP_FACTORS[
+            bisect_right(_TEMP_LOW_THRESHOLDS, temperature)
+            + bisect_left(_TEMP_HIGH_THRESHOLDS, temperature)
+        ]
         
         # Visibility factor
         visibility_factor = min(1.0, visibility / 5000)
@@ -286,55 +391,56 @@ class DroneFleetConfig:
         
         safe_count = max(0, min(self.TOTAL_DRONES, safe_count))
         
-        # Generate recommendations
-        recommendations = []
-        critical_warnings = []
+        # Drones whose type is rated for these conditions
+        suitable_count = int(self.suitable_drone_mask(wind_speed, precipitation, temperature).sum())
         
-        if wind_speed > 25:
-            critical_warnings.append({
-                "type": "warning",
-                "message": f"High wind speed ({wind_speed:.1f} km/h) - Limit to surveillance drones only"
-            })
-        if precipitation > 5:
-            critical_warnings.append({
-                "type": "warning",
-                "message": f"Precipitation detected ({precipitation:.1f}mm) - Use waterproof drones only"
-            })
-        if risk_score > 70:
-            critical_warnings.append({
-                "type": "critical",
-                "message": f"High risk area - Reduce drone deployment by 50%"
-            })
-        if visibility < 3000:
-            critical_warnings.append({
-                "type": "warning",
-                "message": f"Low visibility ({visibility}m) - Enable V-SLAM navigation"
-            })
-        if temperature > 45 or temperature < -10:
-            critical_warnings.append({
-                "type": "warning",
-                "message": f"Extreme temperature ({temperature:.1f}°C) - Monitor battery levels"
-            })
-        if safe_count == 0:
-            critical_warnings.append({
-                "type": "critical",
-                "message": "Conditions too hazardous for any drone deployment"
-            })
-        if not critical_warnings:
-            recommendations.append({
-                "type": "success",
-                "message": "Conditions optimal for full drone deployment"
-            })
+        # Generate recommendations; the all-clear case reuses a shared constant
+        if (wind_speed > 25 or precipitation > 5 or risk_score > 70 or visibility < 3000
+                or temperature > 45 or temperature < -10 or safe_count == 0):
+            recommendations = []
+            if wind_speed > 25:
+                recommendations.append({
+                    "type": "warning",
+                    "message": f"High wind speed ({wind_speed:.1f} km/h) - Limit to surveillance drones only"
+                })
+            if precipitation > 5:
+                recommendations.append({
+                    "type": "warning",
+                    "message": f"Precipitation detected ({precipitation:.1f}mm) - Use waterproof drones only"
+                })
+            if risk_score > 70:
+                recommendations.append({
+                    "type": "critical",
+                    "message": f"High risk area - Reduce drone deployment by 50%"
+                })
+            if visibility < 3000:
+                recommendations.append({
+                    "type": "warning",
+                    "message": f"Low visibility ({visibility}m) - Enable V-SLAM navigation"
+                })
+            if temperature > 45 or temperature < -10:
+                recommendations.append({
+                    "type": "warning",
+                    "message": f"Extreme temperature ({temperature:.1f}°C) - Monitor battery levels"
+                })
+            if safe_count == 0:
+                recommendations.append({
+                    "type": "critical",
+                    "message": "Conditions too hazardous for any drone deployment"
+                })
+        else:
+            recommendations = _OPTIMAL_RECOMMENDATIONS
         
         return {
             "safe_drone_count": safe_count,
             "max_drones": self.TOTAL_DRONES,
-            "deployment_ratio": round(safe_count / self.TOTAL_DRONES, 2),
+            "suitable_drones": suitable_count,
+            "deployment_ratio": self.DEPLOYMENT_RATIOS[safe_count],
             "factors": {
                 "risk_factor": round(risk_factor, 2),
-                "wind_factor": round(wind_factor, 2),
-                "precipitation_factor": round(precip_factor, 2),
-                "temperature_factor": round(temp_factor, 2),
+                "wind_factor": wind_factor,
+                "precipitation_factor": precip_factor,
+                "temperature_factor": temp_factor,
                 "visibility_factor": round(visibility_factor, 2)
             },
             "conditions": {
@@ -346,46 +452,86 @@ class DroneFleetConfig:
                 "risk_score": round(risk_score, 1),
                 "risk_level": self.get_risk_level(risk_score)
             },
-            "recommendations": recommendations + critical_warnings,
+            "recommendations": recommendations,
             "data_sources": {
                 "weather": "live" if openweather_api_key else "simulated",
                 "nasa": "live" if nasa else "simulated"
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     def estimate_position_without_gps(
         self,
         lat: float,
         lon: float,
-        weather: Dict = None,
+        weather: "WeatherModel" = None,
         velocity: Dict = None
     ) -> Dict:
         """
         Estimate drone position using satellite/weather data when GPS unavailable
         Uses wind data and satellite feeds for position estimation
         """
-        wind = weather.get("wind", {}) if weather else {}
-        wind_speed = wind.get("speed", 0)
-        wind_deg = wind.get("deg", 0)
+        weather = weather or WeatherModel()
+        wind_speed = weather.wind.speed
+        wind_deg = weather.wind.deg
         
         # Estimate drift based on wind
-        drift_lat = (wind_speed * 0.001 * math.sin(math.radians(wind_deg)))
-        drift_lon = (wind_speed * 0.001 * math.cos(math.radians(wind_deg)))
+        wind_rad = math.radians(wind_deg)
+        drift_lat = (wind_speed * 0.001 * math.sin(wind_rad))
+        drift_lon = (wind_speed * 0.001 * math.cos(wind_rad))
         
         estimated_lat = lat + drift_lat
         estimated_lon = lon + drift_lon
         
-        visibility = weather.get("visibility", 10000) if weather else 10000
+        visibility = weather.visibility
         confidence = min(0.95, visibility / 10000)
         
         # SLAM recommendation based on visibility
         slam_recommended = visibility < 5000
         
+        return self._format_position_estimate(
+            estimated_lat, estimated_lon, drift_lat, drift_lon, confidence, slam_recommended
+        )
+    
+    def estimate_positions_without_gps(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        wind_speeds: np.ndarray,
+        wind_degs: np.ndarray,
+        visibilities: np.ndarray
+    ) -> np.ndarray:
+        """
+        Batch form of estimate_position_without_gps for N drones
+        Returns a structured array with one row per drone
+        """
+        wind_rad = np.radians(wind_degs)
+        drift_lat = wind_speeds * 0.001 * np.sin(wind_rad)
+        drift_lon = wind_speeds * 0.001 * np.cos(wind_rad)
+        
+        estimates = np.empty(len(lats), dtype=POSITION_ESTIMATE_DTYPE)
+        estimates["lat"] = lats + drift_lat
+        estimates["lon"] = lons + drift_lon
+        estimates["lat_drift"] = drift_lat
+        estimates["lon_drift"] = drift_lon
+        estimates["confidence"] = np.minimum(0.95, visibilities / 10000)
+        estimates["slam_recommended"] = visibilities < 5000
+        return estimates
+    
+    def _format_position_estimate(
+        self,
+        lat: float,
+        lon: float,
+        drift_lat: float,
+        drift_lon: float,
+        confidence: float,
+        slam_recommended: bool
+    ) -> Dict:
+        """Shape one position estimate as returned by the API"""
         return {
             "estimated_location": {
-                "lat": round(estimated_lat, 6),
-                "lon": round(estimated_lon, 6)
+                "lat": round(lat, 6),
+                "lon": round(lon, 6)
             },
             "gps_status": "unavailable",
             "fallback_method": "satellite_weather_estimation",
@@ -397,7 +543,7 @@ class DroneFleetConfig:
             "slam_recommended": slam_recommended,
             "slam_status": "active" if slam_recommended else "standby",
             "satellite_sources": ["NASA_POWER", "OPENWEATHER"],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     def generate_prediction(
@@ -479,7 +625,7 @@ class DroneFleetConfig:
             },
             "model_version": "1.0.0",
             "training_data": "NASA, Data.gov, OpenWeather historical",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         
         # Store prediction for history
@@ -509,13 +655,23 @@ class DroneDeployRequest(BaseModel):
     target_lat: float
     target_lon: float
     mission_type: str = "surveillance"
-    altitude: int = 100
+    altitude: int = Field(100, ge=0, le=65535)  # Stored as uint16
+
+
+class WindModel(BaseModel):
+    speed: float = 0
+    deg: float = 0
+
+
+class WeatherModel(BaseModel):
+    wind: WindModel = WindModel()
+    visibility: float = 10000
 
 
 class DronePositionEstimate(BaseModel):
     lat: float
     lon: float
-    weather_data: Optional[Dict] = None
+    weather_data: Optional[WeatherModel] = None
     velocity: Optional[Dict] = None
 
 
@@ -532,9 +688,41 @@ class PredictionRequest(BaseModel):
     historical_data: Optional[Dict] = None
 
 
+class FleetStatusResponse(BaseModel):
+    total_drones: int
+    available: int
+    active: int
+    charging: int
+    maintenance: int
+    drones: List[Dict[str, Any]]
+    timestamp: str
+
+
+class MissionInfo(BaseModel):
+    type: str
+    target: Dict[str, float]
+    altitude: int
+
+
+class DeployResponse(BaseModel):
+    status: str
+    drone_id: str
+    mission: MissionInfo
+    estimated_arrival: str
+    timestamp: str
+
+
+class DroneTypesResponse(BaseModel):
+    model_config = {"frozen": True}
+    
+    drone_types: Dict[str, Dict[str, int]]
+    total_fleet_size: int
+    timestamp: str
+
+
 # ============== API Endpoints ==============
 
-@router.get("/api/drones/fleet-status")
+@router.get("/api/drones/fleet-status", response_model=FleetStatusResponse)
 async def get_fleet_status():
     """Get complete drone fleet status"""
     return drone_fleet.get_fleet_status()
@@ -577,53 +765,56 @@ async def calculate_safe_drone_count_post(request: SafeCountRequest):
     )
 
 
-@router.post("/api/drones/deploy")
+@router.post("/api/drones/deploy", response_model=DeployResponse)
 async def deploy_drone(request: DroneDeployRequest):
     """Deploy a drone to a target location"""
-    drone = next((d for d in drone_fleet.fleet_status if d["id"] == request.drone_id), None)
+    i = drone_fleet.find_drone(request.drone_id)
     
-    if not drone:
+    if i is None:
         raise HTTPException(status_code=404, detail=f"Drone {request.drone_id} not found")
     
-    if drone["status"] != "available":
+    if drone_fleet.get_status(i) != "available":
         raise HTTPException(status_code=400, detail=f"Drone {request.drone_id} is not available")
     
-    drone["status"] = "active"
-    drone["location"] = {"lat": request.target_lat, "lon": request.target_lon}
-    drone["altitude"] = request.altitude
-    drone["speed"] = 15
-    drone["last_update"] = datetime.now().isoformat()
+    drone_fleet.set_status(i, "active")
+    ts = now_iso()
+    drone_fleet.update_drone(
+        i, ts,
+        location=(request.target_lat, request.target_lon),
+        altitude=request.altitude,
+        speed=15
+    )
     
-    return {
-        "status": "deployed",
-        "drone_id": request.drone_id,
-        "mission": {
-            "type": request.mission_type,
-            "target": {"lat": request.target_lat, "lon": request.target_lon},
-            "altitude": request.altitude
-        },
-        "estimated_arrival": datetime.now().isoformat(),
-        "timestamp": datetime.now().isoformat()
-    }
+    return DeployResponse(
+        status="deployed",
+        drone_id=request.drone_id,
+        mission=MissionInfo(
+            type=request.mission_type,
+            target={"lat": request.target_lat, "lon": request.target_lon},
+            altitude=request.altitude
+        ),
+        estimated_arrival=ts,
+        timestamp=ts
+    )
 
 
 @router.post("/api/drones/recall")
 async def recall_drone(drone_id: str):
     """Recall a drone to base"""
-    drone = next((d for d in drone_fleet.fleet_status if d["id"] == drone_id), None)
+    i = drone_fleet.find_drone(drone_id)
     
-    if not drone:
+    if i is None:
         raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found")
     
-    drone["status"] = "returning"
-    drone["speed"] = 20
-    drone["last_update"] = datetime.now().isoformat()
+    drone_fleet.set_status(i, "returning")
+    ts = now_iso()
+    drone_fleet.update_drone(i, ts, speed=20)
     
     return {
         "status": "recall_initiated",
         "drone_id": drone_id,
-        "estimated_return": datetime.now().isoformat(),
-        "timestamp": datetime.now().isoformat()
+        "estimated_return": ts,
+        "timestamp": ts
     }
 
 
@@ -636,25 +827,52 @@ async def estimate_position(request: DronePositionEstimate):
     return drone_fleet.estimate_position_without_gps(
         lat=request.lat,
         lon=request.lon,
-        weather=request.weather_data or {},
+        weather=request.weather_data,
         velocity=request.velocity
     )
 
 
-@router.get("/api/drones/types")
-async def get_drone_types():
-    """Get available drone types and their capabilities"""
+@router.post("/api/drones/position-estimate/batch")
+async def estimate_positions(positions: List[DronePositionEstimate]):
+    """
+    Estimate positions for several drones at once when GPS is unavailable
+    """
+    weathers = [r.weather_data or WeatherModel() for r in positions]
+    estimates = drone_fleet.estimate_positions_without_gps(
+        lats=np.array([r.lat for r in positions], dtype=np.float64),
+        lons=np.array([r.lon for r in positions], dtype=np.float64),
+        wind_speeds=np.array([w.wind.speed for w in weathers], dtype=np.float64),
+        wind_degs=np.array([w.wind.deg for w in weathers], dtype=np.float64),
+        visibilities=np.array([w.visibility for w in weathers], dtype=np.float64)
+    )
+    
     return {
-        "drone_types": drone_fleet.DRONE_TYPES,
-        "total_fleet_size": drone_fleet.TOTAL_DRONES,
-        "timestamp": datetime.now().isoformat()
+        "estimates": [
+            drone_fleet._format_position_estimate(*row)
+            for row in estimates.tolist()
+        ],
+        "count": len(estimates)
     }
 
 
+# DRONE_TYPES is constant: encode it once and only splice in the timestamp
+_DRONE_TYPES_PREFIX = orjson.dumps({
+    "drone_types": DroneFleetConfig.DRONE_TYPES,
+    "total_fleet_size": DroneFleetConfig.TOTAL_DRONES
+})[:-1] + b',"timestamp":'
+
+
+@router.get("/api/drones/types", response_model=DroneTypesResponse)
+async def get_drone_types():
+    """Get available drone types and their capabilities"""
+    body = _DRONE_TYPES_PREFIX + orjson.dumps(now_iso()) + b"}"
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/api/drones/{drone_id}")
 async def get_drone_status(drone_id: str):
     """Get status of a specific drone"""
-    drone = next((d for d in drone_fleet.fleet_status if d["id"] == drone_id), None)
+    drone = drone_fleet.get_drone(drone_id)
     
     if not drone:
         raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found")
@@ -665,19 +883,20 @@ async def get_drone_status(drone_id: str):
 @router.post("/api/drones/charge")
 async def charge_drone(drone_id: str):
     """Put a drone in charging mode"""
-    drone = next((d for d in drone_fleet.fleet_status if d["id"] == drone_id), None)
+    i = drone_fleet.find_drone(drone_id)
     
-    if not drone:
+    if i is None:
         raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found")
     
-    drone["status"] = "charging"
-    drone["last_update"] = datetime.now().isoformat()
+    drone_fleet.set_status(i, "charging")
+    ts = now_iso()
+    drone_fleet.update_drone(i, ts)
     
     return {
         "status": "charging",
         "drone_id": drone_id,
-        "estimated_full_charge": datetime.now().isoformat(),
-        "timestamp": datetime.now().isoformat()
+        "estimated_full_charge": ts,
+        "timestamp": ts
     }
 
 
@@ -705,7 +924,7 @@ async def get_prediction_history(hours: int = Query(24, description="Hours of hi
     return {
         "predictions": drone_fleet.get_prediction_history(hours),
         "count": len(drone_fleet.get_prediction_history(hours)),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
@@ -749,6 +968,6 @@ async def get_conditions(lat: float, lon: float):
         },
         "safe_drone_count": safe_count,
         "prediction": prediction,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
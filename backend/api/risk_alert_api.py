@@ -3,12 +3,17 @@ Risk Alert API - Endpoint for ESP32 hardware alerts with caching
 """
 
 from fastapi import APIRouter, HTTPException, Header
-from typing import Optional
+from fastapi.responses import Response
+from typing import Optional, Set, Tuple
 import time
-import requests
-from datetime import datetime, timedelta
+import asyncio
+import httpx
+import hashlib
+import orjson
+from api.timeutil import now_iso
 import os
 import json
+from bisect import bisect_right
 
 from orchestration.alert_manager import alert_manager
 from orchestration.decision_engine import decision_engine
@@ -16,34 +21,153 @@ from config import HIGH_RISK, MEDIUM_RISK, LOW_RISK
 
 router = APIRouter()
 
+# Lower bound of each level above "safe"
+RISK_THRESHOLDS = (LOW_RISK, MEDIUM_RISK, HIGH_RISK, 0.95)
+RISK_LEVELS = ("safe", "low", "medium", "high", "critical")
+
+# Every threshold is a multiple of 0.01, so scores bucketed to 0.01 map to the same level
+_RISK_LEVEL_LUT = tuple(RISK_LEVELS[bisect_right(RISK_THRESHOLDS, b / 100)] for b in range(101))
+_HARDWARE_ACTION_LUT = tuple(
+    "alarm" if b / 100 >= HIGH_RISK else "alert" if b / 100 >= MEDIUM_RISK else "none"
+    for b in range(101)
+)
+
 # Simple in-memory cache for API results
 class RiskAlertCache:
     def __init__(self, ttl: int = 30):
-        self.cache = None
-        self.last_update = None
+        # (expiry, data, encoded body, etag), swapped as a whole
+        self._entry: Optional[Tuple[float, dict, bytes, str]] = None
         self.ttl = ttl
     
     def get(self):
         """Get cached data if fresh"""
-        if self.cache and self.last_update:
-            age = time.time() - self.last_update
-            if age < self.ttl:
-                return self.cache
+        entry = self._entry
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
         return None
     
-    def set(self, data):
-        """Cache new data"""
-        self.cache = data
-        self.last_update = time.time()
+    def get_encoded(self) -> Optional[Tuple[bytes, str]]:
+        """Get the cached JSON body and its ETag if fresh"""
+        entry = self._entry
+        if entry and entry[0] > time.monotonic():
+            return entry[2], entry[3]
+        return None
     
-    def is_stale(self):
-        """Check if cache is stale"""
-        return self.get() is None
+    def set(self, data):
+        """Cache new data, encoding it once as served from cache"""
+        body = orjson.dumps({**data, "source": "cache"})
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        self._entry = (time.monotonic() + self.ttl, data, body, etag)
 
 risk_cache = RiskAlertCache(ttl=30)
 
+def _build_hw_trigger(risk_score: float) -> dict:
+    """LED/buzzer signals for the ESP32"""
+    high = risk_score >= HIGH_RISK
+    medium = risk_score >= MEDIUM_RISK
+    return {
+        "buzzer": high,
+        "red_led": medium,
+        "green_led": not medium,
+        "pulse": high,
+        "intensity": min(int(risk_score * 255), 255)
+    }
+
+# Message reported when no alert has been dispatched yet
+IDLE_MESSAGE = "System nominal"
+
+def _compute_live_response() -> dict:
+    """Compute the current risk alert payload"""
+    # Calculate current risk from active disasters
+    risk_score = _calculate_current_risk()
+    
+    # Get latest alert details
+    recent_alerts = alert_manager.get_alert_history(limit=1)
+    alert_message = recent_alerts[0].get("message", "") if recent_alerts else IDLE_MESSAGE
+    
+    response = {
+        "risk_score": round(risk_score, 2),
+        "risk_level": _get_risk_level(risk_score),
+        "hardware_action": _get_hardware_action(risk_score),
+        "hardware_trigger": _build_hw_trigger(risk_score),
+        "timestamp": now_iso(),
+        "message": alert_message,
+        "active_disasters": len(decision_engine.active_disasters),
+        "source": "live"
+    }
+    return response
+
+async def _risk_alert_payload(if_none_match: Optional[str] = None):
+    """Serve the cached payload, computing it only if the refresher hasn't yet"""
+    try:
+        cached = risk_cache.get_encoded()
+        if cached:
+            body, etag = cached
+            if if_none_match == etag:
+                # ESP32 already holds this payload
+                return Response(status_code=304, headers={"ETag": etag})
+            return Response(content=body, media_type="application/json", headers={"ETag": etag})
+        
+        response = _compute_live_response()
+        risk_cache.set(response)
+        return response
+    except Exception as e:
+        print(f"❌ RISK ALERT ERROR: {str(e)}")
+        # Return a safe fallback instead of 500
+        return _build_fallback_response()
+
+async def _refresh_risk_cache():
+    """Recompute the risk alert once per TTL so polls only read the cache"""
+    while True:
+        try:
+            risk_cache.set(_compute_live_response())
+        except Exception as e:
+            print(f"Risk alert refresh error: {e}")
+        await asyncio.sleep(risk_cache.ttl)
+
+# Strong references so the refresher is not garbage collected while it runs
+_refresher_tasks: Set[asyncio.Task] = set()
+
+@router.on_event("startup")
+async def start_risk_refresher():
+    if _refresher_tasks:
+        return
+    task = asyncio.create_task(_refresh_risk_cache())
+    _refresher_tasks.add(task)
+    task.add_done_callback(_refresher_tasks.discard)
+
+@router.on_event("shutdown")
+async def stop_risk_refresher():
+    for task in _refresher_tasks:
+        task.cancel()
+
+# Pooled client for open-data APIs; the last payload is revalidated with ETag/Last-Modified
+GOV_EVENTS_URL = "https://eonet.gsfc.nasa.gov/api/v3/events"
+_gov_client = httpx.AsyncClient(timeout=5.0)
+_gov_cache = {"etag": None, "last_modified": None, "data": None}
+
+@router.on_event("shutdown")
+async def close_gov_client():
+    await _gov_client.aclose()
+
+def _build_fallback_response() -> dict:
+    """Safe response returned instead of a 500"""
+    return {
+        "risk_score": 0.0,
+        "risk_level": "safe",
+        "hardware_action": "none",
+        "hardware_trigger": _build_hw_trigger(0.0),
+        "timestamp": now_iso(),
+        "message": "System check in progress",
+        "active_disasters": 0,
+        "source": "fallback"
+    }
+
 @router.post("/api/risk-alert")
-async def get_risk_alert(x_api_key: Optional[str] = Header(None)):
+async def get_risk_alert(
+    x_api_key: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     GET risk alert status and hardware trigger signal
     
@@ -54,127 +178,18 @@ async def get_risk_alert(x_api_key: Optional[str] = Header(None)):
     - hardware_trigger: dict with LED/buzzer signals
     - timestamp: ISO format timestamp
     - message: Human-readable message
-    """
-    try:
-        # Check cache first (for performance)
-        cached = risk_cache.get()
-        if cached:
-            cached["source"] = "cache"
-            return cached
-        
-        # Calculate current risk from active disasters
-        risk_score = _calculate_current_risk()
-        risk_level = _get_risk_level(risk_score)
-        hardware_action = _get_hardware_action(risk_score)
-        
-        # Generate hardware trigger signals
-        hardware_trigger = {
-            "buzzer": risk_score >= HIGH_RISK,
-            "red_led": risk_score >= MEDIUM_RISK,
-            "green_led": risk_score < MEDIUM_RISK,
-            "pulse": risk_score >= HIGH_RISK,
-            "intensity": min(int(risk_score * 255), 255)
-        }
-        
-        # Get latest alert details
-        recent_alerts = alert_manager.get_alert_history(limit=1)
-        alert_message = recent_alerts[0].get("message", "") if recent_alerts else "No active alerts"
-        
-        response = {
-            "risk_score": round(risk_score, 2),
-            "risk_level": risk_level,
-            "hardware_action": hardware_action,
-            "hardware_trigger": hardware_trigger,
-            "timestamp": datetime.now().isoformat(),
-            "message": alert_message,
-            "active_disasters": len(decision_engine.active_disasters),
-            "source": "live"
-        }
-        
-        # Cache the result
-        risk_cache.set(response)
-        
-        return response
     
-    except Exception as e:
-        print(f"❌ RISK ALERT ERROR: {str(e)}")
-        # Return a safe fallback instead of 500
-        return {
-            "risk_score": 0.0,
-            "risk_level": "safe",
-            "hardware_action": "none",
-            "hardware_trigger": {
-                "buzzer": False,
-                "red_led": False,
-                "green_led": True,
-                "pulse": False,
-                "intensity": 0
-            },
-            "timestamp": datetime.now().isoformat(),
-            "message": "System check in progress",
-            "active_disasters": 0,
-            "source": "fallback"
-        }
+    Cached responses carry an ETag; a matching If-None-Match gets 304
+    """
+    return await _risk_alert_payload(if_none_match)
 
 @router.get("/api/risk-alert")
-async def get_risk_alert_get():
+async def get_risk_alert_get(if_none_match: Optional[str] = Header(None)):
     """
     GET risk alert status (for ESP32 polling)
     Same as POST endpoint for backward compatibility
     """
-    try:
-        cached = risk_cache.get()
-        if cached:
-            cached["source"] = "cache"
-            return cached
-        
-        risk_score = _calculate_current_risk()
-        risk_level = _get_risk_level(risk_score)
-        hardware_action = _get_hardware_action(risk_score)
-        
-        hardware_trigger = {
-            "buzzer": risk_score >= HIGH_RISK,
-            "red_led": risk_score >= MEDIUM_RISK,
-            "green_led": risk_score < MEDIUM_RISK,
-            "pulse": risk_score >= HIGH_RISK,
-            "intensity": min(int(risk_score * 255), 255)
-        }
-        
-        recent_alerts = alert_manager.get_alert_history(limit=1)
-        alert_message = recent_alerts[0].get("message", "") if recent_alerts else "System nominal"
-        
-        response = {
-            "risk_score": round(risk_score, 2),
-            "risk_level": risk_level,
-            "hardware_action": hardware_action,
-            "hardware_trigger": hardware_trigger,
-            "timestamp": datetime.now().isoformat(),
-            "message": alert_message,
-            "active_disasters": len(decision_engine.active_disasters),
-            "source": "live"
-        }
-        
-        risk_cache.set(response)
-        return response
-    
-    except Exception as e:
-        print(f"❌ RISK ALERT ERROR (GET): {str(e)}")
-        return {
-            "risk_score": 0.0,
-            "risk_level": "safe",
-            "hardware_action": "none",
-            "hardware_trigger": {
-                "buzzer": False,
-                "red_led": False,
-                "green_led": True,
-                "pulse": False,
-                "intensity": 0
-            },
-            "timestamp": datetime.now().isoformat(),
-            "message": "System check in progress",
-            "active_disasters": 0,
-            "source": "fallback"
-        }
+    return await _risk_alert_payload(if_none_match)
 
 @router.get("/api/risk-alert/history")
 async def get_risk_alert_history(limit: int = 20):
@@ -189,7 +204,7 @@ async def get_risk_alert_history(limit: int = 20):
         return {
             "total": len(history),
             "alerts": history,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -205,7 +220,7 @@ async def trigger_test_alert():
             "type": "test",
             "severity": HIGH_RISK + 0.05,
             "message": "TEST ALERT - Hardware activation test",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "channel": "esp32"
         }
         
@@ -214,7 +229,7 @@ async def trigger_test_alert():
         return {
             "status": "test_triggered",
             "message": "Hardware test alert sent to ESP32",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -227,8 +242,8 @@ def _calculate_current_risk() -> float:
     if not decision_engine.active_disasters:
         return 0.0
     
-    # Get highest severity from active disasters
-    max_severity = max([d.get("severity", 0.0) for d in decision_engine.active_disasters])
+    # Highest severity is tracked by the decision engine as disasters arrive
+    max_severity = decision_engine.max_severity
     
     # Apply cascading multiplier (could be higher with cascading failures)
     cascading_factor = 1.0 + (len(decision_engine.active_disasters) * 0.1)
@@ -236,33 +251,27 @@ def _calculate_current_risk() -> float:
     risk = min(max_severity * cascading_factor, 1.0)
     return risk
 
+def _risk_bucket(risk_score: float) -> int:
+    """Index of the 0.01-wide bucket holding the score, clamped to 0..100"""
+    bucket = int(risk_score * 100)
+    if bucket / 100 > risk_score:
+        # risk_score * 100 rounded up across a bucket edge
+        bucket -= 1
+    return min(max(bucket, 0), 100)
+
 def _get_risk_level(risk_score: float) -> str:
     """
     Categorize risk score into levels
     """
-    if risk_score >= 0.95:
-        return "critical"
-    elif risk_score >= HIGH_RISK:
-        return "high"
-    elif risk_score >= MEDIUM_RISK:
-        return "medium"
-    elif risk_score >= 0.3:
-        return "low"
-    else:
-        return "safe"
+    return _RISK_LEVEL_LUT[_risk_bucket(risk_score)]
 
 def _get_hardware_action(risk_score: float) -> str:
     """
     Determine hardware action based on risk
     """
-    if risk_score >= HIGH_RISK:
-        return "alarm"
-    elif risk_score >= MEDIUM_RISK:
-        return "alert"
-    else:
-        return "none"
+    return _HARDWARE_ACTION_LUT[_risk_bucket(risk_score)]
 
-def _fetch_gov_data(api_key: str = None) -> dict:
+async def _fetch_gov_data(api_key: str = None) -> dict:
     """
     Fetch data from Government/NASA open data APIs
     Uses API key from environment variables
@@ -275,12 +284,22 @@ def _fetch_gov_data(api_key: str = None) -> dict:
     
     # Example: NASA EONET API (Events, Coordinates, Geometry API)
     # This is a placeholder - replace with actual API calls
+    headers = {}
+    if _gov_cache["etag"]:
+        headers["If-None-Match"] = _gov_cache["etag"]
+    if _gov_cache["last_modified"]:
+        headers["If-Modified-Since"] = _gov_cache["last_modified"]
+    
     try:
-        response = requests.get(
-            "https://eonet.gsfc.nasa.gov/api/v3/events",
-            timeout=5
-        )
+        response = await _gov_client.get(GOV_EVENTS_URL, headers=headers)
+        if response.status_code == 304 and _gov_cache["data"] is not None:
+            return _gov_cache["data"]
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        data = response.json()
+    except httpx.HTTPError as e:
         raise Exception(f"Failed to fetch government data: {str(e)}")
+    
+    _gov_cache["etag"] = response.headers.get("ETag")
+    _gov_cache["last_modified"] = response.headers.get("Last-Modified")
+    _gov_cache["data"] = data
+    return data
@@ -3,39 +3,65 @@ Satellite API - Fetch satellite data and weather information
 """
 
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Optional
+from fastapi.responses import Response
+from typing import Dict, Optional
+import itertools
 import random
 import json
-from datetime import datetime
+import orjson
+from api.timeutil import now_iso
 from config import DATA_SIMULATED_PATH
 import os
 
 router = APIRouter()
 
 # Global storage for disaster zones (shared with decision engine)
-satellite_zones: List[Dict] = []
+satellite_zones: Dict[str, Dict] = {}  # zone id -> zone
 weather_data = {}
 
+# Generated zone ids never repeat, even after zones are deleted
+_zone_seq = itertools.count(1)
+
+# Encoded /zones body, rebuilt when the second ticks over or the zones change
+_zones_cache = {"ts": None, "body": None}
+
+def invalidate_zones_cache():
+    """Call after mutating satellite_zones"""
+    _zones_cache["ts"] = None
+
 @router.get("/zones")
 async def get_satellite_zones():
     """
     Get detected disaster zones from satellite imagery
     Returns zones detected by ViT model
     """
-    return {
-        "zones": satellite_zones,
-        "timestamp": datetime.now().isoformat(),
-        "count": len(satellite_zones)
-    }
+    ts = now_iso()
+    if _zones_cache["ts"] != ts:
+        _zones_cache["body"] = orjson.dumps({
+            "zones": list(satellite_zones.values()),
+            "timestamp": ts,
+            "count": len(satellite_zones)
+        })
+        _zones_cache["ts"] = ts
+    return Response(content=_zones_cache["body"], media_type="application/json")
 
 @router.post("/zones")
 async def add_satellite_zone(zone: Dict):
     """
     Add a new disaster zone (called by AI models)
+    Zones without an id get a fresh one; an id that is already in use is rejected
     """
-    zone["id"] = zone.get("id", f"zone_{len(satellite_zones) + 1}")
-    zone["detected_at"] = zone.get("detected_at", datetime.now().isoformat())
-    satellite_zones.append(zone)
+    if "id" in zone:
+        # Re-posting an existing id would silently replace that zone
+        if zone["id"] in satellite_zones:
+            raise HTTPException(status_code=409, detail=f"Zone {zone['id']} already exists")
+    else:
+        zone["id"] = f"zone_{next(_zone_seq)}"
+        while zone["id"] in satellite_zones:
+            zone["id"] = f"zone_{next(_zone_seq)}"
+    zone["detected_at"] = zone.get("detected_at", now_iso())
+    satellite_zones[zone["id"]] = zone
+    invalidate_zones_cache()
     return {"status": "added", "zone_id": zone["id"]}
 
 @router.get("/weather")
@@ -53,7 +79,7 @@ async def get_weather_data(lat: float = 28.6139, lon: float = 77.2090):
             "wind_speed": round(random.uniform(5, 25), 1),
             "precipitation": round(random.uniform(0, 50), 1),
             "pressure": round(random.uniform(1000, 1020), 1),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     
     return weather_data[location_key]
@@ -64,32 +90,33 @@ async def get_anomalies():
     Get detected anomalies from satellite AI
     """
     # Return zones as anomalies for now
+    ts = now_iso()
     anomalies = []
-    for zone in satellite_zones:
+    for zone in satellite_zones.values():
         anomalies.append({
             "id": zone.get("id"),
             "type": zone.get("type", "unknown"),
             "confidence": zone.get("severity", 0.7),
             "location": zone.get("location", {}),
-            "detected_at": zone.get("detected_at", datetime.now().isoformat())
+            "detected_at": zone.get("detected_at", ts)
         })
     
     return {
         "anomalies": anomalies,
         "count": len(anomalies),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts
     }
 
 @router.delete("/zones/{zone_id}")
 async def clear_zone(zone_id: str):
     """Clear a specific zone"""
-    global satellite_zones
-    satellite_zones = [z for z in satellite_zones if z.get("id") != zone_id]
+    satellite_zones.pop(zone_id, None)
+    invalidate_zones_cache()
     return {"status": "cleared", "zone_id": zone_id}
 
 @router.delete("/zones")
 async def clear_all_zones():
     """Clear all zones"""
-    global satellite_zones
     satellite_zones.clear()
+    invalidate_zones_cache()
     return {"status": "all_cleared"}
@@ -0,0 +1,17 @@
+"""
+Timestamp helper shared by the polling-heavy API routers
+"""
+
+import time
+from datetime import datetime
+
+_ts_cache = {"ts": 0, "s": ""}
+
+def now_iso() -> str:
+    """Local ISO timestamp for the current second, formatted once per second"""
+    t = int(time.time())
+    if _ts_cache["ts"] != t:
+        # Publish the string before the key so readers never see a stale pair
+        _ts_cache["s"] = datetime.fromtimestamp(t).isoformat()
+        _ts_cache["ts"] = t
+    return _ts_cache["s"]
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from typing import Dict, List, Optional
 from orchestration.decision_engine import decision_engine
 from orchestration.alert_manager import alert_manager
-from api.satellite_api import satellite_zones
+from api.satellite_api import satellite_zones, invalidate_zones_cache
 from config import DISASTER_TYPES, CRITICAL_INFRA
 import random
 
@@ -88,4 +88,5 @@ async def clear_all_disasters():
     alert_manager.clear_all()
     # Clear satellite zones
     satellite_zones.clear()
+    invalidate_zones_cache()
     return {"status": "cleared", "message": "All disasters and alerts cleared"}
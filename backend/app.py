@@ -3,55 +3,34 @@ PRALAYA-NET Backend - FastAPI Application
 Main entry point for the disaster management system
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
 import os
+import sys
+import queue
+import logging
 import asyncio
-from dotenv import load_dotenv
-from services.data_ingestion import data_ingestor
-from services.ws_manager import ws_manager
+import aiohttp
+import importlib
+import orjson
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache
 
-from api.trigger_api import router as trigger_router
-from api.drone_api import router as drone_router
-from api.drone_fleet_api import router as drone_fleet_router
-from api.satellite_api import router as satellite_router
-from api.alerts_api import router as alerts_router
-from api.risk_alert_api import router as risk_alert_router
-from api.national_risk import router as national_risk_router
-from api.emergency_broadcast_api import router as emergency_broadcast_router
-from api.crowd_intelligence_api import router as crowd_intelligence_router
-from api.response_recommendation_api import router as response_recommendation_router
-from api.national_resilience_api import router as national_resilience_router
-from api.infrastructure_stabilization_api import router as infrastructure_stabilization_router
-from api.crisis_learning_api import router as crisis_learning_router
-from api.risk_fusion_api import router as risk_fusion_router
-from api.intent_command_api import router as intent_command_router
-from api.multi_agent_api import router as multi_agent_router
-from api.self_healing_api import router as self_healing_router
-from api.sensor_fusion_api import router as sensor_fusion_router
-from api.forensic_ledger_api import router as forensic_ledger_router
-from api.autonomous_policy_api import router as autonomous_policy_router
-from api.closed_loop_stabilization_api import router as closed_loop_stabilization_router
-from api.digital_twin_cascade_api import router as digital_twin_cascade_router
-from api.multi_agent_negotiation_api import router as multi_agent_negotiation_router
-from api.autonomous_training_api import router as autonomous_training_router
-from api.execution_verification_api import router as execution_verification_router
-from api.live_reliability_api import router as live_reliability_router
-from api.autonomous_demo_api import router as autonomous_demo_router
-from api.autonomous_execution_api import router as autonomous_execution_router
-from api.decision_explainability_api import router as decision_explainability_router
-from api.replay_api import router as replay_router
-from api.stability_index_api import router as stability_index_router
-from services.decision_explainability_engine import decision_explainability_engine
-from services.replay_engine import replay_engine
-from services.stability_index_service import stability_index_service
-from services.enhanced_stability_index_service import enhanced_stability_index_service
-from services.disaster_simulation_loop import disaster_simulation_loop
-from services.real_data_ingestion import real_data_ingestion
 from websocket_manager import ws_manager
-from config import APP_NAME, VERSION, CORS_ORIGINS, PORT as CONFIG_PORT
+from api.timeutil import now_iso
+from services.response_cache import response_cache
+from config import (
+    settings, APP_NAME, VERSION, CORS_ORIGINS, CORS_ORIGIN_REGEX, PORT as CONFIG_PORT,
+    UVICORN_RELOAD, UVICORN_WORKERS, LOG_LEVEL, STATUS_CACHE_TTL_SEC,
+    NASA_FIRMS_URL, USGS_EARTHQUAKE_URL, ENABLE_DEMO_APIS
+)
+try:
+    from pythonjsonlogger import jsonlogger
+    JSON_LOGGING_AVAILABLE = True
+except ImportError:
+    JSON_LOGGING_AVAILABLE = False
 from middleware import (
     RateLimitMiddleware,
     InputValidationMiddleware,
@@ -59,13 +38,59 @@ from middleware import (
     RequestLoggingMiddleware
 )
 
-# Load environment variables from .env file
-load_dotenv()
+# Components reported once per worker in the startup_complete log record (LOG_LEVEL=info)
+COMPONENT_LIST = (
+    "RISK ENGINE READY",
+    "HARDWARE LOOP READY",
+    "DRONE MODULE READY",
+    "GNN DIGITAL TWIN LOADED",
+    "NATIONAL DIGITAL TWIN INITIALIZED",
+    "CASCADE SIMULATION ENGINE READY",
+    "EMERGENCY BROADCAST SYSTEM READY",
+    "CROWD INTELLIGENCE MESH ACTIVE",
+    "AUTONOMOUS RESPONSE ENGINE ONLINE",
+    "NATIONAL RESILIENCE SCORE ACTIVE",
+    "INFRASTRUCTURE STABILIZATION ENGINE READY",
+    "CRISIS MEMORY & LEARNING SYSTEM ACTIVE",
+    "MULTI-LAYER RISK FUSION INTELLIGENCE ONLINE",
+    "ADIRI INTENT-DRIVEN COMMAND ENGINE READY",
+    "MULTI-AGENT AUTONOMOUS RESPONSE NETWORK ACTIVE",
+    "SELF-HEALING INFRASTRUCTURE SIMULATION READY",
+    "REAL-TIME SENSOR FUSION PIPELINE ACTIVE",
+    "FORENSIC EXECUTION LEDGER READY",
+    "AUTONOMOUS POLICY ENGINE READY",
+    "CLOSED-LOOP INFRASTRUCTURE STABILIZATION ACTIVE",
+    "DIGITAL TWIN CASCADE FORECAST ENGINE READY",
+    "MULTI-AGENT NEGOTIATION PROTOCOL ACTIVE",
+    "AUTONOMOUS SIMULATION TRAINING SYSTEM ACTIVE",
+    "EXECUTION VERIFICATION LAYER READY",
+    "LIVE SYSTEM RELIABILITY METRICS ACTIVE",
+    "DEMO-READY AUTONOMOUS SCENARIO READY",
+    "AUTONOMOUS EXECUTION ENGINE READY",
+    "MULTI-AGENT NEGOTIATION ENGINE ACTIVE",
+    "DECISION EXPLAINABILITY ENGINE READY",
+    "REPLAY ENGINE ACTIVE",
+    "STABILITY INDEX SERVICE ACTIVE",
+    "DISASTER SIMULATION LOOP READY",
+)
+
+# Status messages are queued and written by a listener thread, off the event loop
+logger = logging.getLogger("pralaya")
+logger.setLevel(LOG_LEVEL.upper())
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler(sys.stdout)
+if JSON_LOGGING_AVAILABLE:
+    # One JSON object per record, with extra fields such as "components"
+    _log_handler.setFormatter(jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
 
 app = FastAPI(
     title=APP_NAME,
     version=VERSION,
-    description="Unified Disaster Command System - AI-powered disaster prediction and response"
+    description="Unified Disaster Command System - AI-powered disaster prediction and response",
+    default_response_class=ORJSONResponse
 )
 
 # Security & Performance Middleware Stack (order matters)
@@ -78,233 +103,257 @@ app.add_middleware(RateLimitMiddleware, requests_per_minute=100)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+@lru_cache(maxsize=None)
+def _real_data_ingestion():
+    """Import the real-data ingestion service on first use"""
+    from services.real_data_ingestion import real_data_ingestion
+    return real_data_ingestion
+
+def _write_default_env(env_file: str):
+    with open(env_file, "w") as f:
+        f.write("DEMO_MODE=true\n")
+        f.write("DATA_GOV_KEY=demo_key\n")
+
+def _start_background(name: str, service):
+    """Run a background service loop, restarting it if it crashes"""
+    async def supervise():
+        while True:
+            try:
+                await service()
+                return
+            except Exception as e:
+                logger.warning(f"{name} crashed ({e}), restarting in 5s")
+                await asyncio.sleep(5)
+    
+    # Strong reference so the task is not garbage collected while it runs
+    task = asyncio.create_task(supervise(), name=name)
+    app.state.bg.add(task)
+    task.add_done_callback(app.state.bg.discard)
+
 # Startup Reliability Checks
 @app.on_event("startup")
 async def startup_event():
-    print("\n" + "═"*70)
-    print("🚀 PRALAYA-NET: STARTUP SEQUENCE INITIATED")
-    print("═"*70)
+    _log_listener.start()
+    banner = ["\n" + "═"*70]
+    banner.append("🚀 PRALAYA-NET: STARTUP SEQUENCE INITIATED")
+    banner.append("═"*70)
     
     # Check required packages
     try:
         import fastapi
         import uvicorn
         import asyncio
-        print("✅ Required packages verified")
+        banner.append("✅ Required packages verified")
     except ImportError as e:
-        print(f"❌ Missing required package: {e}")
-        print("💡 Run: pip install -r requirements.txt")
+        banner.append(f"❌ Missing required package: {e}")
+        banner.append("💡 Run: pip install -r requirements.txt")
+        logger.error("\n".join(banner))
         return
     
     # Check .env file
     import os
     env_file = ".env"
-    if not os.path.exists(env_file):
-        print("⚠️  .env file not found, creating default...")
-        with open(env_file, "w") as f:
-            f.write("DEMO_MODE=true\n")
-            f.write("DATA_GOV_KEY=demo_key\n")
-        print("✅ Default .env file created")
+    if os.path.exists(env_file):
+        banner.append("✅ .env file found")
+    elif os.getenv("DATA_GOV_KEY") or os.getenv("DEMO_MODE"):
+        banner.append("✅ Configuration provided by the environment")
     else:
-        print("✅ .env file found")
+        banner.append("⚠️  .env file not found, creating default...")
+        await asyncio.to_thread(_write_default_env, env_file)
+        banner.append("✅ Default .env file created")
+    
+    await response_cache.connect()
+    
+    # One pooled HTTP session for upstream probes, reused across requests
+    app.state.http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+        limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60
+    ))
+    
+    # Background loops run in one worker only when served by gunicorn (see gunicorn_conf.py)
+    app.state.bg = set()
+    run_background = os.getenv("WORKER_INDEX", "0") == "0"
     
     # Start Live Data Ingestion in Background
-    try:
-        asyncio.create_task(data_ingestor.start_monitoring())
-        print("✅ LIVE DATA INGESTOR STARTED")
-    except Exception as e:
-        print(f"⚠️  Data ingestion error: {e}")
-        print("💡 Continuing with synthetic data...")
+    if run_background:
+        try:
+            from services.data_ingestion import data_ingestor
+            _start_background("data_ingestor", data_ingestor.start_monitoring)
+            banner.append("✅ LIVE DATA INGESTOR STARTED")
+        except Exception as e:
+            banner.append(f"⚠️  Data ingestion error: {e}")
+            banner.append("💡 Continuing with synthetic data...")
     
     # Validate environment
-    data_key = os.getenv("DATA_GOV_KEY")
+    data_key = settings.data_gov_key
     if not data_key:
-        print("⚠️  DATA_GOV_KEY missing! Entering SAFE DEMO MODE.")
-        print("💡 Hardware and AI simulations will use internal synthetic data.")
+        banner.append("⚠️  DATA_GOV_KEY missing! Entering SAFE DEMO MODE.")
+        banner.append("💡 Hardware and AI simulations will use internal synthetic data.")
         os.environ["DEMO_MODE"] = "true"
     else:
-        print("✅ Environment variables validated")
-        print("✅ DATA_GOV_KEY detected. Live data services active.")
+        banner.append("✅ Environment variables validated")
+        banner.append("✅ DATA_GOV_KEY detected. Live data services active.")
         os.environ["DEMO_MODE"] = "false"
 
-    print("✅ RISK ENGINE READY")
-    print("✅ HARDWARE LOOP READY")
-    print("✅ DRONE MODULE READY")
-    print("✅ GNN DIGITAL TWIN LOADED")
-    print("✅ NATIONAL DIGITAL TWIN INITIALIZED")
-    print("✅ CASCADE SIMULATION ENGINE READY")
-    print("✅ EMERGENCY BROADCAST SYSTEM READY")
-    print("✅ CROWD INTELLIGENCE MESH ACTIVE")
-    print("✅ AUTONOMOUS RESPONSE ENGINE ONLINE")
-    print("✅ NATIONAL RESILIENCE SCORE ACTIVE")
-    print("✅ INFRASTRUCTURE STABILIZATION ENGINE READY")
-    print("✅ CRISIS MEMORY & LEARNING SYSTEM ACTIVE")
-    print("✅ MULTI-LAYER RISK FUSION INTELLIGENCE ONLINE")
-    print("✅ ADIRI INTENT-DRIVEN COMMAND ENGINE READY")
-    print("✅ MULTI-AGENT AUTONOMOUS RESPONSE NETWORK ACTIVE")
-    print("✅ SELF-HEALING INFRASTRUCTURE SIMULATION READY")
-    print("✅ REAL-TIME SENSOR FUSION PIPELINE ACTIVE")
-    print("✅ FORENSIC EXECUTION LEDGER READY")
-    print("✅ AUTONOMOUS POLICY ENGINE READY")
-    print("✅ CLOSED-LOOP INFRASTRUCTURE STABILIZATION ACTIVE")
-    print("✅ DIGITAL TWIN CASCADE FORECAST ENGINE READY")
-    print("✅ MULTI-AGENT NEGOTIATION PROTOCOL ACTIVE")
-    print("✅ AUTONOMOUS SIMULATION TRAINING SYSTEM ACTIVE")
-    print("✅ EXECUTION VERIFICATION LAYER READY")
-    print("✅ LIVE SYSTEM RELIABILITY METRICS ACTIVE")
-    print("✅ DEMO-READY AUTONOMOUS SCENARIO READY")
-    print("✅ AUTONOMOUS EXECUTION ENGINE READY")
-    print("✅ MULTI-AGENT NEGOTIATION ENGINE ACTIVE")
-    print("✅ DECISION EXPLAINABILITY ENGINE READY")
-    print("✅ REPLAY ENGINE ACTIVE")
-    print("✅ STABILITY INDEX SERVICE ACTIVE")
-    print("✅ DISASTER SIMULATION LOOP READY")
-    print("\n✨ BACKEND READY: PRALAYA-NET OPERATIONAL")
-    print("═"*70 + "\n")
+    banner.append(f"✅ {len(COMPONENT_LIST)} components ready")
+    banner.append("\n✨ BACKEND READY: PRALAYA-NET OPERATIONAL")
+    banner.append("═"*70 + "\n")
     
     # Start background services
-    print("🔄 Starting background services...")
-    asyncio.create_task(disaster_simulation_loop.start_simulation())
-    asyncio.create_task(enhanced_stability_index_service.start_enhanced_stability_index_updates())
-    asyncio.create_task(real_data_ingestion.start_real_data_ingestion())
-    print("✅ Enhanced services started")
+    if run_background:
+        banner.append("🔄 Starting background services...")
+        from services.disaster_simulation_loop import disaster_simulation_loop
+        from services.enhanced_stability_index_service import enhanced_stability_index_service
+        _start_background("disaster_simulation_loop", disaster_simulation_loop.start_simulation)
+        _start_background("enhanced_stability_index", enhanced_stability_index_service.start_background_updates)
+        _start_background("real_data_ingestion", _real_data_ingestion().start_continuous_ingestion)
+        banner.append("✅ Enhanced services started")
+    
+    banner.append("\n" + "═"*70)
+    banner.append("🎉 BACKEND STARTUP COMPLETE")
+    banner.append("📍 Backend running at: http://127.0.0.1:8000")
+    banner.append("📍 API Documentation: http://127.0.0.1:8000/docs")
+    banner.append("📍 Health Check: http://127.0.0.1:8000/api/health")
+    banner.append("═"*70 + "\n")
     
-    print("\n" + "═"*70)
-    print("🎉 BACKEND STARTUP COMPLETE")
-    print("📍 Backend running at: http://127.0.0.1:8000")
-    print("📍 API Documentation: http://127.0.0.1:8000/docs")
-    print("📍 Health Check: http://127.0.0.1:8000/api/health")
-    print("═"*70 + "\n")
+    # One record for the whole banner, written by the listener thread
+    logger.info("\n".join(banner), extra={"event": "startup_complete", "components": COMPONENT_LIST})
 
-# Include routers
-app.include_router(trigger_router, prefix="/api/trigger", tags=["Trigger"])
-app.include_router(drone_router, prefix="/api/drones", tags=["Drones"])
-app.include_router(drone_fleet_router, tags=["Drone Fleet"])
-app.include_router(satellite_router, prefix="/api/satellite", tags=["Satellite"])
-app.include_router(alerts_router, prefix="/api/orchestration/alerts", tags=["Alerts"])
-app.include_router(risk_alert_router, tags=["Risk Alert"])
-app.include_router(national_risk_router, tags=["National Risk"])
-app.include_router(emergency_broadcast_router, tags=["Emergency Broadcast"])
-app.include_router(crowd_intelligence_router, tags=["Crowd Intelligence"])
-app.include_router(response_recommendation_router, tags=["Response Recommendation"])
-app.include_router(national_resilience_router, tags=["National Resilience"])
-app.include_router(infrastructure_stabilization_router, tags=["Infrastructure Stabilization"])
-app.include_router(crisis_learning_router, tags=["Crisis Learning"])
-app.include_router(risk_fusion_router, tags=["Risk Fusion"])
-app.include_router(intent_command_router, tags=["Intent-Driven Command"])
-app.include_router(multi_agent_router, tags=["Multi-Agent Network"])
-app.include_router(self_healing_router, tags=["Self-Healing Infrastructure"])
-app.include_router(sensor_fusion_router, tags=["Sensor Fusion"])
-app.include_router(forensic_ledger_router, tags=["Forensic Ledger"])
-app.include_router(autonomous_policy_router, tags=["Autonomous Policy"])
-app.include_router(closed_loop_stabilization_router, tags=["Closed-Loop Stabilization"])
-app.include_router(digital_twin_cascade_router, tags=["Digital Twin Cascade"])
-app.include_router(multi_agent_negotiation_router, tags=["Multi-Agent Negotiation"])
-app.include_router(autonomous_training_router, tags=["Autonomous Training"])
-app.include_router(execution_verification_router, tags=["Execution Verification"])
-app.include_router(live_reliability_router, tags=["Live Reliability"])
-app.include_router(autonomous_demo_router, tags=["Autonomous Demo"])
-app.include_router(autonomous_execution_router, tags=["Autonomous Execution"])
-app.include_router(decision_explainability_router, tags=["Decision Explainability"])
-app.include_router(replay_router, tags=["Replay Engine"])
-app.include_router(stability_index_router, tags=["Stability Index"])
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Stop background services before closing the resources they use
+    # Startup may have returned before creating these
+    bg = getattr(app.state, "bg", ())
+    for task in bg:
+        task.cancel()
+    if bg:
+        await asyncio.wait(bg, timeout=5)
+    ws_manager.close()
+    http = getattr(app.state, "http", None)
+    if http is not None:
+        await http.close()
+    await response_cache.close()
+    _log_listener.stop()
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket, "general")
-    try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+# Include routers: (module, prefix, tag, demo only)
+ROUTERS = (
+    ("api.trigger_api", "/api/trigger", "Trigger", False),
+    ("api.drone_api", "/api/drones", "Drones", False),
+    ("api.drone_fleet_api", None, "Drone Fleet", False),
+    ("api.satellite_api", "/api/satellite", "Satellite", False),
+    ("api.alerts_api", "/api/orchestration/alerts", "Alerts", False),
+    ("api.risk_alert_api", None, "Risk Alert", False),
+    ("api.national_risk", None, "National Risk", False),
+    ("api.emergency_broadcast_api", None, "Emergency Broadcast", False),
+    ("api.crowd_intelligence_api", None, "Crowd Intelligence", False),
+    ("api.response_recommendation_api", None, "Response Recommendation", False),
+    ("api.national_resilience_api", None, "National Resilience", False),
+    ("api.infrastructure_stabilization_api", None, "Infrastructure Stabilization", False),
+    ("api.crisis_learning_api", None, "Crisis Learning", False),
+    ("api.risk_fusion_api", None, "Risk Fusion", False),
+    ("api.intent_command_api", None, "Intent-Driven Command", False),
+    ("api.multi_agent_api", None, "Multi-Agent Network", False),
+    ("api.self_healing_api", None, "Self-Healing Infrastructure", False),
+    ("api.sensor_fusion_api", None, "Sensor Fusion", False),
+    ("api.forensic_ledger_api", None, "Forensic Ledger", False),
+    ("api.autonomous_policy_api", None, "Autonomous Policy", False),
+    ("api.closed_loop_stabilization_api", None, "Closed-Loop Stabilization", False),
+    ("api.digital_twin_cascade_api", None, "Digital Twin Cascade", False),
+    ("api.multi_agent_negotiation_api", None, "Multi-Agent Negotiation", False),
+    ("api.autonomous_training_api", None, "Autonomous Training", False),
+    ("api.execution_verification_api", None, "Execution Verification", False),
+    ("api.live_reliability_api", None, "Live Reliability", False),
+    ("api.autonomous_demo_api", None, "Autonomous Demo", True),
+    ("api.autonomous_execution_api", None, "Autonomous Execution", False),
+    ("api.decision_explainability_api", None, "Decision Explainability", True),
+    ("api.replay_api", None, "Replay Engine", True),
+    ("api.stability_index_api", None, "Stability Index", False),
+)
 
-@app.websocket("/ws/risk-stream")
-async def risk_stream_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket, "risk")
-    try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+for module, prefix, tag, demo_only in ROUTERS:
+    if demo_only and not ENABLE_DEMO_APIS:
+        continue
+    router = importlib.import_module(module).router
+    app.include_router(router, prefix=prefix or "", tags=[tag])
 
-@app.websocket("/ws/stability-stream")
-async def stability_stream_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket, "stability")
-    try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+def _stream_endpoint(stream_type: str):
+    """WebSocket handler subscribing the client to one stream"""
+    async def endpoint(websocket: WebSocket):
+        await ws_manager.connect(websocket, stream_type)
+        try:
+            # Clients only listen, so wait for the disconnect without decoding frames
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            ws_manager.disconnect(websocket)
+    return endpoint
 
-@app.websocket("/ws/actions-stream")
-async def actions_stream_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket, "actions")
-    try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+for ws_path, stream_type in (
+    ("/ws", "general"),
+    ("/ws/risk-stream", "risk"),
+    ("/ws/stability-stream", "stability"),
+    ("/ws/actions-stream", "actions"),
+    ("/ws/timeline-stream", "timeline"),
+):
+    app.add_api_websocket_route(ws_path, _stream_endpoint(stream_type))
 
-@app.websocket("/ws/timeline-stream")
-async def timeline_stream_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket, "timeline")
-    try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+# Both bodies are constant, so they are encoded once at import
+HOME_BYTES = orjson.dumps({
+    "status": "online",
+    "system": APP_NAME,
+    "version": VERSION,
+    "message": "PRALAYA-NET backend is operational"
+})
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "components": {
+        "api": "operational",
+        "ai_models": "loaded",
+        "orchestration": "ready"
+    }
+})
 
 @app.get("/")
-def home():
+async def home():
     """Root endpoint - health check"""
-    return {
-        "status": "online",
-        "system": APP_NAME,
-        "version": VERSION,
-        "message": "PRALAYA-NET backend is operational"
-    }
+    return Response(content=HOME_BYTES, media_type="application/json")
 
 @app.get("/api/health")
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "components": {
-            "api": "operational",
-            "ai_models": "loaded",
-            "orchestration": "ready"
-        }
-    }
+    return Response(content=HEALTH_BYTES, media_type="application/json")
 
 @app.get("/api/fallback-mode")
+@response_cache.cached(ttl=STATUS_CACHE_TTL_SEC, key="fallback_mode")
 async def enable_fallback_mode():
     """Enable fallback mode using cached historical data"""
     try:
         # Get cached data from real data ingestion
-        cached_data = await real_data_ingestion.get_cached_data()
+        cached_data = await _real_data_ingestion().get_cached_data()
         
         fallback_status = {
             'mode': 'historical_assisted',
             'enabled': True,
             'data_sources': cached_data.get('sources', ['historical_cache']),
-            'last_updated': cached_data.get('last_updated', datetime.datetime.now().isoformat()),
+            'last_updated': cached_data.get('last_updated', now_iso()),
             'message': 'Historical-Assisted Prediction Mode Active'
         }
         
-        return JSONResponse(content=fallback_status)
+        return ORJSONResponse(content=fallback_status)
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': f'Failed to enable fallback mode: {str(e)}'},
             status_code=500
         )
 
 @app.get("/api/system-status")
+@response_cache.cached(ttl=STATUS_CACHE_TTL_SEC, key="sys_status")
 async def get_system_status():
     """Get comprehensive system status including fallback mode"""
     try:
@@ -312,7 +361,7 @@ async def get_system_status():
         real_time_status = await check_real_time_apis()
         
         # Get cached data availability
-        cached_data = await real_data_ingestion.get_cached_data()
+        cached_data = await _real_data_ingestion().get_cached_data()
         
         system_status = {
             'backend_status': 'online',
@@ -327,32 +376,55 @@ async def get_system_status():
                 'data_ingestion': 'active' if real_time_status else 'cached_only',
                 'prediction_engine': 'enhanced' if real_time_status else 'basic'
             },
-            'timestamp': datetime.datetime.now().isoformat()
+            'timestamp': now_iso()
         }
         
-        return JSONResponse(content=system_status)
+        return ORJSONResponse(content=system_status)
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': f'Failed to get system status: {str(e)}'},
             status_code=500
         )
 
+# Bounded latency for upstream probes; both run concurrently under the same limit
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=1)
+# Smallest valid USGS query, should a probe fall back to GET
+_USGS_PROBE_PARAMS = {"format": "geojson", "limit": 1}
+
+async def _probe(http: aiohttp.ClientSession, url: str, params: dict = None) -> bool:
+    """True if the upstream API answers within the probe timeout, without downloading its body"""
+    try:
+        async with http.head(url, params=params, timeout=_PROBE_TIMEOUT, allow_redirects=True) as response:
+            if response.status not in (405, 501):
+                return response.status == 200
+        
+        # HEAD not supported: ask for a single byte instead
+        async with http.get(url, params=params, headers={"Range": "bytes=0-0"}, timeout=_PROBE_TIMEOUT) as response:
+            return response.status in (200, 206)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
 async def check_real_time_apis():
     """Check if real-time APIs are responding"""
     try:
-        # Test NASA FIRMS API
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://firms.modaps.eosdis.nasa.gov/api/area/csv", timeout=5) as response:
-                nasa_status = response.status == 200
+        # Test NASA FIRMS and USGS Earthquake APIs together
+        results = await asyncio.gather(
+            _probe(app.state.http, NASA_FIRMS_URL),
+            _probe(app.state.http, USGS_EARTHQUAKE_URL, _USGS_PROBE_PARAMS),
+            return_exceptions=True
+        )
+        nasa_status, usgs_status = (result is True for result in results)
         
-        # Test USGS Earthquake API
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://earthquake.usgs.gov/fdsnws/event/1/query", timeout=5) as response:
-                usgs_status = response.status == 200
+        if nasa_status and usgs_status:
+            status = 'online'
+        elif nasa_status or usgs_status:
+            status = 'limited'
+        else:
+            status = 'offline'
         
         return {
-            'status': 'online' if nasa_status and usgs_status else 'limited',
+            'status': status,
             'sources': {
                 'nasa_firms': 'online' if nasa_status else 'offline',
                 'usgs_earthquake': 'online' if usgs_status else 'offline'
@@ -372,27 +444,26 @@ async def check_real_time_apis():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": str(exc), "type": type(exc).__name__}
     )
 
 if __name__ == "__main__":
-    print("\n" + "="*70)
-    print("🚀 PRALAYA-NET Backend Starting...")
-    print("="*70)
-    # Allow overriding port via environment variables for deployment/runtime flexibility
-    env_port = os.getenv("PORT") or os.getenv("BACKEND_PORT")
-    try:
-        port = int(env_port) if env_port else int(CONFIG_PORT or 8000)
-    except Exception:
-        port = 8000
+    # PORT or BACKEND_PORT, parsed once in config
+    port = CONFIG_PORT
 
-    print(f"📍 Server: http://0.0.0.0:{port}")
-    print(f"📍 Local:  http://127.0.0.1:{port}")
-    print(f"📍 Docs:   http://127.0.0.1:{port}/docs")
-    print(f"📍 Health: http://127.0.0.1:{port}/api/health")
-    print("="*70 + "\n")
+    sys.stdout.write("\n".join([
+        "\n" + "="*70,
+        "🚀 PRALAYA-NET Backend Starting...",
+        "="*70,
+        f"📍 Server: http://0.0.0.0:{port}",
+        f"📍 Local:  http://127.0.0.1:{port}",
+        f"📍 Docs:   http://127.0.0.1:{port}/docs",
+        f"📍 Health: http://127.0.0.1:{port}/api/health",
+        "="*70 + "\n\n"
+    ]))
+    sys.stdout.flush()
     
     # Force 0.0.0.0 binding for Docker/Cloud compatibility
     host = "0.0.0.0"
@@ -401,6 +472,9 @@ if __name__ == "__main__":
         "app:app",
         host=host,
         port=port,
-        reload=True,
-        log_level="info"
+        ws="websockets",
+        reload=UVICORN_RELOAD,
+        workers=UVICORN_WORKERS,
+        access_log=False,
+        log_level=LOG_LEVEL
     )
@@ -3,7 +3,60 @@ PRALAYA-NET Backend Configuration
 Environment variables and app settings
 """
 import os
+import functools
+import numpy as np
+from types import SimpleNamespace
+from dataclasses import dataclass
 from pathlib import Path
+from dotenv import load_dotenv
+
+# Read .env before the environment is snapshotted below
+load_dotenv()
+
+
+def _parse_port(value, default: int = 8000) -> int:
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-driven settings, read from os.environ once at import"""
+    port: int
+    uvicorn_reload: bool
+    uvicorn_workers: int
+    log_level: str
+    demo_mode: bool
+    enable_demo_apis: bool
+    nasa_api_key: str
+    data_gov_key: str
+    openweather_api_key: str
+    redis_url: str
+    satellite_model_path: str
+    esp32_base_url: str
+    
+    @classmethod
+    @functools.cache
+    def from_env(cls) -> "Settings":
+        env = os.environ
+        return cls(
+            port=_parse_port(env.get("PORT") or env.get("BACKEND_PORT")),
+            uvicorn_reload=env.get("UVICORN_RELOAD", "0") == "1",
+            uvicorn_workers=int(env.get("UVICORN_WORKERS", 1)),
+            log_level=env.get("LOG_LEVEL", "warning"),
+            demo_mode=env.get("DEMO_MODE", "true").lower() == "true",
+            enable_demo_apis=env.get("ENABLE_DEMO_APIS", "1") == "1",
+            nasa_api_key=env.get("NASA_API_KEY", ""),
+            data_gov_key=env.get("DATA_GOV_KEY", ""),
+            openweather_api_key=env.get("OPENWEATHER_API_KEY", ""),
+            redis_url=env.get("REDIS_URL", ""),
+            satellite_model_path=env.get("SATELLITE_MODEL_PATH", "models/vit.int8.onnx"),
+            esp32_base_url=env.get("ESP32_BASE_URL", "http://192.168.1.100")
+        )
+
+settings = Settings.from_env()
 
 # App Information
 APP_NAME = "PRALAYA-NET Backend"
@@ -11,21 +64,23 @@ VERSION = "1.0.0"
 
 # Server Configuration
 HOST = "0.0.0.0"
-PORT = int(os.getenv("PORT", 8000))
+PORT = settings.port
+
+# Uvicorn runtime: reload and access logs are for development only.
+# loop/http stay on uvicorn's "auto", which picks uvloop/httptools when installed.
+UVICORN_RELOAD = settings.uvicorn_reload
+UVICORN_WORKERS = settings.uvicorn_workers
+LOG_LEVEL = settings.log_level
 
-# CORS Configuration - Allow all origins for development
+# CORS Configuration - local dev servers on any port plus Vercel/Netlify deployments
+# Starlette compiles the regex once; wildcard entries in allow_origins never matched
 CORS_ORIGINS = [
-    "http://localhost:5173",
-    "http://localhost:3000",
-    "http://127.0.0.1:5173",
-    "http://127.0.0.1:3000",
-    "http://0.0.0.0:5173",
-    "http://0.0.0.0:3000",
     "https://pralaya-net.vercel.app",
-    "https://*.netlify.app",
-    "https://*.vercel.app",
-    "*"  # Fallback for production
 ]
+CORS_ORIGIN_REGEX = (
+    r"https?://(localhost|127\.0\.0\.1|0\.0\.0\.0)(:\d+)?"
+    r"|https://([a-z0-9-]+\.)?(vercel\.app|netlify\.app)"
+)
 
 # Risk Thresholds
 LOW_RISK = 0.3
@@ -41,17 +96,31 @@ CRITICAL_INFRA = [
     {"id": "telecom_1", "name": "Telecom Tower", "lat": 28.5562, "lon": 77.1000, "type": "telecom"},
 ]
 
+
+def _freeze(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+# Same facilities as columns (index i is CRITICAL_INFRA[i]) for vectorized distance scans
+CRITICAL_INFRA_SOA = SimpleNamespace(
+    lat=_freeze(np.array([i["lat"] for i in CRITICAL_INFRA], dtype=np.float64)),
+    lon=_freeze(np.array([i["lon"] for i in CRITICAL_INFRA], dtype=np.float64)),
+    id=_freeze(np.array([i["id"] for i in CRITICAL_INFRA])),
+    type=_freeze(np.array([i["type"] for i in CRITICAL_INFRA]))
+)
+
 # Disaster Types
 DISASTER_TYPES = ["flood", "fire", "earthquake", "cyclone", "landslide"]
 
 # AI Model Parameters
 SATELLITE_IMAGE_SIZE = (224, 224)
+SATELLITE_MODEL_PATH = settings.satellite_model_path
 FLOOD_PREDICTION_HORIZON = 24  # hours
 GNN_UPDATE_INTERVAL = 5  # seconds
 
 # ESP32 Configuration
 ESP32_POLL_INTERVAL = 10  # seconds
-ESP32_BASE_URL = os.getenv("ESP32_BASE_URL", "http://192.168.1.100")
+ESP32_BASE_URL = settings.esp32_base_url
 
 # Drone Configuration
 DRONE_UPDATE_INTERVAL = 2  # seconds
@@ -64,9 +133,9 @@ DATA_PROCESSED_PATH = "data/processed"
 DATA_SIMULATED_PATH = "data/simulated"
 
 # API Keys (from environment variables)
-NASA_API_KEY = os.getenv("NASA_API_KEY", "")
-DATA_GOV_KEY = os.getenv("DATA_GOV_KEY", "")
-OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
+NASA_API_KEY = settings.nasa_api_key
+DATA_GOV_KEY = settings.data_gov_key
+OPENWEATHER_API_KEY = settings.openweather_api_key
 
 # Real-time Data Sources
 NASA_FIRMS_URL = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
@@ -79,6 +148,18 @@ OPENWEATHER_ALERTS_URL = "https://api.openweathermap.org/data/3.0/onecall"
 INGESTION_INTERVAL_SEC = 300  # 5 minutes
 CACHE_TTL_SEC = 3600  # 1 hour
 
+# Upstream responses per ~1km cell (coordinates rounded to 2 decimals)
+WEATHER_CACHE_TTL_SEC = 300
+NASA_POWER_CACHE_TTL_SEC = 3600  # climate data changes slowly
+UPSTREAM_CACHE_SIZE = 1024
+
+# Shared response cache across workers (optional, needs the redis package)
+REDIS_URL = settings.redis_url
+STATUS_CACHE_TTL_SEC = 15
+
 # Demo Mode
-DEMO_MODE = os.getenv("DEMO_MODE", "true").lower() == "true"
+DEMO_MODE = settings.demo_mode
+
+# Demo, explainability and replay routers; set to 0 on production workers
+ENABLE_DEMO_APIS = settings.enable_demo_apis
 
@@ -3,21 +3,28 @@ PRALAYA-NET Demo Backend - Emergency Production Engine
 Reliable backend for hackathon demo with guaranteed startup
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
 import os
+import orjson
+import numpy as np
 import asyncio
 import random
+import time
+import functools
+import itertools
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set
 
 # Create FastAPI app
 app = FastAPI(
     title="PRALAYA-NET Demo Backend",
     version="1.0.0",
-    description="Emergency Production Backend for Hackathon Demo"
+    description="Emergency Production Backend for Hackathon Demo",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration - Allow all origins for demo
@@ -39,107 +46,228 @@ demo_data = {
     "crisis_events": []
 }
 
+def ttl_cache(ttl: float):
+    """Reuse an argument-less generator's last result for `ttl` seconds"""
+    def decorator(fn):
+        state = {"expires": 0.0, "value": None}
+        
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if now >= state["expires"]:
+                state["value"] = fn()
+                state["expires"] = now + ttl
+            return state["value"]
+        return wrapper
+    return decorator
+
+_ts_cache = {"t": 0.0, "s": ""}
+
+def now_iso() -> str:
+    """Local ISO timestamp, reformatted at most every 100ms"""
+    t = time.monotonic()
+    if t - _ts_cache["t"] > 0.1:
+        _ts_cache["s"] = datetime.now().isoformat()
+        _ts_cache["t"] = t
+    return _ts_cache["s"]
+
+# Choice tables for the mock generators
+_RISK_LEVELS = ("low", "medium", "high", "critical")
+_TRENDS = ("improving", "stable", "declining")
+_ALERT_TYPES = ("infrastructure_monitoring", "risk_assessment", "system_check", "autonomous_response")
+_EVENT_TYPES = ("system_check", "agent_update", "risk_assessment", "infrastructure_alert", "autonomous_action")
+_SEVERITIES = ("info", "warning", "critical")
+_CITIES = ("Mumbai", "Delhi", "Chennai", "Kolkata", "Bangalore")
+_TIMELINE_LOCATIONS = ("National", "Mumbai", "Delhi", "Chennai")
+
+# One generator per process; each mock call is a single vectorized fill
+_rng = np.random.default_rng()
+
+# Scalar picks from the constant tuples go through a private Random's randrange
+_random = random.Random()
+_randrange = _random.randrange
+
+# Bounds for risk_score, confidence and the four risk factor weights
+_RISK_LOW = np.array([0.2, 0.7, 0.1, 0.0, 0.2, 0.05])
+_RISK_HIGH = np.array([0.8, 0.95, 0.4, 0.3, 0.5, 0.15])
+
+# Stability factors, their weights in the overall score, and their draw bounds
+_STABILITY_KEYS = ("infrastructure_health", "disaster_risk", "agent_response_capacity", "temporal_stability")
+_STABILITY_WEIGHTS = np.array([0.35, 0.30, 0.20, 0.15])
+_STABILITY_LOW = np.array([0.6, 0.2, 0.7, 0.4])
+_STABILITY_HIGH = np.array([0.9, 0.5, 0.95, 0.8])
+
+# Upper bounds for the per-row table indices drawn below
+_ALERT_CHOICES = np.array([len(_ALERT_TYPES), len(_SEVERITIES), len(_ALERT_TYPES), len(_CITIES)])
+_EVENT_CHOICES = np.array([len(_EVENT_TYPES), len(_EVENT_TYPES), len(_SEVERITIES), len(_TIMELINE_LOCATIONS)])
+
 # Mock data generators
+@ttl_cache(1.0)
 def generate_mock_risk_data():
     """Generate mock risk prediction data"""
+    risk_score, confidence, rainfall, earthquake, infrastructure, historical = (
+        _rng.uniform(_RISK_LOW, _RISK_HIGH).tolist()
+    )
     return {
-        "risk_score": round(random.uniform(0.2, 0.8), 3),
-        "risk_level": random.choice(["low", "medium", "high", "critical"]),
-        "confidence": round(random.uniform(0.7, 0.95), 2),
+        "risk_score": round(risk_score, 3),
+        "risk_level": _RISK_LEVELS[_randrange(len(_RISK_LEVELS))],
+        "confidence": round(confidence, 2),
         "factors": {
-            "rainfall_weight": round(random.uniform(0.1, 0.4), 3),
-            "earthquake_weight": round(random.uniform(0.0, 0.3), 3),
-            "infrastructure_weight": round(random.uniform(0.2, 0.5), 3),
-            "historical_weight": round(random.uniform(0.05, 0.15), 3)
+            "rainfall_weight": round(rainfall, 3),
+            "earthquake_weight": round(earthquake, 3),
+            "infrastructure_weight": round(infrastructure, 3),
+            "historical_weight": round(historical, 3)
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
+@ttl_cache(1.0)
 def generate_mock_stability_data():
     """Generate mock stability index data"""
-    factors = {
-        'infrastructure_health': random.uniform(0.6, 0.9),
-        'disaster_risk': random.uniform(0.2, 0.5),
-        'agent_response_capacity': random.uniform(0.7, 0.95),
-        'temporal_stability': random.uniform(0.4, 0.8)
-    }
-    
-    weights = {
-        'infrastructure_health': 0.35,
-        'disaster_risk': 0.30,
-        'agent_response_capacity': 0.20,
-        'temporal_stability': 0.15
-    }
-    
-    overall_score = sum(factors[k] * weights[k] for k in factors)
+    factors = _rng.uniform(_STABILITY_LOW, _STABILITY_HIGH)
+    overall_score = float(factors @ _STABILITY_WEIGHTS)
     
     return {
         "stability_index": {
             "overall_score": round(overall_score, 3),
             "level": "excellent" if overall_score > 0.8 else "healthy" if overall_score > 0.6 else "warning",
-            "factors": {k: round(v, 3) for k, v in factors.items()},
-            "trend": random.choice(["improving", "stable", "declining"]),
-            "timestamp": datetime.now().isoformat()
+            "factors": dict(zip(_STABILITY_KEYS, np.round(factors, 3).tolist())),
+            "trend": _TRENDS[_randrange(len(_TRENDS))],
+            "timestamp": now_iso()
         }
     }
 
+@ttl_cache(2.0)
 def generate_mock_alerts():
     """Generate mock active alerts"""
-    alert_types = ["infrastructure_monitoring", "risk_assessment", "system_check", "autonomous_response"]
-    alerts = []
+    now = datetime.now()
+    alert_id_suffix = now.strftime('%H%M%S')
+    n = int(_rng.integers(2, 6))
+    choices = _rng.integers(0, _ALERT_CHOICES, size=(n, 4)).tolist()
+    progress = np.round(_rng.uniform(0.3, 0.9, size=n), 2).tolist()
+    minutes_ago = _rng.integers(1, 31, size=n).tolist()
     
-    for i in range(random.randint(2, 5)):
-        alerts.append({
-            "alert_id": f"alert_{i}_{datetime.now().strftime('%H%M%S')}",
-            "alert_type": random.choice(alert_types),
-            "severity": random.choice(["info", "warning", "critical"]),
-            "description": f"Autonomous {random.choice(alert_types)} in progress",
-            "location": random.choice(["Mumbai", "Delhi", "Chennai", "Kolkata", "Bangalore"]),
-            "progress": round(random.uniform(0.3, 0.9), 2),
-            "timestamp": (datetime.now() - timedelta(minutes=random.randint(1, 30))).isoformat()
-        })
-    
-    return alerts
+    return [
+        {
+            "alert_id": f"alert_{i}_{alert_id_suffix}",
+            "alert_type": _ALERT_TYPES[alert_type],
+            "severity": _SEVERITIES[severity],
+            "description": f"Autonomous {_ALERT_TYPES[activity]} in progress",
+            "location": _CITIES[city],
+            "progress": progress[i],
+            "timestamp": now - timedelta(minutes=minutes_ago[i])
+        }
+        for i, (alert_type, severity, activity, city) in enumerate(choices)
+    ]
+
+# Crisis timeline: a fixed-size ring of events, newest appended last
+TIMELINE_SIZE = 64
+TIMELINE_TICK_SEC = 2
+_timeline: deque = deque(maxlen=TIMELINE_SIZE)
+_timeline_seq = itertools.count()
+
+def _make_event(timestamp: datetime) -> Dict[str, Any]:
+    event_type, activity, severity, location = _rng.integers(0, _EVENT_CHOICES).tolist()
+    return {
+        "event_id": f"event_{next(_timeline_seq)}",
+        "event_type": _EVENT_TYPES[event_type],
+        "description": f"System performing {_EVENT_TYPES[activity]}",
+        "severity": _SEVERITIES[severity],
+        "location": _TIMELINE_LOCATIONS[location],
+        "timestamp": timestamp
+    }
+
+def _seed_timeline():
+    """Backfill 5-10 events from the past hour, oldest first"""
+    now = datetime.now()
+    for minutes_ago in np.sort(_rng.integers(1, 61, size=int(_rng.integers(5, 11))))[::-1].tolist():
+        _timeline.append(_make_event(now - timedelta(minutes=minutes_ago)))
+
+async def timeline_loop():
+    """Append one live event per tick; the deque drops the oldest"""
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + TIMELINE_TICK_SEC
+    while True:
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        next_tick = max(next_tick + TIMELINE_TICK_SEC, loop.time())
+        _timeline.append(_make_event(datetime.now()))
 
 def generate_mock_timeline():
-    """Generate mock crisis timeline events"""
-    event_types = ["system_check", "agent_update", "risk_assessment", "infrastructure_alert", "autonomous_action"]
-    events = []
-    
-    for i in range(random.randint(5, 10)):
-        events.append({
-            "event_id": f"event_{i}",
-            "event_type": random.choice(event_types),
-            "description": f"System performing {random.choice(event_types)}",
-            "severity": random.choice(["info", "warning", "critical"]),
-            "location": random.choice(["National", "Mumbai", "Delhi", "Chennai"]),
-            "timestamp": (datetime.now() - timedelta(minutes=random.randint(1, 60))).isoformat()
-        })
-    
-    return sorted(events, key=lambda x: x['timestamp'], reverse=True)
+    """Current crisis timeline events, newest first"""
+    return list(reversed(_timeline))
+
+_seed_timeline()
+
+# Constant envelopes are encoded once; only the trailing timestamp is spliced in per request
+def timestamped_envelope(body: Dict[str, Any]) -> bytes:
+    """Encode `body` with an open trailing "timestamp" string field"""
+    return orjson.dumps(body)[:-1] + b',"timestamp":"'
+
+def envelope_response(prefix: bytes) -> Response:
+    return Response(content=prefix + now_iso().encode() + b'"}', media_type="application/json")
+
+HEALTH_PREFIX = timestamped_envelope({
+    "status": "ok",
+    "service": "PRALAYA-NET Demo Backend"
+})
+
+API_HEALTH_PREFIX = timestamped_envelope({
+    "status": "healthy",
+    "components": {
+        "api": "operational",
+        "demo_mode": "active",
+        "mock_data": "ready"
+    }
+})
+
+SYSTEM_STATUS_PREFIX = timestamped_envelope({
+    "backend_status": "online",
+    "demo_mode": "active",
+    "real_time_apis": {
+        "status": "simulated",
+        "sources": {
+            "nasa_firms": "demo_mode",
+            "usgs_earthquake": "demo_mode"
+        }
+    },
+    "data_sources": {
+        "real_time": ["demo_simulation"],
+        "cached": ["mock_patterns"]
+    },
+    "services": {
+        "stability_index": "active",
+        "data_ingestion": "demo_mode",
+        "prediction_engine": "active"
+    }
+})
+
+ROOT_BYTES = orjson.dumps({
+    "message": "PRALAYA-NET Demo Backend",
+    "status": "operational",
+    "version": "1.0.0",
+    "demo_mode": "active",
+    "endpoints": {
+        "health": "/health",
+        "api_health": "/api/health",
+        "demo_status": "/demo/status",
+        "risk_predict": "/risk/predict",
+        "api_risk_predict": "/api/risk/predict",
+        "stability": "/api/stability/current",
+        "alerts": "/api/alerts/active",
+        "timeline": "/api/timeline/events"
+    }
+})
 
 # Required endpoints
 @app.get("/health")
 async def health_check():
     """Basic health check endpoint"""
-    return {
-        "status": "ok",
-        "timestamp": datetime.now().isoformat(),
-        "service": "PRALAYA-NET Demo Backend"
-    }
+    return envelope_response(HEALTH_PREFIX)
 
 @app.get("/api/health")
 async def api_health_check():
     """API health check endpoint"""
-    return {
-        "status": "healthy",
-        "components": {
-            "api": "operational",
-            "demo_mode": "active",
-            "mock_data": "ready"
-        },
-        "timestamp": datetime.now().isoformat()
-    }
+    return envelope_response(API_HEALTH_PREFIX)
 
 @app.get("/demo/status")
 async def demo_status():
@@ -151,7 +279,7 @@ async def demo_status():
         "mock_data_available": True,
         "active_alerts": len(generate_mock_alerts()),
         "stability_score": demo_data["stability_score"],
-        "last_update": datetime.now().isoformat()
+        "last_update": now_iso()
     }
 
 @app.get("/risk/predict")
@@ -173,120 +301,154 @@ async def get_current_stability():
 @app.get("/api/alerts/active")
 async def get_active_alerts():
     """Get active alerts"""
+    alerts = generate_mock_alerts()
     return {
-        "alerts": generate_mock_alerts(),
-        "total_count": len(generate_mock_alerts()),
-        "timestamp": datetime.now().isoformat()
+        "alerts": alerts,
+        "total_count": len(alerts),
+        "timestamp": now_iso()
     }
 
 @app.get("/api/timeline/events")
 async def get_timeline_events():
     """Get crisis timeline events"""
+    events = generate_mock_timeline()
     return {
-        "events": generate_mock_timeline(),
-        "total_count": len(generate_mock_timeline()),
-        "timestamp": datetime.now().isoformat()
+        "events": events,
+        "total_count": len(events),
+        "timestamp": now_iso()
     }
 
 @app.get("/api/system/status")
 async def get_system_status():
     """Get comprehensive system status"""
-    return {
-        "backend_status": "online",
-        "demo_mode": "active",
-        "real_time_apis": {
-            "status": "simulated",
-            "sources": {
-                "nasa_firms": "demo_mode",
-                "usgs_earthquake": "demo_mode"
-            }
-        },
-        "data_sources": {
-            "real_time": ["demo_simulation"],
-            "cached": ["mock_patterns"]
-        },
-        "services": {
-            "stability_index": "active",
-            "data_ingestion": "demo_mode",
-            "prediction_engine": "active"
-        },
-        "timestamp": datetime.now().isoformat()
-    }
+    return envelope_response(SYSTEM_STATUS_PREFIX)
 
 # WebSocket endpoints for real-time demo
+STREAM_QUEUE_SIZE = 4
+
+class Broadcaster:
+    """
+    One publisher task per stream generates each update once and fans it
+    out to every connected client's small queue. Each payload stays its
+    own frame since clients dispatch on its "type".
+    """
+
+    def __init__(self, produce, interval: float):
+        self.produce = produce
+        self.interval = interval
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    async def publish_loop(self):
+        loop = asyncio.get_running_loop()
+        # Random first offset so the streams don't all wake together, then a
+        # fixed cadence that doesn't drift by the time spent publishing
+        next_tick = loop.time() + _random.random() * self.interval
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            next_tick = max(next_tick + self.interval, loop.time())
+            if not self.subscribers:
+                continue
+            payload = self.produce()
+            if payload is None:
+                continue
+            text = orjson.dumps(payload).decode()
+            for queue in self.subscribers:
+                if queue.full():
+                    # Slow client: drop its oldest update
+                    queue.get_nowait()
+                queue.put_nowait(text)
+
+    async def stream_to(self, websocket: WebSocket):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        try:
+            while True:
+                ready = [await queue.get()]
+                while not queue.empty():
+                    ready.append(queue.get_nowait())
+                for text in ready:
+                    await websocket.send_text(text)
+        finally:
+            self.subscribers.discard(queue)
+
+def _latest_action():
+    alerts = generate_mock_alerts()
+    if alerts:
+        return {
+            "type": "action_update",
+            "data": alerts[0]  # Send latest alert
+        }
+
+def _latest_event():
+    if _timeline:
+        return {
+            "type": "event",
+            "data": _timeline[-1]  # Send latest event
+        }
+
+ping_stream = Broadcaster(lambda: {"type": "ping", "timestamp": now_iso()}, 5)
+risk_stream = Broadcaster(lambda: {"type": "risk_update", "data": generate_mock_risk_data()}, 10)
+stability_stream = Broadcaster(lambda: {"type": "stability_update", "data": generate_mock_stability_data()}, 10)
+actions_stream = Broadcaster(_latest_action, 15)
+timeline_stream = Broadcaster(_latest_event, 20)
+
+_publisher_tasks: Set[asyncio.Task] = set()
+
+@app.on_event("startup")
+async def start_publishers():
+    """Start one publisher per stream, shared by all connected clients"""
+    for stream in (ping_stream, risk_stream, stability_stream, actions_stream, timeline_stream):
+        _publisher_tasks.add(asyncio.create_task(stream.publish_loop()))
+    _publisher_tasks.add(asyncio.create_task(timeline_loop()))
+
+@app.on_event("shutdown")
+async def stop_publishers():
+    for task in _publisher_tasks:
+        task.cancel()
+    _publisher_tasks.clear()
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket):
+async def websocket_endpoint(websocket: WebSocket):
     """General WebSocket endpoint"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(5)
-            await websocket.send_json({
-                "type": "ping",
-                "timestamp": datetime.now().isoformat()
-            })
+        await ping_stream.stream_to(websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
 
 @app.websocket("/ws/risk-stream")
-async def risk_stream_endpoint(websocket):
+async def risk_stream_endpoint(websocket: WebSocket):
     """Risk data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(10)
-            risk_data = generate_mock_risk_data()
-            await websocket.send_json({
-                "type": "risk_update",
-                "data": risk_data
-            })
+        await risk_stream.stream_to(websocket)
     except Exception as e:
         print(f"Risk stream error: {e}")
 
 @app.websocket("/ws/stability-stream")
-async def stability_stream_endpoint(websocket):
+async def stability_stream_endpoint(websocket: WebSocket):
     """Stability data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(10)
-            stability_data = generate_mock_stability_data()
-            await websocket.send_json({
-                "type": "stability_update",
-                "data": stability_data
-            })
+        await stability_stream.stream_to(websocket)
     except Exception as e:
         print(f"Stability stream error: {e}")
 
 @app.websocket("/ws/actions-stream")
-async def actions_stream_endpoint(websocket):
+async def actions_stream_endpoint(websocket: WebSocket):
     """Actions data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(15)
-            alerts = generate_mock_alerts()
-            if alerts:
-                await websocket.send_json({
-                    "type": "action_update",
-                    "data": alerts[0]  # Send latest alert
-                })
+        await actions_stream.stream_to(websocket)
     except Exception as e:
         print(f"Actions stream error: {e}")
 
 @app.websocket("/ws/timeline-stream")
-async def timeline_stream_endpoint(websocket):
+async def timeline_stream_endpoint(websocket: WebSocket):
     """Timeline data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(20)
-            events = generate_mock_timeline()
-            if events:
-                await websocket.send_json({
-                    "type": "event",
-                    "data": events[0]  # Send latest event
-                })
+        await timeline_stream.stream_to(websocket)
     except Exception as e:
         print(f"Timeline stream error: {e}")
 
@@ -294,33 +456,18 @@ async def timeline_stream_endpoint(websocket):
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "PRALAYA-NET Demo Backend",
-        "status": "operational",
-        "version": "1.0.0",
-        "demo_mode": "active",
-        "endpoints": {
-            "health": "/health",
-            "api_health": "/api/health",
-            "demo_status": "/demo/status",
-            "risk_predict": "/risk/predict",
-            "api_risk_predict": "/api/risk/predict",
-            "stability": "/api/stability/current",
-            "alerts": "/api/alerts/active",
-            "timeline": "/api/timeline/events"
-        }
-    }
+    return Response(content=ROOT_BYTES, media_type="application/json")
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": str(exc),
             "type": type(exc).__name__,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "demo_mode": "active"
         }
     )
@@ -334,10 +481,13 @@ if __name__ == "__main__":
     print(f"📍 Risk Predict: http://127.0.0.1:{port}/risk/predict")
     print("🎯 DEMO MODE ACTIVE - Mock Data Ready")
 
+    # loop/http stay on "auto": uvloop and httptools from uvicorn[standard] where supported
     uvicorn.run(
         "demo_main:app",
         host="0.0.0.0",
         port=port,
+        ws="websockets",
         reload=False,  # Disable reload for stability
-        log_level="info"
+        access_log=False,
+        log_level=os.environ.get("LOG_LEVEL", "warning")
     )
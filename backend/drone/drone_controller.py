@@ -2,57 +2,123 @@
 Drone Controller - Manages drone fleet and commands
 """
 
-from typing import Dict, List, Optional
-import random
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
 import math
+import numpy as np
 from datetime import datetime, timedelta
-from drone.slam_mode import slam_controller
+from drone.slam_mode import slam_controller, DESCRIPTOR_SIZE
 from drone.telemetry import telemetry_gen
 from config import DRONE_MAX_ALTITUDE
 from ai.space_weather import space_weather_monitor
 
+_rng = np.random.default_rng()
+
+INITIAL_FLEET_CAPACITY = 32
+
+@dataclass(slots=True)
+class Drone:
+    id: str
+    lat: float
+    lon: float
+    slam_enabled: bool
+    gps_available: bool
+    deployed_at: str
+    last_update: str
+    status: str = "deployed"
+    altitude: float = 0
+    battery: float = 100.0
+    mission: str = "standby"
+    velocity_lat: float = 0.0
+    velocity_lon: float = 0.0
+    velocity_altitude: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "location": {"lat": self.lat, "lon": self.lon},
+            "altitude": self.altitude,
+            "battery": self.battery,
+            "slam_enabled": self.slam_enabled,
+            "gps_available": self.gps_available,
+            "mission": self.mission,
+            "deployed_at": self.deployed_at,
+            "last_update": self.last_update,
+            "velocity": {
+                "lat": self.velocity_lat,
+                "lon": self.velocity_lon,
+                "altitude": self.velocity_altitude
+            }
+        }
+
 class DroneController:
     """
     Controls drone fleet operations with intelligent behavior
     """
     
     def __init__(self):
-        self.drones = {}
+        self.drones: Dict[str, Drone] = {}
         self.active_missions = {}
         self.telemetry_update_interval = 2.0  # seconds
+        
+        # Fleet positions as columns (row i is drone self._ids[i]) for the per-tick batch step
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._lat = np.empty(INITIAL_FLEET_CAPACITY)
+        self._lon = np.empty(INITIAL_FLEET_CAPACITY)
+        self._target_lat = np.empty(INITIAL_FLEET_CAPACITY)
+        self._target_lon = np.empty(INITIAL_FLEET_CAPACITY)
+        self._battery = np.empty(INITIAL_FLEET_CAPACITY)
+        self._flying = np.zeros(INITIAL_FLEET_CAPACITY, dtype=bool)
+        self._on_mission = np.zeros(INITIAL_FLEET_CAPACITY, dtype=bool)
+    
+    def _add_row(self, drone_id: str, lat: float, lon: float):
+        """Append a drone to the fleet columns, doubling them when full"""
+        row = len(self._ids)
+        if row == len(self._lat):
+            for name in ("_lat", "_lon", "_target_lat", "_target_lon", "_battery", "_flying", "_on_mission"):
+                column = getattr(self, name)
+                grown = np.zeros(len(column) * 2, dtype=column.dtype)
+                grown[:row] = column
+                setattr(self, name, grown)
+        
+        self._ids.append(drone_id)
+        self._rows[drone_id] = row
+        self._lat[row] = self._target_lat[row] = lat
+        self._lon[row] = self._target_lon[row] = lon
+        self._battery[row] = 100.0
+        self._flying[row] = False
+        self._on_mission[row] = False
     
     def deploy_drone(self, location: Dict) -> str:
         """
         Deploy a new drone to a location
         """
-        drone_id = f"drone_{len(self.drones) + 1}_{datetime.now().strftime('%H%M%S')}"
+        now = datetime.now()
+        timestamp = now.isoformat()
+        drone_id = f"drone_{len(self.drones) + 1}_{now.strftime('%H%M%S')}"
         
         # Check if GPS is available
         gps_available = space_weather_monitor.is_gps_available()
         slam_required = not gps_available
         
-        self.drones[drone_id] = {
-            "id": drone_id,
-            "status": "deployed",
-            "location": location.copy(),
-            "altitude": 0,
-            "battery": 100.0,
-            "slam_enabled": slam_required,
-            "gps_available": gps_available,
-            "mission": "standby",
-            "deployed_at": datetime.now().isoformat(),
-            "last_update": datetime.now().isoformat(),
-            "velocity": {
-                "lat": 0.0,
-                "lon": 0.0,
-                "altitude": 0.0
-            }
-        }
+        lat, lon = location["lat"], location["lon"]
+        self.drones[drone_id] = Drone(
+            id=drone_id,
+            lat=lat,
+            lon=lon,
+            slam_enabled=slam_required,
+            gps_available=gps_available,
+            deployed_at=timestamp,
+            last_update=timestamp
+        )
+        
+        self._add_row(drone_id, lat, lon)
         
         # Initialize telemetry
-        telemetry_gen.telemetry_data[drone_id] = {
-            "drone_id": drone_id,
-            "location": location.copy(),
+        telemetry_gen.init_telemetry(drone_id, {
+            "location": {"lat": lat, "lon": lon},
             "altitude": 0,
             "speed": 0,
             "heading": 0,
@@ -61,8 +127,8 @@ class DroneController:
             "gps_status": "active" if gps_available else "failed",
             "slam_status": "active" if slam_required else "inactive",
             "camera_status": "active",
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": timestamp
+        })
         
         # Enable SLAM if needed
         if slam_required:
@@ -83,116 +149,148 @@ class DroneController:
         params = params or {}
         
         if action == "takeoff":
-            drone["status"] = "flying"
-            drone["altitude"] = params.get("altitude", 50)
-            drone["mission"] = params.get("mission", "reconnaissance")
+            drone.status = "flying"
+            drone.altitude = params.get("altitude", 50)
+            drone.mission = params.get("mission", "reconnaissance")
+            self._flying[self._rows[drone_id]] = True
+            self._on_mission[self._rows[drone_id]] = drone.mission != "standby"
             
             # Update telemetry
-            if drone_id in telemetry_gen.telemetry_data:
-                telemetry_gen.telemetry_data[drone_id]["altitude"] = drone["altitude"]
-                telemetry_gen.telemetry_data[drone_id]["status"] = "flying"
+            if drone_id in telemetry_gen:
+                telemetry_gen.update_telemetry(drone_id, {"altitude": drone.altitude, "status": "flying"})
         
         elif action == "land":
-            drone["status"] = "landed"
-            drone["altitude"] = 0
-            drone["mission"] = "standby"
+            drone.status = "landed"
+            drone.altitude = 0
+            drone.mission = "standby"
+            self._flying[self._rows[drone_id]] = False
+            self._on_mission[self._rows[drone_id]] = False
             
-            if drone_id in telemetry_gen.telemetry_data:
-                telemetry_gen.telemetry_data[drone_id]["altitude"] = 0
-                telemetry_gen.telemetry_data[drone_id]["status"] = "landed"
+            if drone_id in telemetry_gen:
+                telemetry_gen.update_telemetry(drone_id, {"altitude": 0, "status": "landed"})
         
         elif action == "move":
-            target_lat = params.get("lat", drone["location"]["lat"])
-            target_lon = params.get("lon", drone["location"]["lon"])
+            target_lat = params.get("lat", drone.lat)
+            target_lon = params.get("lon", drone.lon)
             
             # Calculate heading and velocity
-            lat_diff = target_lat - drone["location"]["lat"]
-            lon_diff = target_lon - drone["location"]["lon"]
+            lat_diff = target_lat - drone.lat
+            lon_diff = target_lon - drone.lon
             
             distance = math.sqrt(lat_diff**2 + lon_diff**2)
             heading = math.degrees(math.atan2(lon_diff, lat_diff))
             if heading < 0:
                 heading += 360
             
-            # Simulate movement (gradual update)
-            drone["location"]["lat"] += lat_diff * 0.1
-            drone["location"]["lon"] += lon_diff * 0.1
+            # Simulate movement (gradual update); flying drones keep closing in each tick
+            row = self._rows[drone_id]
+            self._target_lat[row] = target_lat
+            self._target_lon[row] = target_lon
+            self._lat[row] += lat_diff * 0.1
+            self._lon[row] += lon_diff * 0.1
+            drone.lat = float(self._lat[row])
+            drone.lon = float(self._lon[row])
             
-            drone["velocity"]["lat"] = lat_diff * 0.001  # m/s equivalent
-            drone["velocity"]["lon"] = lon_diff * 0.001
+            drone.velocity_lat = lat_diff * 0.001  # m/s equivalent
+            drone.velocity_lon = lon_diff * 0.001
             
-            if drone_id in telemetry_gen.telemetry_data:
-                telemetry_gen.telemetry_data[drone_id]["location"]["lat"] = drone["location"]["lat"]
-                telemetry_gen.telemetry_data[drone_id]["location"]["lon"] = drone["location"]["lon"]
-                telemetry_gen.telemetry_data[drone_id]["heading"] = heading
-                telemetry_gen.telemetry_data[drone_id]["speed"] = min(distance * 1000, 15)  # m/s
+            if drone_id in telemetry_gen:
+                telemetry_gen.update_telemetry(drone_id, {
+                    "location": {"lat": drone.lat, "lon": drone.lon},
+                    "heading": heading,
+                    "speed": min(distance * 1000, 15)  # m/s
+                })
         
         elif action == "slam_enable":
-            drone["slam_enabled"] = True
+            drone.slam_enabled = True
             slam_controller.enable_slam(drone_id)
             telemetry_gen.set_slam_status(drone_id, "active")
             telemetry_gen.set_gps_status(drone_id, "failed")
         
         elif action == "slam_disable":
-            drone["slam_enabled"] = False
+            drone.slam_enabled = False
             slam_controller.disable_slam(drone_id)
             if space_weather_monitor.is_gps_available():
                 telemetry_gen.set_slam_status(drone_id, "inactive")
                 telemetry_gen.set_gps_status(drone_id, "active")
         
-        drone["last_update"] = datetime.now().isoformat()
+        drone.last_update = datetime.now().isoformat()
         
         return {
             "status": "success",
             "drone_id": drone_id,
             "action": action,
-            "drone_status": drone["status"],
-            "timestamp": datetime.now().isoformat()
+            "drone_status": drone.status,
+            "timestamp": drone.last_update
         }
     
     def update_drone_positions(self):
         """Update all active drones' positions (called periodically)"""
-        for drone_id, drone in self.drones.items():
-            if drone["status"] == "flying":
-                # Simulate movement if on mission
-                if drone["mission"] != "standby":
-                    # Add small random movement
-                    drone["location"]["lat"] += random.uniform(-0.0001, 0.0001)
-                    drone["location"]["lon"] += random.uniform(-0.0001, 0.0001)
-                    
-                    # Update battery drain
-                    drone["battery"] = max(0, drone["battery"] - 0.05)
-                    
-                    # Update telemetry
-                    if drone_id in telemetry_gen.telemetry_data:
-                        telemetry = telemetry_gen.telemetry_data[drone_id]
-                        telemetry["location"] = drone["location"].copy()
-                        telemetry["battery"] = drone["battery"]
-                        telemetry["altitude"] = drone["altitude"]
-                        telemetry["timestamp"] = datetime.now().isoformat()
-                        
-                        # Update SLAM map points if SLAM is active
-                        if drone["slam_enabled"]:
-                            slam_controller.add_map_point(drone_id, {
-                                "x": drone["location"]["lat"],
-                                "y": drone["location"]["lon"],
-                                "z": drone["altitude"],
-                                "descriptor": [random.uniform(0, 1) for _ in range(64)]
-                            })
-                
-                drone["last_update"] = datetime.now().isoformat()
+        n = len(self._ids)
+        flying = self._flying[:n]
+        if not flying.any():
+            return
+        on_mission = self._on_mission[:n]
+        lat, lon, battery = self._lat[:n], self._lon[:n], self._battery[:n]
+        
+        # Close 10% of the remaining distance to each flying drone's move target
+        lat_diff = np.where(flying, self._target_lat[:n] - lat, 0.0)
+        lon_diff = np.where(flying, self._target_lon[:n] - lon, 0.0)
+        moving = (lat_diff != 0) | (lon_diff != 0)
+        speed = np.minimum(np.hypot(lat_diff, lon_diff) * 1000, 15)  # m/s
+        heading = np.degrees(np.arctan2(lon_diff, lat_diff)) % 360
+        lat += lat_diff * 0.1
+        lon += lon_diff * 0.1
+        
+        # Small random movement and battery drain for drones on a mission
+        jitter = _rng.uniform(-0.0001, 0.0001, size=(2, n)) * on_mission
+        lat += jitter[0]
+        lon += jitter[1]
+        battery[on_mission] = np.maximum(0, battery[on_mission] - 0.05)
+        
+        now = datetime.now().isoformat()
+        rows = np.flatnonzero(flying)
+        
+        # Update telemetry for the whole flying set in one write per column
+        tracked = [row for row in rows.tolist() if self._ids[row] in telemetry_gen]
+        telemetry_gen.update_fleet(
+            [self._ids[row] for row in tracked], now,
+            lat=lat[tracked], lon=lon[tracked], battery=battery[tracked], speed=speed[tracked],
+            altitude=[self.drones[self._ids[row]].altitude for row in tracked]
+        )
+        turning = [row for row in tracked if moving[row]]
+        telemetry_gen.update_fleet([self._ids[row] for row in turning], now, heading=heading[turning])
+        
+        for row, row_lat, row_lon, row_battery in zip(
+            rows.tolist(), lat[rows].tolist(), lon[rows].tolist(), battery[rows].tolist()
+        ):
+            drone_id = self._ids[row]
+            drone = self.drones[drone_id]
+            drone.lat = row_lat
+            drone.lon = row_lon
+            drone.battery = row_battery
+            drone.last_update = now
+            
+            # Update SLAM map points if SLAM is active
+            if drone.slam_enabled and drone.mission != "standby":
+                slam_controller.add_map_point(drone_id, {
+                    "x": row_lat,
+                    "y": row_lon,
+                    "z": drone.altitude,
+                    "descriptor": _rng.random(DESCRIPTOR_SIZE, dtype=np.float32)
+                })
     
     def get_drone(self, drone_id: str) -> Optional[Dict]:
         """Get drone status"""
         if drone_id in self.drones:
-            return self.drones[drone_id].copy()
+            return self.drones[drone_id].to_dict()
         return None
     
     def get_all_drones(self) -> List[Dict]:
         """Get all drones with current status"""
         # Update positions before returning
         self.update_drone_positions()
-        return [d.copy() for d in self.drones.values()]
+        return [d.to_dict() for d in self.drones.values()]
     
     def get_slam_status(self, drone_id: str) -> Optional[Dict]:
         """Get V-SLAM status for a drone"""
@@ -204,10 +302,10 @@ class DroneController:
         
         return {
             "drone_id": drone_id,
-            "slam_enabled": drone.get("slam_enabled", False),
-            "gps_available": drone.get("gps_available", True),
+            "slam_enabled": drone.slam_enabled,
+            "gps_available": drone.gps_available,
             "slam_status": slam_status,
-            "navigation_mode": "V-SLAM" if drone.get("slam_enabled") else "GPS"
+            "navigation_mode": "V-SLAM" if drone.slam_enabled else "GPS"
         }
     
     def enable_slam(self, drone_id: str) -> bool:
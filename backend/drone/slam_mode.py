@@ -2,9 +2,16 @@
 V-SLAM Mode - Visual SLAM controller for GPS-denied navigation
 """
 
+import time
+import numpy as np
 from typing import Dict, Optional
 from datetime import datetime
 
+DESCRIPTOR_SIZE = 64
+INITIAL_MAP_CAPACITY = 256
+# Per-drone cap; the oldest half is dropped when a full map needs room
+MAX_MAP_POINTS = 4096
+
 class SLAMController:
     """
     Controls Visual SLAM (Simultaneous Localization and Mapping) for drones
@@ -33,10 +40,13 @@ class SLAMController:
             "status": "initializing"
         }
         
-        # Initialize SLAM map
+        # Initialize SLAM map: map points are kept as columns, grown geometrically
         self.slam_maps[drone_id] = {
             "map_id": f"map_{drone_id}",
-            "points": [],
+            "xyz": np.empty((INITIAL_MAP_CAPACITY, 3), dtype=np.float64),
+            "descriptors": np.empty((INITIAL_MAP_CAPACITY, DESCRIPTOR_SIZE), dtype=np.float32),
+            "timestamps": np.empty(INITIAL_MAP_CAPACITY, dtype=np.float64),
+            "count": 0,
             "keyframes": [],
             "created_at": datetime.now().isoformat()
         }
@@ -98,22 +108,61 @@ class SLAMController:
         
         Args:
             drone_id: ID of the drone
-            point: {"x": float, "y": float, "z": float, "descriptor": list}
+            point: {"x": float, "y": float, "z": float, "descriptor": array-like of 64 floats}
         """
-        if drone_id in self.slam_maps:
-            self.slam_maps[drone_id]["points"].append({
-                **point,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            if drone_id in self.active_slam_drones:
-                self.active_slam_drones[drone_id]["map_points"] = len(
-                    self.slam_maps[drone_id]["points"]
-                )
+        slam_map = self.slam_maps.get(drone_id)
+        if slam_map is None:
+            return
+        
+        n = slam_map["count"]
+        if n == len(slam_map["timestamps"]):
+            if n >= MAX_MAP_POINTS:
+                n = self._drop_oldest(slam_map)
+            else:
+                self._grow(slam_map)
+        
+        slam_map["xyz"][n] = (point["x"], point["y"], point["z"])
+        slam_map["descriptors"][n] = point["descriptor"]
+        slam_map["timestamps"][n] = time.monotonic()
+        slam_map["count"] = n + 1
+        
+        if drone_id in self.active_slam_drones:
+            self.active_slam_drones[drone_id]["map_points"] = n + 1
+    
+    @staticmethod
+    def _grow(slam_map: Dict):
+        """Double the capacity of a map's point columns, up to MAX_MAP_POINTS"""
+        for key in ("xyz", "descriptors", "timestamps"):
+            column = slam_map[key]
+            capacity = min(len(column) * 2, MAX_MAP_POINTS)
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:len(column)] = column
+            slam_map[key] = grown
+    
+    @staticmethod
+    def _drop_oldest(slam_map: Dict) -> int:
+        """Slide the newest half of a full map to the front; returns the new count"""
+        n = slam_map["count"]
+        keep = n // 2
+        for key in ("xyz", "descriptors", "timestamps"):
+            column = slam_map[key]
+            column[:keep] = column[n - keep:n]
+        slam_map["count"] = keep
+        return keep
     
     def get_map(self, drone_id: str) -> Optional[Dict]:
-        """Get SLAM map for a drone"""
-        return self.slam_maps.get(drone_id)
+        """Get SLAM map for a drone, with point columns sliced to the filled rows"""
+        slam_map = self.slam_maps.get(drone_id)
+        if slam_map is None:
+            return None
+        
+        n = slam_map["count"]
+        return {
+            **slam_map,
+            "xyz": slam_map["xyz"][:n],
+            "descriptors": slam_map["descriptors"][:n],
+            "timestamps": slam_map["timestamps"][:n]
+        }
 
 # Global instance
 slam_controller = SLAMController()
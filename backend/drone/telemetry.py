@@ -2,84 +2,179 @@
 Telemetry Generator - Generates fake drone telemetry data
 """
 
-from typing import Dict, Optional
-import random
+from typing import Dict, List, Optional, Any
+import time
+import numpy as np
 from datetime import datetime
 from config import DRONE_MAX_ALTITUDE, DRONE_UPDATE_INTERVAL
 
+_rng = np.random.default_rng()
+
+INITIAL_TELEMETRY_CAPACITY = 32
+
+# Numeric telemetry, one row per drone
+TELEMETRY_DTYPE = np.dtype([
+    ("lat", np.float64),
+    ("lon", np.float64),
+    ("altitude", np.float64),
+    ("speed", np.float64),
+    ("heading", np.float64),
+    ("battery", np.float64),
+    ("signal_strength", np.float64)
+])
+
 class TelemetryGenerator:
     """
     Generates realistic telemetry data for drones
     """
     
     def __init__(self):
-        self.telemetry_data = {}
+        # Numeric fields live in one structured array so the whole fleet
+        # is randomized in a single step; string fields stay per row
+        self._fields = np.zeros(INITIAL_TELEMETRY_CAPACITY, dtype=TELEMETRY_DTYPE)
+        self._status: List[Dict[str, str]] = []
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._last_tick = time.monotonic()
+    
+    def __contains__(self, drone_id: str) -> bool:
+        return drone_id in self._rows
+    
+    def _add_row(self, drone_id: str) -> int:
+        """Append a zeroed row for a drone, doubling the array when full"""
+        row = len(self._ids)
+        if row == len(self._fields):
+            grown = np.zeros(len(self._fields) * 2, dtype=TELEMETRY_DTYPE)
+            grown[:row] = self._fields
+            self._fields = grown
+    
+        self._ids.append(drone_id)
+        self._rows[drone_id] = row
+        self._status.append({
+            "gps_status": "active",
+            "slam_status": "inactive",
+            "camera_status": "active",
+            "timestamp": datetime.now().isoformat()
+        })
+        return row
+    
+    def init_telemetry(self, drone_id: str, values: Dict[str, Any]):
+        """Create (or reset) a drone's telemetry from a full set of values"""
+        row = self._rows.get(drone_id)
+        if row is None:
+            row = self._add_row(drone_id)
+        self._fields[row] = 0
+        self._write(row, values)
+    
+    def _write(self, row: int, updates: Dict[str, Any]):
+        fields = self._fields[row]
+        status = self._status[row]
+        for key, value in updates.items():
+            if key == "location":
+                fields["lat"] = value["lat"]
+                fields["lon"] = value["lon"]
+            elif key in TELEMETRY_DTYPE.names:
+                fields[key] = value
+            elif key != "drone_id":
+                status[key] = value
+    
+    def _tick(self):
+        """Randomize every drone's telemetry at most once per DRONE_UPDATE_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_tick < DRONE_UPDATE_INTERVAL:
+            return
+        self._last_tick = now
+    
+        n = len(self._ids)
+        fields = self._fields[:n]
+    
+        # Simulate movement
+        fields["lat"] += _rng.uniform(-0.001, 0.001, n)
+        fields["lon"] += _rng.uniform(-0.001, 0.001, n)
+        fields["altitude"] = np.clip(fields["altitude"] + _rng.uniform(-2, 2, n), 0, DRONE_MAX_ALTITUDE)
+    
+        # Update other metrics
+        fields["speed"] = np.maximum(0, fields["speed"] + _rng.uniform(-1, 1, n))
+        fields["heading"] = (fields["heading"] + _rng.uniform(-5, 5, n)) % 360
+        fields["battery"] = np.maximum(0, fields["battery"] - _rng.uniform(0, 0.5, n))
+        fields["signal_strength"] = np.clip(fields["signal_strength"] + _rng.uniform(-2, 2, n), 0, 100)
+    
+        timestamp = datetime.now().isoformat()
+        for status in self._status:
+            status["timestamp"] = timestamp
     
     def get_telemetry(self, drone_id: str) -> Optional[Dict]:
         """
         Get current telemetry for a drone
-        
+    
         Args:
             drone_id: ID of the drone
-        
+    
         Returns:
             Telemetry data dictionary
         """
-        if drone_id not in self.telemetry_data:
+        if drone_id not in self._rows:
             # Initialize telemetry
-            self.telemetry_data[drone_id] = {
-                "drone_id": drone_id,
+            self.init_telemetry(drone_id, {
                 "location": {
-                    "lat": 28.6139 + random.uniform(-0.1, 0.1),
-                    "lon": 77.2090 + random.uniform(-0.1, 0.1)
+                    "lat": 28.6139 + _rng.uniform(-0.1, 0.1),
+                    "lon": 77.2090 + _rng.uniform(-0.1, 0.1)
                 },
-                "altitude": random.uniform(10, DRONE_MAX_ALTITUDE),
-                "speed": random.uniform(5, 15),  # m/s
-                "heading": random.uniform(0, 360),  # degrees
-                "battery": random.uniform(60, 100),
-                "signal_strength": random.uniform(70, 100),
-                "gps_status": "active",
-                "slam_status": "inactive",
-                "camera_status": "active",
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        # Update telemetry with slight variations
-        telemetry = self.telemetry_data[drone_id]
-        
-        # Simulate movement
-        telemetry["location"]["lat"] += random.uniform(-0.001, 0.001)
-        telemetry["location"]["lon"] += random.uniform(-0.001, 0.001)
-        telemetry["altitude"] += random.uniform(-2, 2)
-        telemetry["altitude"] = max(0, min(DRONE_MAX_ALTITUDE, telemetry["altitude"]))
-        
-        # Update other metrics
-        telemetry["speed"] = max(0, telemetry["speed"] + random.uniform(-1, 1))
-        telemetry["heading"] = (telemetry["heading"] + random.uniform(-5, 5)) % 360
-        telemetry["battery"] = max(0, telemetry["battery"] - random.uniform(0, 0.5))
-        telemetry["signal_strength"] = max(0, min(100, telemetry["signal_strength"] + random.uniform(-2, 2)))
-        
-        telemetry["timestamp"] = datetime.now().isoformat()
-        
-        return telemetry
+                "altitude": _rng.uniform(10, DRONE_MAX_ALTITUDE),
+                "speed": _rng.uniform(5, 15),  # m/s
+                "heading": _rng.uniform(0, 360),  # degrees
+                "battery": _rng.uniform(60, 100),
+                "signal_strength": _rng.uniform(70, 100)
+            })
+    
+        self._tick()
+    
+        row = self._rows[drone_id]
+        lat, lon, altitude, speed, heading, battery, signal_strength = self._fields[row].tolist()
+        return {
+            "drone_id": drone_id,
+            "location": {"lat": lat, "lon": lon},
+            "altitude": altitude,
+            "speed": speed,
+            "heading": heading,
+            "battery": battery,
+            "signal_strength": signal_strength,
+            **self._status[row]
+        }
     
     def update_telemetry(self, drone_id: str, updates: Dict):
         """Update telemetry data manually"""
-        if drone_id not in self.telemetry_data:
-            self.telemetry_data[drone_id] = {}
-        
-        self.telemetry_data[drone_id].update(updates)
-        self.telemetry_data[drone_id]["timestamp"] = datetime.now().isoformat()
+        row = self._rows.get(drone_id)
+        if row is None:
+            row = self._add_row(drone_id)
+    
+        self._write(row, updates)
+        self._status[row]["timestamp"] = datetime.now().isoformat()
+    
+    def update_fleet(self, drone_ids: List[str], timestamp: str, **columns: np.ndarray):
+        """
+        Write numeric columns for many drones at once
+    
+        Args:
+            drone_ids: drones to update, all with telemetry rows
+            timestamp: ISO timestamp to stamp on each drone
+            columns: TELEMETRY_DTYPE field name -> values aligned with drone_ids
+        """
+        rows = [self._rows[drone_id] for drone_id in drone_ids]
+        for name, values in columns.items():
+            self._fields[name][rows] = values
+        for row in rows:
+            self._status[row]["timestamp"] = timestamp
     
     def set_gps_status(self, drone_id: str, status: str):
         """Set GPS status for a drone"""
-        if drone_id in self.telemetry_data:
-            self.telemetry_data[drone_id]["gps_status"] = status
+        if drone_id in self._rows:
+            self._status[self._rows[drone_id]]["gps_status"] = status
     
     def set_slam_status(self, drone_id: str, status: str):
         """Set SLAM status for a drone"""
-        if drone_id in self.telemetry_data:
-            self.telemetry_data[drone_id]["slam_status"] = status
+        if drone_id in self._rows:
+            self._status[self._rows[drone_id]]["slam_status"] = status
 
 # Global instance
 telemetry_gen = TelemetryGenerator()
@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for PRALAYA-NET backend
+Runs one uvicorn event loop per CPU core.
+Usage: `gunicorn -c gunicorn_conf.py app:app`
+
+Each worker keeps its own in-memory state (disasters, alerts, drones).
+Set WEB_CONCURRENCY=1 for demos that trigger and poll through different requests.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+# Import the router graph once in the master and share it copy-on-write
+preload_app = True
+
+accesslog = None
+loglevel = os.getenv("LOG_LEVEL", "warning")
+timeout = 120
+
+
+def pre_fork(server, worker):
+    """Give each worker the lowest index not held by a live worker"""
+    taken = {getattr(w, "worker_index", None) for w in server.WORKERS.values()}
+    index = 0
+    while index in taken:
+        index += 1
+    worker.worker_index = index
+
+
+def post_fork(server, worker):
+    # Worker 0 runs the background ingestion/simulation loops (see app.startup_event)
+    os.environ["WORKER_INDEX"] = str(worker.worker_index)
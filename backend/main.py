@@ -3,45 +3,87 @@ PRALAYA-NET Backend - Main Entry Point
 Complete FastAPI application with all API integrations for disaster management
 """
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 import uvicorn
 import os
+import re
 import asyncio
+import functools
+import time
 import httpx
-from datetime import datetime
+import orjson
+import numpy as np
 from dotenv import load_dotenv
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
+from api.timeutil import now_iso
+
 # Import configuration
 from config import (
-    APP_NAME, VERSION, PORT, CORS_ORIGINS,
+    APP_NAME, VERSION, PORT, CORS_ORIGINS, CORS_ORIGIN_REGEX,
+    UVICORN_RELOAD, UVICORN_WORKERS, LOG_LEVEL,
     NASA_API_KEY, DATA_GOV_KEY, OPENWEATHER_API_KEY, DEMO_MODE,
     NASA_POWER_URL, OPENWEATHER_URL, USGS_EARTHQUAKE_URL,
-    CRITICAL_INFRA, LOW_RISK, MEDIUM_RISK, HIGH_RISK, CRITICAL_RISK
+    WEATHER_CACHE_TTL_SEC, NASA_POWER_CACHE_TTL_SEC, UPSTREAM_CACHE_SIZE,
+    CRITICAL_INFRA, CRITICAL_INFRA_SOA, LOW_RISK, MEDIUM_RISK, HIGH_RISK, CRITICAL_RISK
 )
 
 # Create FastAPI app
 app = FastAPI(
     title=APP_NAME,
     version=VERSION,
-    description="Autonomous Disaster Response Command Platform - AI-powered disaster prediction and response"
+    description="Autonomous Disaster Response Command Platform - AI-powered disaster prediction and response",
+    default_response_class=ORJSONResponse
 )
 
+# One pooled client for all upstream calls, so requests reuse keep-alive connections
+@app.on_event("startup")
+async def startup_event():
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    
+    # Compile the risk kernel now rather than on the first request
+    _risk_kernel(0.0, 0.0, 20.0, False, 0.0)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.http.aclose()
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Upper bound on one weather + NASA fan-out, in seconds
+UPSTREAM_TIMEOUT = 8.0
+
+_rng = np.random.default_rng()
+
+# Stability index factors, their weights and simulated ranges
+_STABILITY_KEYS = ("infrastructure_health", "disaster_risk", "agent_response_capacity", "temporal_stability")
+_STABILITY_WEIGHTS = np.array([0.35, 0.30, 0.20, 0.15])
+_STABILITY_LOW = np.array([0.6, 0.2, 0.7, 0.4])
+_STABILITY_HIGH = np.array([0.9, 0.5, 0.95, 0.8])
+
 # ============== Pydantic Models ==============
 
 class WeatherResponse(BaseModel):
@@ -71,7 +113,51 @@ class InfrastructureResponse(BaseModel):
 
 # ============== Utility Functions ==============
 
-async def fetch_openweather(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+def upstream_cache(ttl: int):
+    """
+    Cache an upstream fetch(client, lat, lon) per rounded coordinate pair.
+    Only successful (non-None) results are kept, and concurrent misses for
+    the same key wait for a single upstream call.
+    """
+    def decorator(fetch):
+        entries: Dict[tuple, tuple] = {}
+        locks: Dict[tuple, asyncio.Lock] = {}
+        # Coroutines holding or queued on each lock; the lock is dropped at zero
+        waiters: Dict[tuple, int] = {}
+    
+        @functools.wraps(fetch)
+        async def wrapper(client: httpx.AsyncClient, lat: float, lon: float):
+            key = (round(lat, 2), round(lon, 2))
+            entry = entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+    
+            lock = locks.setdefault(key, asyncio.Lock())
+            waiters[key] = waiters.get(key, 0) + 1
+            try:
+                async with lock:
+                    entry = entries.get(key)
+                    if entry and entry[0] > time.monotonic():
+                        return entry[1]
+    
+                    value = await fetch(client, *key)
+                    if value is not None:
+                        entries.pop(key, None)
+                        if len(entries) >= UPSTREAM_CACHE_SIZE:
+                            # Evict the oldest entry
+                            del entries[next(iter(entries))]
+                        entries[key] = (time.monotonic() + ttl, value)
+                    return value
+            finally:
+                waiters[key] -= 1
+                if not waiters[key]:
+                    del waiters[key]
+                    locks.pop(key, None)
+        return wrapper
+    return decorator
+
+@upstream_cache(ttl=WEATHER_CACHE_TTL_SEC)
+async def fetch_openweather(client: httpx.AsyncClient, lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """Fetch weather data from OpenWeather API"""
     if not OPENWEATHER_API_KEY or DEMO_MODE:
         # Return simulated data
@@ -92,19 +178,19 @@ async def fetch_openweather(lat: float, lon: float) -> Optional[Dict[str, Any]]:
         }
     
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{OPENWEATHER_URL}?lat={lat}&lon={lon}&appid={OPENWEATHER_API_KEY}&units=metric"
-            response = await client.get(url, timeout=10.0)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"OpenWeather API error: {response.status_code}")
-                return None
+        url = f"{OPENWEATHER_URL}?lat={lat}&lon={lon}&appid={OPENWEATHER_API_KEY}&units=metric"
+        response = await client.get(url, timeout=10.0)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"OpenWeather API error: {response.status_code}")
+            return None
     except Exception as e:
         print(f"OpenWeather request failed: {e}")
         return None
 
-async def fetch_nasa_power(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+@upstream_cache(ttl=NASA_POWER_CACHE_TTL_SEC)
+async def fetch_nasa_power(client: httpx.AsyncClient, lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """Fetch climate data from NASA POWER API"""
     if DEMO_MODE:
         # Return simulated data
@@ -116,73 +202,121 @@ async def fetch_nasa_power(lat: float, lon: float) -> Optional[Dict[str, Any]]:
         }
     
     try:
-        async with httpx.AsyncClient() as client:
-            params = {
-                "parameters": "T2M,PRECTOTCORR,RH2M,ALLSKY_SFC_SW_DWN",
-                "community": "RE",
-                "longitude": lon,
-                "latitude": lat,
-                "format": "JSON"
-            }
-            response = await client.get(NASA_POWER_URL, params=params, timeout=10.0)
-            if response.status_code == 200:
-                data = response.json()
-                properties = data.get("properties", {}).get("parameter", {})
-                times = sorted(properties.get("T2M", {}).keys())
-                if times:
-                    latest = times[-1]
-                    return {
-                        "temperature": properties.get("T2M", {}).get(latest, 25),
-                        "precipitation": properties.get("PRECTOTCORR", {}).get(latest, 0),
-                        "solar_radiation": properties.get("ALLSKY_SFC_SW_DWN", {}).get(latest, 500),
-                        "relative_humidity": properties.get("RH2M", {}).get(latest, 50)
-                    }
-            return None
+        params = {
+            "parameters": "T2M,PRECTOTCORR,RH2M,ALLSKY_SFC_SW_DWN",
+            "community": "RE",
+            "longitude": lon,
+            "latitude": lat,
+            "format": "JSON"
+        }
+        response = await client.get(NASA_POWER_URL, params=params, timeout=10.0)
+        if response.status_code == 200:
+            data = response.json()
+            properties = data.get("properties", {}).get("parameter", {})
+            times = sorted(properties.get("T2M", {}).keys())
+            if times:
+                latest = times[-1]
+                return {
+                    "temperature": properties.get("T2M", {}).get(latest, 25),
+                    "precipitation": properties.get("PRECTOTCORR", {}).get(latest, 0),
+                    "solar_radiation": properties.get("ALLSKY_SFC_SW_DWN", {}).get(latest, 500),
+                    "relative_humidity": properties.get("RH2M", {}).get(latest, 50)
+                }
+        return None
     except Exception as e:
         print(f"NASA POWER API error: {e}")
         return None
 
+async def fetch_weather_and_nasa(client: httpx.AsyncClient, lat: float, lon: float):
+    """Fetch OpenWeather and NASA POWER data concurrently"""
+    try:
+        # Bound the whole fan-out so a stuck upstream cannot hold the request open
+        async with asyncio.timeout(UPSTREAM_TIMEOUT):
+            async with asyncio.TaskGroup() as tg:
+                weather_task = tg.create_task(fetch_openweather(client, lat, lon))
+                nasa_task = tg.create_task(fetch_nasa_power(client, lat, lon))
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail="Upstream data sources timed out")
+    
+    return weather_task.result(), nasa_task.result()
+
+def infra_distance_sq(lat: float, lon: float) -> np.ndarray:
+    """Squared degree distance from a point to every CRITICAL_INFRA facility"""
+    return (CRITICAL_INFRA_SOA.lat - lat)**2 + (CRITICAL_INFRA_SOA.lon - lon)**2
+
+# Weather conditions that add the severe-condition score
+_SEVERE_RE = re.compile(r"thunderstorm|tornado|extreme|hurricane|cyclone", re.IGNORECASE)
+
+def _risk_kernel(wind_speed, rain_1h, temp, severe, precip):
+    """Risk score from the extracted weather and NASA scalars"""
+    score = 0
+    
+    # Wind Score (up to 40 points)
+    if wind_speed > 14:
+        score += 40
+    elif wind_speed > 8:
+        score += 20
+    elif wind_speed > 4:
+        score += 10
+    
+    # Rainfall Score (up to 30 points)
+    if rain_1h > 10:
+        score += 30
+    elif rain_1h > 2:
+        score += 15
+    
+    # Temperature Score (up to 15 points)
+    if temp > 40 or temp < -5:
+        score += 15
+    
+    # Condition Score (up to 15 points)
+    if severe:
+        score += 15
+    
+    # NASA precipitation anomaly (up to 20 points)
+    if precip > 10:
+        score += 20
+    elif precip > 5:
+        score += 10
+    
+    return min(score, 100)
+
+if NUMBA_AVAILABLE:
+    _risk_kernel = njit(cache=True)(_risk_kernel)
+
 def calculate_risk_score(weather: Dict, nasa: Dict) -> float:
     """Calculate AI risk score based on weather and NASA data"""
-    score = 0
+    # Missing sources fall back to values that score nothing
+    wind_speed, rain_1h, temp, severe, precip = 0.0, 0.0, 20.0, False, 0.0
     
     if weather:
-        # Wind Score (up to 40 points)
-        wind_speed = weather.get("wind", {}).get("speed", 0)
-        if wind_speed > 14:
-            score += 40
-        elif wind_speed > 8:
-            score += 20
-        elif wind_speed > 4:
-            score += 10
-        
-        # Rainfall Score (up to 30 points)
-        rain_1h = weather.get("rain", {}).get("1h", 0)
-        if rain_1h > 10:
-            score += 30
-        elif rain_1h > 2:
-            score += 15
-        
-        # Temperature Score (up to 15 points)
-        temp = weather.get("main", {}).get("temp", 20)
-        if temp > 40 or temp < -5:
-            score += 15
-        
-        # Condition Score (up to 15 points)
-        condition = weather.get("weather", [{}])[0].get("main", "").lower()
-        severe_conditions = ["thunderstorm", "tornado", "extreme", "hurricane", "cyclone"]
-        if any(c in condition for c in severe_conditions):
-            score += 15
+        wind_speed = float(weather.get("wind", {}).get("speed", 0))
+        rain_1h = float(weather.get("rain", {}).get("1h", 0))
+        temp = float(weather.get("main", {}).get("temp", 20))
+        condition = weather.get("weather", [{}])[0].get("main", "")
+        severe = _SEVERE_RE.search(condition) is not None
     
     if nasa:
-        # NASA precipitation anomaly (up to 20 points)
-        precip = nasa.get("precipitation", 0)
-        if precip > 10:
-            score += 20
-        elif precip > 5:
-            score += 10
+        precip = float(nasa.get("precipitation", 0))
     
-    return min(score, 100)
+    return _risk_kernel(wind_speed, rain_1h, temp, severe, precip)
+
+def calculate_risk_score_batch(wind: np.ndarray, rain: np.ndarray, temp: np.ndarray,
+                               nasa_precip: np.ndarray, severe: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Risk scores for many locations at once
+    
+    Same thresholds as calculate_risk_score, applied to aligned (N,) arrays
+    of wind speed, 1h rainfall, temperature, NASA precipitation and
+    (optionally) severe-condition flags.
+    """
+    score = np.select([wind > 14, wind > 8, wind > 4], [40, 20, 10], default=0)
+    score += np.select([rain > 10, rain > 2], [30, 15], default=0)
+    score += np.where((temp > 40) | (temp < -5), 15, 0)
+    if severe is not None:
+        score += np.where(severe, 15, 0)
+    score += np.select([nasa_precip > 10, nasa_precip > 5], [20, 10], default=0)
+    return np.minimum(score, 100)
 
 def get_risk_level(score: float) -> str:
     """Convert risk score to risk level"""
@@ -222,7 +356,7 @@ async def health_check():
     """Simple health check endpoint"""
     return {
         "status": "ok",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "service": APP_NAME,
         "version": VERSION
     }
@@ -237,7 +371,7 @@ async def api_health_check():
             "websocket": "ready",
             "demo_mode": DEMO_MODE
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/api/weather")
@@ -249,7 +383,7 @@ async def get_weather(lat: float = Query(..., description="Latitude"),
     Uses OpenWeather API when API key is available.
     Falls back to simulated data in demo mode.
     """
-    weather_data = await fetch_openweather(lat, lon)
+    weather_data = await fetch_openweather(app.state.http, lat, lon)
     
     if not weather_data:
         raise HTTPException(status_code=503, detail="Unable to fetch weather data")
@@ -263,7 +397,7 @@ async def get_weather(lat: float = Query(..., description="Latitude"),
         "description": weather_data.get("weather", [{}])[0].get("description", "Unknown"),
         "visibility": weather_data.get("visibility", 0),
         "clouds": weather_data.get("clouds", {}).get("all", 0),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/api/geo-intel")
@@ -276,26 +410,19 @@ async def get_geo_intel(lat: float = Query(..., description="Latitude"),
     Returns AI-calculated risk score for disaster assessment.
     """
     # Fetch data from multiple sources in parallel
-    weather, nasa_data = await asyncio.gather(
-        fetch_openweather(lat, lon),
-        fetch_nasa_power(lat, lon)
-    )
+    weather, nasa_data = await fetch_weather_and_nasa(app.state.http, lat, lon)
     
     # Calculate risk score
     risk_score = calculate_risk_score(weather, nasa_data)
     
     # Find nearby infrastructure
-    nearby_infra = []
-    for facility in CRITICAL_INFRA:
-        import math
-        dist = math.sqrt(
-            (facility["lat"] - lat)**2 + (facility["lon"] - lon)**2
-        )
-        if dist < 0.5:  # Within ~50km
-            nearby_infra.append({
-                **facility,
-                "distance_km": round(dist * 111, 2)
-            })
+    d2 = infra_distance_sq(lat, lon)
+    nearby = np.flatnonzero(d2 < 0.25)  # Within ~50km
+    distances = np.round(np.sqrt(d2[nearby]) * 111, 2).tolist()
+    nearby_infra = [
+        {**CRITICAL_INFRA[i], "distance_km": dist}
+        for i, dist in zip(nearby.tolist(), distances)
+    ]
     
     return {
         "coordinates": {"lat": lat, "lon": lon},
@@ -304,7 +431,7 @@ async def get_geo_intel(lat: float = Query(..., description="Latitude"),
         "infrastructure": nearby_infra,
         "risk_score": risk_score,
         "risk_level": get_risk_level(risk_score),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/api/infrastructure")
@@ -318,21 +445,20 @@ async def get_infrastructure(lat: Optional[float] = Query(None),
     """
     if lat is not None and lon is not None:
         # Calculate distances and sort by proximity
-        import math
-        for facility in CRITICAL_INFRA:
-            dist = math.sqrt(
-                (facility["lat"] - lat)**2 + (facility["lon"] - lon)**2
-            )
-            facility["distance_km"] = round(dist * 111, 2)
-        
-        facilities = sorted(CRITICAL_INFRA, key=lambda x: x.get("distance_km", 999))
+        d2 = infra_distance_sq(lat, lon)
+        order = np.argsort(d2, kind="stable")
+        distances = np.round(np.sqrt(d2[order]) * 111, 2).tolist()
+        facilities = [
+            {**CRITICAL_INFRA[i], "distance_km": dist}
+            for i, dist in zip(order.tolist(), distances)
+        ]
     else:
         facilities = CRITICAL_INFRA
     
     return {
         "facilities": facilities,
         "total_count": len(facilities),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/api/risk/predict")
@@ -350,8 +476,7 @@ async def predict_risk(lat: Optional[float] = Query(None),
         lon = 77.2090
     
     # Fetch available data
-    weather = await fetch_openweather(lat, lon)
-    nasa = await fetch_nasa_power(lat, lon)
+    weather, nasa = await fetch_weather_and_nasa(app.state.http, lat, lon)
     
     risk_score = calculate_risk_score(weather, nasa)
     
@@ -369,7 +494,7 @@ async def predict_risk(lat: Optional[float] = Query(None),
         "confidence": 0.85 if not DEMO_MODE else 0.7,
         "factors": factors,
         "coordinates": {"lat": lat, "lon": lon},
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/api/stability/current")
@@ -377,29 +502,16 @@ async def get_current_stability():
     """Get current system stability index"""
     import random
     
-    factors = {
-        'infrastructure_health': round(random.uniform(0.6, 0.9), 3),
-        'disaster_risk': round(random.uniform(0.2, 0.5), 3),
-        'agent_response_capacity': round(random.uniform(0.7, 0.95), 3),
-        'temporal_stability': round(random.uniform(0.4, 0.8), 3)
-    }
-    
-    weights = {
-        'infrastructure_health': 0.35,
-        'disaster_risk': 0.30,
-        'agent_response_capacity': 0.20,
-        'temporal_stability': 0.15
-    }
-    
-    overall_score = sum(factors[k] * weights[k] for k in factors)
+    factors = np.round(_rng.uniform(_STABILITY_LOW, _STABILITY_HIGH), 3)
+    overall_score = float(factors @ _STABILITY_WEIGHTS)
     
     return {
         "stability_index": {
             "overall_score": round(overall_score, 3),
             "level": "excellent" if overall_score > 0.8 else "healthy" if overall_score > 0.6 else "warning",
-            "factors": factors,
+            "factors": dict(zip(_STABILITY_KEYS, factors.tolist())),
             "trend": random.choice(["improving", "stable", "declining"]),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     }
 
@@ -420,52 +532,108 @@ async def get_system_status():
             "data_ingestion": "active",
             "prediction_engine": "enhanced" if not DEMO_MODE else "basic"
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 # ============== WebSocket Endpoints ==============
 
+STREAM_QUEUE_SIZE = 4
+
+class Broadcaster:
+    """
+    One publisher task per stream computes and encodes each update once and
+    fans it out to every connected client's small queue, so N subscribers
+    cost one upstream fetch per tick instead of N.
+    """
+    
+    def __init__(self, name: str, produce, interval: float):
+        self.name = name
+        self.produce = produce
+        self.interval = interval
+        self.subscribers: Set[asyncio.Queue] = set()
+    
+    async def publish_loop(self):
+        loop = asyncio.get_running_loop()
+        # Random first offset so the streams don't all wake together, then a
+        # fixed cadence that doesn't drift by the time spent publishing
+        next_tick = loop.time() + _rng.random() * self.interval
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            next_tick = max(next_tick + self.interval, loop.time())
+            if not self.subscribers:
+                continue
+            try:
+                payload = await self.produce()
+            except Exception as e:
+                print(f"{self.name} error: {e}")
+                continue
+            text = orjson.dumps(payload).decode()
+            for queue in self.subscribers:
+                if queue.full():
+                    # Slow client: drop its oldest update
+                    queue.get_nowait()
+                queue.put_nowait(text)
+    
+    async def stream_to(self, websocket: WebSocket):
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        finally:
+            self.subscribers.discard(queue)
+
+async def _ping():
+    return {"type": "ping", "timestamp": now_iso()}
+
+async def _risk_update():
+    return {"type": "risk_update", "data": await predict_risk(lat=None, lon=None)}
+
+async def _stability_update():
+    return {"type": "stability_update", "data": await get_current_stability()}
+
+ping_stream = Broadcaster("WebSocket", _ping, 5)
+risk_stream = Broadcaster("Risk stream", _risk_update, 10)
+stability_stream = Broadcaster("Stability stream", _stability_update, 10)
+
+_publisher_tasks: Set[asyncio.Task] = set()
+
+@app.on_event("startup")
+async def start_publishers():
+    """Start one publisher per stream, shared by all connected clients"""
+    for stream in (ping_stream, risk_stream, stability_stream):
+        _publisher_tasks.add(asyncio.create_task(stream.publish_loop()))
+
+@app.on_event("shutdown")
+async def stop_publishers():
+    for task in _publisher_tasks:
+        task.cancel()
+    _publisher_tasks.clear()
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket):
+async def websocket_endpoint(websocket: WebSocket):
     """General WebSocket endpoint"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(5)
-            await websocket.send_json({
-                "type": "ping",
-                "timestamp": datetime.now().isoformat()
-            })
+        await ping_stream.stream_to(websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
 
 @app.websocket("/ws/risk-stream")
-async def risk_stream_endpoint(websocket):
+async def risk_stream_endpoint(websocket: WebSocket):
     """Risk data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(10)
-            risk_data = await predict_risk()
-            await websocket.send_json({
-                "type": "risk_update",
-                "data": risk_data
-            })
+        await risk_stream.stream_to(websocket)
     except Exception as e:
         print(f"Risk stream error: {e}")
 
 @app.websocket("/ws/stability-stream")
-async def stability_stream_endpoint(websocket):
+async def stability_stream_endpoint(websocket: WebSocket):
     """Stability data WebSocket stream"""
     await websocket.accept()
     try:
-        while True:
-            await asyncio.sleep(10)
-            stability_data = await get_current_stability()
-            await websocket.send_json({
-                "type": "stability_update",
-                "data": stability_data
-            })
+        await stability_stream.stream_to(websocket)
     except Exception as e:
         print(f"Stability stream error: {e}")
 
@@ -474,12 +642,12 @@ async def stability_stream_endpoint(websocket):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": str(exc),
             "type": type(exc).__name__,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     )
 
@@ -496,11 +664,16 @@ if __name__ == "__main__":
     print(f"📍 Demo Mode: {DEMO_MODE}")
     print("="*70 + "\n")
     
+    # loop/http stay on "auto" so `python main.py` also runs on Windows;
+    # uvicorn[standard] picks uvloop and httptools wherever they install
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=PORT,
-        reload=True,
-        log_level="info"
+        ws="websockets",
+        reload=UVICORN_RELOAD,
+        workers=UVICORN_WORKERS,
+        access_log=False,
+        log_level=LOG_LEVEL
     )
 
@@ -7,20 +7,73 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 import time
 from collections import defaultdict
+from typing import Tuple
+from services.response_cache import response_cache
 from datetime import datetime, timedelta
 import re
 import json
 
+# Token bucket per key, refilled continuously at ARGV[2] tokens/second up to
+# ARGV[1]. Runs atomically in Redis and uses the server clock so every worker
+# sees the same refill. Returns {allowed, tokens left}.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, math.floor(tokens)}
+"""
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Simple rate limiting middleware
-    Limits requests per IP address
+    Limits requests per IP address, across all workers when Redis is configured
     """
     
     def __init__(self, app, requests_per_minute: int = 600):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.request_times = defaultdict(list)
+        self._bucket_script = None
+        self._bucket_redis = None
+    
+    async def _redis_take(self, redis, client_ip: str) -> Tuple[bool, int]:
+        """Take a token from this IP's bucket shared through Redis; returns (allowed, remaining)"""
+        if self._bucket_redis is not redis:
+            self._bucket_script = redis.register_script(TOKEN_BUCKET_LUA)
+            self._bucket_redis = redis
+        allowed, remaining = await self._bucket_script(
+            keys=[f"rl:{client_ip}"],
+            args=[self.requests_per_minute, self.requests_per_minute / 60]
+        )
+        return bool(allowed), int(remaining)
+    
+    def _local_take(self, client_ip: str, now: float) -> Tuple[bool, int]:
+        """Requests from this IP in the last 60 seconds, this worker only; returns (allowed, remaining)"""
+        cutoff = now - 60
+        
+        # Clean old requests from this IP
+        self.request_times[client_ip] = [
+            t for t in self.request_times[client_ip] if t > cutoff
+        ]
+        
+        if len(self.request_times[client_ip]) >= self.requests_per_minute:
+            # Rejected requests are not recorded
+            return False, 0
+        
+        self.request_times[client_ip].append(now)
+        return True, self.requests_per_minute - len(self.request_times[client_ip])
     
     async def dispatch(self, request: Request, call_next):
         # Get client IP
@@ -28,15 +81,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Get current time
         now = time.time()
-        cutoff = now - 60  # Last 60 seconds
         
-        # Clean old requests from this IP
-        self.request_times[client_ip] = [
-            t for t in self.request_times[client_ip] if t > cutoff
-        ]
+        result = None
+        if response_cache.redis is not None:
+            try:
+                result = await self._redis_take(response_cache.redis, client_ip)
+            except Exception:
+                # Redis unreachable: fall back to this worker's window
+                result = None
+        if result is None:
+            result = self._local_take(client_ip, now)
+        allowed, remaining = result
         
         # Check rate limit
-        if len(self.request_times[client_ip]) >= self.requests_per_minute:
+        if not allowed:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -46,17 +104,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 }
             )
         
-        # Add this request
-        self.request_times[client_ip].append(now)
-        
         # Continue to next middleware/route
         response = await call_next(request)
         
         # Add rate limit headers
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.requests_per_minute - len(self.request_times[client_ip])
-        )
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
         
         return response
 
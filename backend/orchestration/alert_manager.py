@@ -2,11 +2,19 @@
 Alert Manager - Sends alerts to React Dashboard and ESP32
 """
 
-from typing import List, Dict, Optional
+import asyncio
+import itertools
+from typing import List, Dict, Optional, Set
+from collections import deque
 from datetime import datetime
-import requests
 from config import ESP32_BASE_URL
 
+# Oldest pending alerts are dropped beyond this many
+MAX_PENDING_ALERTS = 10_000
+
+# Per-subscriber backlog for streamed alerts; slow consumers drop the excess
+STREAM_QUEUE_SIZE = 100
+
 class AlertManager:
     """
     Manages alert distribution to multiple channels:
@@ -16,10 +24,13 @@ class AlertManager:
     """
     
     def __init__(self):
-        self.pending_alerts = []
+        self.pending_alerts = deque(maxlen=MAX_PENDING_ALERTS)
         self.sent_alerts = []
         self.alert_history = []
         self.esp32_connected = False
+        self._subscribers: Set[asyncio.Queue] = set()
+        # Alert ids keep counting once the pending buffer is full
+        self._alert_seq = itertools.count(1)
     
     def dispatch_alerts(self, alerts: List[Dict]) -> Dict:
         """
@@ -33,29 +44,62 @@ class AlertManager:
             "alert_ids": []
         }
         
+        # Every channel send is an in-memory append, so a plain loop is fastest
         for alert in alerts:
-            alert["id"] = alert.get("id", f"alert_{len(self.pending_alerts) + 1}")
-            alert["created_at"] = datetime.now().isoformat()
-            alert["status"] = "pending"
-            
-            # Add to pending queue (dashboard will poll)
-            self.pending_alerts.append(alert)
+            try:
+                alert_id, esp32_sent = self._send_one(alert)
+            except Exception as e:
+                print(f"Alert dispatch error: {e}")
+                results["failed"] += 1
+                continue
             results["dashboard"] += 1
-            results["alert_ids"].append(alert["id"])
-            
-            # Format for ESP32
-            esp32_alert = self._format_for_esp32(alert)
-            if esp32_alert:
+            results["alert_ids"].append(alert_id)
+            if esp32_sent:
                 results["esp32"] += 1
-            
-            # Add to history
-            self.alert_history.append({
-                **alert,
-                "dispatched_at": datetime.now().isoformat()
-            })
         
         return results
     
+    def _send_one(self, alert: Dict):
+        """Deliver a single alert to every channel; returns (alert_id, sent_to_esp32)"""
+        if "id" not in alert:
+            alert["id"] = f"alert_{next(self._alert_seq)}"
+        alert["created_at"] = datetime.now().isoformat()
+        alert["status"] = "pending"
+        
+        # Add to pending queue (dashboard will poll)
+        self.pending_alerts.append(alert)
+        
+        # Format for ESP32
+        esp32_alert = self._format_for_esp32(alert)
+        if esp32_alert:
+            self._publish(esp32_alert)
+        
+        # Add to history
+        self.alert_history.append({
+            **alert,
+            "dispatched_at": datetime.now().isoformat()
+        })
+        
+        return alert["id"], bool(esp32_alert)
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Register a stream consumer that receives each new ESP32-formatted alert"""
+        queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a stream consumer"""
+        self._subscribers.discard(queue)
+    
+    def _publish(self, alert: Dict):
+        """Push an alert to every stream consumer without blocking"""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                pass
+    
     def _format_for_esp32(self, alert: Dict) -> Optional[Dict]:
         """Format alert for ESP32 display"""
         message = alert.get("message", "")
@@ -77,19 +121,24 @@ class AlertManager:
         Get pending alerts for a channel
         Called by dashboard or ESP32 when polling
         """
+        if channel == "dashboard":
+            # Dashboard receives every pending alert
+            return list(self.pending_alerts)
+        
         alerts = [
             a for a in self.pending_alerts 
-            if a.get("channel") == channel or channel == "dashboard" or not a.get("channel")
+            if a.get("channel") == channel or not a.get("channel")
         ]
         
         return alerts
     
     def clear_delivered_alerts(self, alert_ids: List[str]):
         """Clear alerts that have been delivered"""
-        self.pending_alerts = [
-            a for a in self.pending_alerts 
-            if a.get("id") not in alert_ids
-        ]
+        delivered = set(alert_ids)
+        self.pending_alerts = deque(
+            (a for a in self.pending_alerts if a.get("id") not in delivered),
+            maxlen=MAX_PENDING_ALERTS
+        )
     
     def get_pending_alerts_count(self) -> int:
         """Get count of pending alerts"""
@@ -14,11 +14,11 @@ from ai.space_weather import space_weather_monitor
 from config import CRITICAL_INFRA, HIGH_RISK, MEDIUM_RISK
 from drone.drone_controller import drone_controller
 
-# Import satellite_zones (shared list)
-from api.satellite_api import satellite_zones
+# Import satellite_zones (shared id -> zone dict)
+from api.satellite_api import satellite_zones, invalidate_zones_cache
 
 import asyncio
-from services.ws_manager import ws_manager
+from websocket_manager import ws_manager
 
 class DecisionEngine:
     """
@@ -31,6 +31,7 @@ class DecisionEngine:
     
     def __init__(self):
         self.active_disasters = []
+        self.max_severity = 0.0  # Running max over active_disasters
         self.decision_history = []
         self.risk_progression = {}  # Track risk over time
     
@@ -53,6 +54,7 @@ class DecisionEngine:
             "radius": self._calculate_disaster_radius(disaster_type, severity)
         }
         self.active_disasters.append(disaster)
+        self.max_severity = max(self.max_severity, severity)
         
         # Register disaster zone on map
         self._register_disaster_zone(disaster)
@@ -132,7 +134,8 @@ class DecisionEngine:
             "radius": disaster["radius"] * 1000,  # Convert to meters for map
             "detected_at": disaster["detected_at"]
         }
-        satellite_zones.append(zone)
+        satellite_zones[zone["id"]] = zone
+        invalidate_zones_cache()
     
     def _run_ai_models(self, disaster: Dict) -> Dict:
         """Run all relevant AI models with deterministic, disaster-aware logic"""
@@ -385,10 +388,12 @@ class DecisionEngine:
     def clear_all(self):
         """Clear all disasters and reset"""
         self.active_disasters = []
+        self.max_severity = 0.0
         self.decision_history = []
         self.risk_progression = {}
         cascading_risk_analyzer.reset_risks()
         satellite_zones.clear()
+        invalidate_zones_cache()
 
 # Global instance
 decision_engine = DecisionEngine()
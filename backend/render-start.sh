@@ -22,5 +22,5 @@ fi
 
 # Start uvicorn for production
 echo "🌐 Starting server..."
-uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --log-level info --workers 1
+uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools --no-access-log --log-level info --workers 1
 
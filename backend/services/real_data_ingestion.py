@@ -26,6 +26,7 @@ class RealDataIngestion:
         # Cache for storing data
         self.cache = {}
         self.cache_duration = 300  # 5 minutes
+        self.last_result: Dict[str, Any] = {}
         
     async def fetch_nasa_wildfire_data(self, bbox: List[float]) -> List[Dict]:
         """Fetch NASA FIRMS wildfire data"""
@@ -265,9 +266,25 @@ class RealDataIngestion:
             'last_updated': datetime.datetime.now().isoformat()
         }
         
+        self.last_result = result
         print(f"✅ Data ingestion complete: {len(all_events)} events from {len(result['sources'])} sources")
         return result
     
+    async def get_cached_data(self) -> Dict[str, Any]:
+        """Latest ingestion result, or the events saved by a previous run"""
+        if self.last_result:
+            return self.last_result
+        
+        events = await asyncio.to_thread(self.load_events_from_cache, 'combined')
+        if not events:
+            return {}
+        
+        return {
+            'events': events[:100],
+            'total_events': len(events),
+            'sources': ['historical_cache']
+        }
+    
     def calculate_event_statistics(self, events: List[Dict]) -> Dict[str, Any]:
         """Calculate statistics from events"""
         if not events:
@@ -0,0 +1,130 @@
+"""
+Response Cache - short-TTL cache for polled status endpoints
+Shared across workers through Redis when REDIS_URL is set, per-process otherwise
+"""
+
+import time
+import asyncio
+import functools
+import orjson
+from typing import Dict, Optional
+from fastapi.responses import Response
+from config import REDIS_URL, CACHE_TTL_SEC
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+class ResponseCache:
+    """
+    Stores {body, status, generated_at, stale_at} per key.
+    Entries are fresh until stale_at and are kept for CACHE_TTL_SEC
+    so the last good response can be served if the handler fails.
+    """
+
+    def __init__(self):
+        self.redis = None
+        self._local: Dict[str, Dict] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def connect(self):
+        """Connect to Redis if configured; otherwise stay in-process"""
+        if not REDIS_URL or not REDIS_AVAILABLE:
+            return
+        try:
+            client = aioredis.from_url(REDIS_URL)
+            await client.ping()
+            self.redis = client
+            print("✅ Response cache using Redis")
+        except Exception as e:
+            print(f"⚠️  Redis unavailable ({e}), using in-process response cache")
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def _load(self, key: str) -> Optional[Dict]:
+        if self.redis is None:
+            return self._local.get(key)
+        try:
+            raw = await self.redis.hgetall(f"cache:{key}")
+        except Exception:
+            return self._local.get(key)
+        if not raw:
+            return None
+        return {
+            "body": raw[b"body"],
+            "status": int(raw[b"status"]),
+            "generated_at": float(raw[b"generated_at"]),
+            "stale_at": float(raw[b"stale_at"])
+        }
+
+    async def _store(self, key: str, entry: Dict):
+        self._local[key] = entry
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(f"cache:{key}", mapping=entry)
+                pipe.expire(f"cache:{key}", CACHE_TTL_SEC)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Response cache write error: {e}")
+
+    @staticmethod
+    def _respond(entry: Dict, state: str) -> Response:
+        return Response(
+            content=entry["body"],
+            status_code=entry["status"],
+            media_type="application/json",
+            headers={"X-Cache": state}
+        )
+
+    def cached(self, ttl: int, key: str):
+        """Decorator for argument-less GET endpoints returning JSON"""
+        def decorator(handler):
+            @functools.wraps(handler)
+            async def wrapper():
+                entry = await self._load(key)
+                if entry and entry["stale_at"] > time.time():
+                    return self._respond(entry, "hit")
+
+                # One handler call per worker while the entry is being rebuilt
+                lock = self._locks.setdefault(key, asyncio.Lock())
+                async with lock:
+                    entry = await self._load(key)
+                    if entry and entry["stale_at"] > time.time():
+                        return self._respond(entry, "hit")
+
+                    try:
+                        response = await handler()
+                    except Exception:
+                        if entry:
+                            return self._respond(entry, "stale")
+                        raise
+
+                    if not isinstance(response, Response):
+                        response = Response(content=orjson.dumps(response), media_type="application/json")
+                    if response.status_code >= 500 and entry:
+                        # Last known good status instead of an error
+                        return self._respond(entry, "stale")
+                    if response.status_code != 200:
+                        return response
+
+                    now = time.time()
+                    fresh = {
+                        "body": bytes(response.body),
+                        "status": response.status_code,
+                        "generated_at": now,
+                        "stale_at": now + ttl
+                    }
+                    await self._store(key, fresh)
+                    return self._respond(fresh, "miss")
+            return wrapper
+        return decorator
+
+# Global instance
+response_cache = ResponseCache()
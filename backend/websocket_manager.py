@@ -9,6 +9,9 @@ from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from collections import defaultdict
 
+# Per-stream backlog of encoded messages; when clients fall behind the oldest is dropped
+STREAM_QUEUE_SIZE = 64
+
 class WebSocketManager:
     """Manages WebSocket connections and broadcasting"""
     
@@ -17,6 +20,9 @@ class WebSocketManager:
         self.connections: Dict[str, Set[WebSocket]] = defaultdict(set)
         # Store connection metadata
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        # Encoded messages waiting to be sent, and the task sending them, per stream
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._senders: Dict[str, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, stream_type: str = "general"):
         """Connect a WebSocket client"""
@@ -45,6 +51,8 @@ class WebSocketManager:
         for stream_type, connections in self.connections.items():
             if websocket in connections:
                 connections.remove(websocket)
+                if not connections:
+                    self._stop_stream(stream_type)
         
         # Remove metadata
         if websocket in self.connection_metadata:
@@ -61,22 +69,50 @@ class WebSocketManager:
             self.disconnect(websocket)
     
     async def broadcast_to_stream(self, stream_type: str, data: Dict[str, Any]):
-        """Broadcast data to all clients in a stream"""
-        if stream_type not in self.connections:
+        """Queue data for all clients in a stream without waiting for delivery"""
+        if not self.connections.get(stream_type):
             return
         
-        disconnected_clients = []
+        queue = self._queues.get(stream_type)
+        if queue is None:
+            queue = self._queues[stream_type] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+            self._senders[stream_type] = asyncio.create_task(self._send_stream(stream_type, queue))
         
-        for websocket in self.connections[stream_type]:
-            try:
-                await websocket.send_text(json.dumps(data))
-            except Exception as e:
-                print(f"Error broadcasting to client: {str(e)}")
-                disconnected_clients.append(websocket)
+        if queue.full():
+            # Clients are behind: drop the oldest update
+            queue.get_nowait()
         
-        # Remove disconnected clients
-        for websocket in disconnected_clients:
-            self.disconnect(websocket)
+        # Serialize once for every subscriber
+        queue.put_nowait(json.dumps(data))
+    
+    async def _send_stream(self, stream_type: str, queue: asyncio.Queue):
+        """Send each queued message to every client in the stream concurrently"""
+        while True:
+            # One frame per message, as clients parse each frame on its own
+            payload = await queue.get()
+            clients = list(self.connections[stream_type])
+            results = await asyncio.gather(
+                *(websocket.send_text(payload) for websocket in clients),
+                return_exceptions=True
+            )
+            
+            # Remove disconnected clients
+            for websocket, result in zip(clients, results):
+                if isinstance(result, Exception):
+                    print(f"Error broadcasting to client: {str(result)}")
+                    self.disconnect(websocket)
+    
+    def _stop_stream(self, stream_type: str):
+        """Cancel a stream's sender and drop its backlog"""
+        task = self._senders.pop(stream_type, None)
+        if task is not None:
+            task.cancel()
+        self._queues.pop(stream_type, None)
+    
+    def close(self):
+        """Stop every stream sender (called on shutdown)"""
+        for stream_type in list(self._senders):
+            self._stop_stream(stream_type)
     
     async def broadcast_risk_stream(self, data: Dict[str, Any]):
         """Broadcast to risk stream"""
@@ -99,6 +135,10 @@ class WebSocketManager:
         for stream_type in self.connections:
             await self.broadcast_to_stream(stream_type, data)
     
+    async def broadcast(self, data: Dict[str, Any]):
+        """Broadcast to all clients (alias used by services)"""
+        await self.broadcast_general(data)
+    
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
         stats = {
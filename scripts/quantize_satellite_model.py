@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Satellite Model Quantizer - Convert the ViT ONNX export to int8
+"""
+
+import argparse
+import os
+
+def quantize_model(input_path="models/vit.onnx", output_path="models/vit.int8.onnx"):
+    """
+    Dynamically quantize model weights to int8 for CPU inference
+
+    Args:
+        input_path: Path to the fp32 ONNX export
+        output_path: Path to save the int8 model (SATELLITE_MODEL_PATH)
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+
+    print(f"✅ Quantized model saved: {output_path}")
+    print(f"   Size: {os.path.getsize(input_path) / 1e6:.1f} MB -> {os.path.getsize(output_path) / 1e6:.1f} MB")
+
+    return output_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", nargs="?", default="models/vit.onnx")
+    parser.add_argument("output", nargs="?", default="models/vit.int8.onnx")
+    args = parser.parse_args()
+    quantize_model(args.input, args.output)